@@ -0,0 +1,110 @@
+import random
+import textwrap
+
+from ludic_slides import Slide, SlideMain, Slides
+from ludic_slides.components import (
+    CodeBlock,
+    Header,
+    Item,
+    List,
+    Message,
+    Paragraph,
+    Quote,
+    Table,
+    TableHead,
+    TableRow,
+    Title,
+)
+
+WORDS = (
+    "ludic slides render component theme python browser stack header paragraph "
+    "table message quote list item code block style layout presentation deck"
+).split()
+
+
+def sentence(rng: random.Random, words: int = 12) -> str:
+    return " ".join(rng.choice(WORDS) for _ in range(words)).capitalize() + "."
+
+
+def code(rng: random.Random, lines: int) -> str:
+    body = "\n".join(
+        f"    value_{index} = {rng.choice(WORDS)!r} * {rng.randint(1, 100)}"
+        for index in range(lines)
+    )
+    return f"def generated_{rng.randint(0, 10**6)}() -> None:\n{body}\n"
+
+
+def generate_slide(rng: random.Random, index: int, code_lines: int) -> Slide:
+    header = Header(f"Slide {index}: {sentence(rng, 3)}")
+    match index % 5:
+        case 0:
+            return Slide(
+                header,
+                Paragraph(sentence(rng)),
+                CodeBlock(code(rng, code_lines), language="python"),
+            )
+        case 1:
+            return Slide(
+                header,
+                Table(
+                    TableHead("ID", "Name", "Value"),
+                    *(
+                        TableRow(str(row), rng.choice(WORDS), str(rng.random()))
+                        for row in range(8)
+                    ),
+                ),
+            )
+        case 2:
+            return Slide(
+                header,
+                List(*(Item(sentence(rng, 6)) for _ in range(5))),
+            )
+        case 3:
+            return Slide(
+                header,
+                Message(Title(sentence(rng, 2)), sentence(rng)),
+                Paragraph(sentence(rng)),
+            )
+        case _:
+            return Slide(header, Quote(sentence(rng, 20)))
+
+
+def generate_slides(count: int, code_lines: int = 10, seed: int = 0) -> Slides:
+    """Generate a synthetic deck.
+
+    Args:
+        count: Number of slides.
+        code_lines: Number of lines of each code block.
+        seed: Seed of the random generator, the same seed gives the same deck.
+
+    Returns:
+        The generated slides.
+    """
+    # reproducible content, not used for security
+    rng = random.Random(seed)  # noqa: S311
+    return Slides(
+        SlideMain(Header("Benchmark"), Paragraph(f"A deck with {count} slides")),
+        *(generate_slide(rng, index, code_lines) for index in range(1, count)),
+        title="Benchmark",
+    )
+
+
+def write_deck_file(path: str, count: int, code_lines: int = 10, seed: int = 0) -> None:
+    """Write a Python file defining a synthetic deck, to benchmark the CLI.
+
+    Args:
+        path: Path of the Python file.
+        count: Number of slides.
+        code_lines: Number of lines of each code block.
+        seed: Seed of the random generator.
+    """
+    with open(path, "w", encoding="utf-8") as f:
+        f.write(
+            textwrap.dedent(
+                f"""
+                from benchmarks.decks import generate_slides
+
+                slides = generate_slides({count}, {code_lines}, {seed})
+                """
+            )
+        )
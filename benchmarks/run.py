@@ -0,0 +1,312 @@
+"""Benchmarks of rendering synthetic decks.
+
+Each case runs in a fresh process, so the peak memory of one case does not
+affect the others. Results can be written to a JSON file and compared against
+a previous run:
+
+    python -m benchmarks.run --slides 1000 --output baseline.json
+    python -m benchmarks.run --slides 1000 --baseline baseline.json --threshold 10
+
+The benchmarks are not installed with the package, so ``-m`` only works from
+the root of the repository. From other directories, run the script by path,
+e.g. ``python path/to/benchmarks/run.py``.
+
+The memory case reports the bytes allocated per slide by the components of the
+deck, by the deck compacted with ``Slides.compact`` and at peak while rendering.
+"""
+
+import argparse
+import gc
+import json
+import multiprocessing
+import os
+import platform
+import resource
+import sys
+import tempfile
+import time
+import tracemalloc
+from collections.abc import Callable, Iterator
+from concurrent.futures import ProcessPoolExecutor
+from contextlib import contextmanager, redirect_stdout
+from typing import Any
+
+CASES = ("to_html", "cli", "memory")
+METRICS = ("wall_time", "peak_rss", "deck_bytes", "compact_bytes", "render_bytes")
+
+
+def peak_rss() -> int:
+    """Return the peak resident set size of the current process in bytes."""
+    usage = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    return usage if sys.platform == "darwin" else usage * 1024
+
+
+@contextmanager
+def bench_to_html(slides: int, code_lines: int) -> Iterator[Callable[[], int]]:
+    """Benchmark rendering a generated deck with ``Slides.to_html``.
+
+    Args:
+        slides: The number of slides.
+        code_lines: The number of lines of the code blocks.
+
+    Yields:
+        Function rendering the deck and returning the size of the HTML in bytes.
+    """
+    from benchmarks.decks import generate_slides
+
+    deck = generate_slides(slides, code_lines)
+
+    def run() -> int:
+        return len(deck.to_html().encode("utf-8"))
+
+    yield run
+
+
+@contextmanager
+def bench_cli(slides: int, code_lines: int) -> Iterator[Callable[[], int]]:
+    """Benchmark building a generated deck file like the command line interface.
+
+    The deck and its output are written to a temporary directory, which is
+    removed when the context is left.
+
+    Args:
+        slides: The number of slides.
+        code_lines: The number of lines of the code blocks.
+
+    Yields:
+        Function building the deck and returning the size of the output file.
+    """
+    from benchmarks.decks import write_deck_file
+    from ludic_slides.cli import locate_and_render_slides
+
+    with tempfile.TemporaryDirectory(prefix="ludic-slides-bench-") as directory:
+        input_file = os.path.join(directory, "deck.py")
+        output_file = os.path.join(directory, "deck.html")
+        write_deck_file(input_file, slides, code_lines)
+
+        def run() -> int:
+            locate_and_render_slides(input_file, "slides", output_file)
+            return os.path.getsize(output_file)
+
+        yield run
+
+
+def measure_memory(slides: int, code_lines: int) -> dict[str, Any]:
+    """Measure the memory held by a deck, intended to be called in a fresh process.
+
+    Imports and caches filled by the first render are warmed up before, and
+    the highlight cache is emptied after each render, so they are not counted.
+
+    Returns:
+        The bytes allocated per slide by the deck, by the compacted deck, and
+        at peak while rendering the deck.
+    """
+    from benchmarks.decks import generate_slides
+    from ludic_slides.highlight import HighlightCache, set_highlight_cache
+
+    # import the lexers and fill the theme caches outside of the measurements,
+    # the deck covers every kind of slide of the generated decks
+    generate_slides(6, code_lines).compact().to_html()
+    set_highlight_cache(HighlightCache())
+
+    gc.collect()
+    tracemalloc.start()
+    start = tracemalloc.get_traced_memory()[0]
+    deck = generate_slides(slides, code_lines)
+    gc.collect()
+    deck_bytes = tracemalloc.get_traced_memory()[0] - start
+
+    tracemalloc.reset_peak()
+    deck.to_html()
+    render_bytes = tracemalloc.get_traced_memory()[1] - start - deck_bytes
+    set_highlight_cache(HighlightCache())
+
+    compact = deck.compact()
+    del deck
+    set_highlight_cache(HighlightCache())
+    gc.collect()
+    compact_bytes = tracemalloc.get_traced_memory()[0] - start
+    tracemalloc.stop()
+    del compact
+
+    return {
+        "deck_bytes": deck_bytes / slides,
+        "compact_bytes": compact_bytes / slides,
+        "render_bytes": render_bytes / slides,
+        "peak_rss": peak_rss(),
+    }
+
+
+def run_case(case: str, slides: int, code_lines: int, repeat: int) -> dict[str, Any]:
+    """Run a benchmark case, intended to be called in a fresh process.
+
+    Every repetition starts with an empty highlight cache, so code blocks are
+    highlighted in each of them like in a fresh build.
+
+    Returns:
+        The measurements, the wall time is the best of all repetitions.
+    """
+    from ludic_slides.highlight import HighlightCache, set_highlight_cache
+
+    if case == "memory":
+        return measure_memory(slides, code_lines)
+
+    factory = {"to_html": bench_to_html, "cli": bench_cli}[case]
+
+    times = []
+    output_bytes = 0
+    with (
+        factory(slides, code_lines) as run,
+        open(os.devnull, "w") as devnull,
+        redirect_stdout(devnull),
+    ):
+        for _ in range(repeat):
+            set_highlight_cache(HighlightCache())
+            start = time.perf_counter()
+            output_bytes = run()
+            times.append(time.perf_counter() - start)
+
+    wall_time = min(times)
+    return {
+        "wall_time": wall_time,
+        "time_per_slide": wall_time / slides,
+        "peak_rss": peak_rss(),
+        "output_bytes": output_bytes,
+    }
+
+
+def run_benchmarks(
+    cases: list[str], slides: int, code_lines: int, repeat: int
+) -> dict[str, Any]:
+    """Run the given benchmark cases, each in a fresh process.
+
+    Returns:
+        The environment and parameters of the run and the results of each case.
+    """
+    from importlib.metadata import PackageNotFoundError, version
+
+    versions: dict[str, str | None] = {}
+    for package in ("ludic", "ludic-slides", "pygments"):
+        try:
+            versions[package] = version(package)
+        except PackageNotFoundError:
+            versions[package] = None
+
+    results = {}
+    context = multiprocessing.get_context("spawn")
+    for case in cases:
+        with ProcessPoolExecutor(max_workers=1, mp_context=context) as executor:
+            future = executor.submit(run_case, case, slides, code_lines, repeat)
+            results[case] = future.result()
+
+    return {
+        "python": platform.python_version(),
+        "versions": versions,
+        "slides": slides,
+        "code_lines": code_lines,
+        "repeat": repeat,
+        "results": results,
+    }
+
+
+def find_regressions(
+    report: dict[str, Any], baseline: dict[str, Any], threshold: float
+) -> list[str]:
+    """Compare a report to a baseline.
+
+    Args:
+        report: The current report.
+        baseline: The report to compare with.
+        threshold: Allowed slowdown (and memory growth) in percent.
+
+    Returns:
+        Descriptions of the regressions.
+    """
+    regressions = []
+    for case, result in report["results"].items():
+        if (previous := baseline.get("results", {}).get(case)) is None:
+            continue
+        for metric in METRICS:
+            if metric not in result or metric not in previous:
+                continue
+            limit = previous[metric] * (1 + threshold / 100)
+            if result[metric] > limit:
+                change = (result[metric] / previous[metric] - 1) * 100
+                regressions.append(f"{case}: {metric} increased by {change:.1f}%")
+    return regressions
+
+
+def format_report(report: dict[str, Any]) -> str:
+    """Format a report as a table.
+
+    Args:
+        report: The report returned by :func:`run_benchmarks`.
+
+    Returns:
+        One line per timed case, followed by the memory per slide if it was
+        measured.
+    """
+    lines = [f"{'case':<10}{'wall':>10}{'per slide':>12}{'peak RSS':>12}{'output':>12}"]
+    for case, result in report["results"].items():
+        if case == "memory":
+            continue
+        lines.append(
+            f"{case:<10}"
+            f"{result['wall_time']:>9.3f}s"
+            f"{result['time_per_slide'] * 1000:>10.3f}ms"
+            f"{result['peak_rss'] / 2**20:>10.1f}MB"
+            f"{result['output_bytes'] / 2**20:>10.2f}MB"
+        )
+    if (memory := report["results"].get("memory")) is not None:
+        lines.append(
+            f"memory per slide: {memory['deck_bytes'] / 1024:.1f}KB deck, "
+            f"{memory['compact_bytes'] / 1024:.1f}KB compacted, "
+            f"{memory['render_bytes'] / 1024:.1f}KB rendering"
+        )
+    return "\n".join(lines)
+
+
+def main(args: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description="Benchmark rendering of slides.")
+    parser.add_argument("--slides", type=int, default=1000)
+    parser.add_argument("--code-lines", type=int, default=10)
+    parser.add_argument("--repeat", type=int, default=3)
+    parser.add_argument("--case", action="append", choices=CASES)
+    parser.add_argument("--output", help="Write the results to a JSON file.")
+    parser.add_argument("--baseline", help="Compare the results to a JSON file.")
+    parser.add_argument(
+        "--threshold",
+        type=float,
+        default=10.0,
+        help="Allowed regression against the baseline in percent (default: 10).",
+    )
+    args_parsed = parser.parse_args(args)
+
+    report = run_benchmarks(
+        args_parsed.case or list(CASES),
+        args_parsed.slides,
+        args_parsed.code_lines,
+        args_parsed.repeat,
+    )
+    print(format_report(report))
+
+    if args_parsed.output:
+        with open(args_parsed.output, "w", encoding="utf-8") as f:
+            json.dump(report, f, indent=2)
+
+    if args_parsed.baseline:
+        with open(args_parsed.baseline, encoding="utf-8") as f:
+            baseline = json.load(f)
+        if regressions := find_regressions(report, baseline, args_parsed.threshold):
+            print("\n".join(["Regressions:", *regressions]))
+            return 1
+    return 0
+
+
+if __name__ == "__main__":
+    # the benchmarks import each other as the benchmarks package, which is only
+    # found from the root of the repository otherwise
+    root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+    if root not in sys.path:
+        sys.path.insert(0, root)
+    sys.exit(main())
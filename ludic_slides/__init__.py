@@ -1,12 +1,21 @@
-from ludic.styles.themes import set_default_theme
+from typing import TYPE_CHECKING, Any
 
-from .components import Slide, SlideMain, Slides
-from .themes import SlidesTheme
-
-set_default_theme(SlidesTheme())
+if TYPE_CHECKING:
+    from .components import Slide, SlideMain, Slides
 
 __all__ = (
     "Slide",
     "SlideMain",
     "Slides",
 )
+
+
+def __getattr__(name: str) -> Any:
+    # the components (and with them ludic and pygments) are imported only when
+    # needed, so the command line interface starts quickly; importing them also
+    # sets the slides theme as the default theme of ludic
+    if name in __all__:
+        from . import components
+
+        return getattr(components, name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
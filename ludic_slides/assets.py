@@ -0,0 +1,247 @@
+import base64
+import hashlib
+import json
+import mimetypes
+import os
+import re
+import shutil
+from collections.abc import Iterable, Iterator
+from html import unescape
+from pathlib import Path
+from urllib.parse import unquote, urlsplit
+
+__all__ = (
+    "AssetPipeline",
+    "iter_references",
+)
+
+_ATTRIBUTE_RE = re.compile(r"""(\s(?:src|poster)=)(["'])(.*?)\2""", re.IGNORECASE)
+_LINK_RE = re.compile(r"<link\b[^>]*>", re.IGNORECASE)
+_HREF_RE = re.compile(r"""(\shref=)(["'])(.*?)\2""", re.IGNORECASE)
+_URL_RE = re.compile(r"""(url\()\s*(["']?)(.*?)\2\s*(\))""", re.IGNORECASE)
+
+MANIFEST_NAME = ".manifest.json"
+
+
+def iter_references(html: str) -> Iterator[str]:
+    """Find the references to files in the given HTML.
+
+    The same references are found as those rewritten by :class:`AssetPipeline`:
+    ``src``, ``poster`` and ``<link href>`` attributes and CSS ``url()`` values.
+
+    Args:
+        html: HTML content, e.g. a rendered slideshow.
+
+    Yields:
+        str: The referenced URLs
+    """
+    for match in _ATTRIBUTE_RE.finditer(html):
+        yield match.group(3)
+    for link in _LINK_RE.finditer(html):
+        for match in _HREF_RE.finditer(link.group()):
+            yield match.group(3)
+    for match in _URL_RE.finditer(html):
+        yield match.group(3)
+
+
+class AssetPipeline:
+    """Collects static files referenced by slides into an assets directory.
+
+    Local files referenced by ``src``, ``poster`` and ``<link href>``
+    attributes and by CSS ``url()`` values are copied (or hard-linked) into
+    the assets directory under a name derived from their content, and the
+    references are rewritten. Identical files are stored only once. Files
+    whose modification time and size did not change since the last build are
+    not hashed or copied again. Optionally, small files are inlined as data
+    URIs instead.
+
+    Example usage:
+        pipeline = AssetPipeline("decks/", "site/")
+        html = pipeline.rewrite(html)
+        pipeline.save()
+    """
+
+    def __init__(
+        self,
+        source_dir: str | os.PathLike[str],
+        output_dir: str | os.PathLike[str],
+        assets_dir: str = "assets",
+        inline_limit: int = 0,
+        hardlink: bool = False,
+    ) -> None:
+        """Initialize the pipeline.
+
+        Args:
+            source_dir: Directory relative references are resolved against.
+            output_dir: Directory containing the output HTML file.
+            assets_dir: Name of the assets directory within the output directory.
+            inline_limit: Files up to this size in bytes are inlined as data URIs.
+            hardlink: Whether to hard-link files instead of copying them.
+        """
+        self.source_dir = Path(source_dir)
+        self._source_root = self.source_dir.resolve()
+        self.output_dir = Path(output_dir)
+        self.assets_dir = assets_dir
+        self.inline_limit = inline_limit
+        self.hardlink = hardlink
+        self.copied = 0
+        self._urls: dict[str, str] = {}
+        self._manifest: dict[str, dict[str, str | int]] = {}
+        try:
+            with open(self._manifest_path, encoding="utf-8") as f:
+                self._manifest = json.load(f)
+        except (OSError, ValueError):
+            pass
+
+    @property
+    def _manifest_path(self) -> Path:
+        return self.output_dir / self.assets_dir / MANIFEST_NAME
+
+    def _digest(self, path: Path) -> str:
+        stat = path.stat()
+        key = str(path)
+        entry = self._manifest.get(key)
+        if (
+            entry is not None
+            and entry["mtime"] == stat.st_mtime_ns
+            and entry["size"] == stat.st_size
+        ):
+            return str(entry["hash"])
+
+        digest = hashlib.sha256()
+        with open(path, "rb") as f:
+            while block := f.read(1024 * 1024):
+                digest.update(block)
+        hexdigest = digest.hexdigest()
+        self._manifest[key] = {
+            "mtime": stat.st_mtime_ns,
+            "size": stat.st_size,
+            "hash": hexdigest,
+        }
+        return hexdigest
+
+    def _store(self, path: Path) -> str:
+        if self.inline_limit and path.stat().st_size <= self.inline_limit:
+            mimetype = mimetypes.guess_type(path.name)[0] or "application/octet-stream"
+            data = base64.b64encode(path.read_bytes()).decode("ascii")
+            return f"data:{mimetype};base64,{data}"
+
+        name = f"{self._digest(path)[:16]}{path.suffix.lower()}"
+        target = self.output_dir / self.assets_dir / name
+        if not target.exists():
+            target.parent.mkdir(parents=True, exist_ok=True)
+            tmp_target = target.with_suffix(f".{os.getpid()}.tmp")
+            if self.hardlink:
+                try:
+                    os.link(path, tmp_target)
+                except OSError:
+                    shutil.copyfile(path, tmp_target)
+            else:
+                shutil.copyfile(path, tmp_target)
+            os.replace(tmp_target, target)
+            self.copied += 1
+        return f"{self.assets_dir}/{name}"
+
+    def resolve(self, url: str) -> str:
+        """Return the rewritten URL for the given reference.
+
+        Args:
+            url: The reference found in the slides.
+
+        Returns:
+            The URL of the stored asset, or the original URL if it does not
+            reference an existing file within the source directory.
+        """
+        if (cached := self._urls.get(url)) is not None:
+            return cached
+
+        parts = urlsplit(url)
+        if parts.scheme or parts.netloc or not parts.path or url.startswith("#"):
+            return url
+
+        path = (self.source_dir / unquote(unescape(parts.path))).resolve()
+        if not path.is_relative_to(self._source_root) or not path.is_file():
+            return url
+
+        resolved = self._store(path)
+        if parts.fragment and not resolved.startswith("data:"):
+            resolved = f"{resolved}#{parts.fragment}"
+        self._urls[url] = resolved
+        return resolved
+
+    def sources(self, html: str) -> set[Path]:
+        """Find the files in the source directory referenced by the given HTML.
+
+        References already rewritten by a previous build are mapped back to the
+        files they were collected from. Files inlined as data URIs are not
+        found.
+
+        Args:
+            html: HTML content, e.g. the output of a previous build.
+
+        Returns:
+            The referenced files.
+        """
+        collected: dict[str, str] = {}
+        for source, entry in self._manifest.items():
+            name = f"{str(entry['hash'])[:16]}{Path(source).suffix.lower()}"
+            collected[f"{self.assets_dir}/{name}"] = source
+        found: set[Path] = set()
+        for url in iter_references(html):
+            parts = urlsplit(url)
+            if parts.scheme or parts.netloc or not parts.path:
+                continue
+            if parts.path in collected:
+                path = Path(collected[parts.path])
+            else:
+                path = (self.source_dir / unquote(unescape(parts.path))).resolve()
+            if path.is_relative_to(self._source_root) and path.is_file():
+                found.add(path)
+        return found
+
+    def rewrite(self, html: str) -> str:
+        """Rewrite references to local files in the given HTML.
+
+        Args:
+            html: HTML content, e.g. a rendered slide.
+
+        Returns:
+            The HTML with rewritten references.
+        """
+
+        def attribute(match: re.Match[str]) -> str:
+            prefix, quote, url = match.groups()
+            return f"{prefix}{quote}{self.resolve(url)}{quote}"
+
+        def url(match: re.Match[str]) -> str:
+            prefix, quote, value, suffix = match.groups()
+            return f"{prefix}{quote}{self.resolve(value)}{quote}{suffix}"
+
+        def link(match: re.Match[str]) -> str:
+            return _HREF_RE.sub(attribute, match.group())
+
+        html = _ATTRIBUTE_RE.sub(attribute, html)
+        html = _LINK_RE.sub(link, html)
+        return _URL_RE.sub(url, html)
+
+    def rewrite_chunks(self, chunks: Iterable[str]) -> Iterator[str]:
+        """Rewrite references to local files in an HTML document rendered in chunks.
+
+        Args:
+            chunks: Chunks of the HTML document, e.g. from ``Slides.iter_html()``.
+
+        Yields:
+            str: Chunks with rewritten references
+        """
+        for chunk in chunks:
+            yield self.rewrite(chunk)
+
+    def save(self) -> None:
+        """Persist the hashes of processed files for subsequent builds."""
+        if not self._manifest:
+            return
+        self._manifest_path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = self._manifest_path.with_suffix(f".{os.getpid()}.tmp")
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            json.dump(self._manifest, f)
+        os.replace(tmp_path, self._manifest_path)
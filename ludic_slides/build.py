@@ -0,0 +1,304 @@
+import ast
+import hashlib
+import json
+import os
+import time
+from collections.abc import Iterable, Iterator
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import asdict, dataclass
+from pathlib import Path
+from typing import Any
+
+from .assets import AssetPipeline
+from .cache import RenderCache, get_render_cache, package_versions, set_render_cache
+from .cli import BuildOptions, SlidesError, build_slides, parse_input_file
+from .highlight import HighlightCache, set_highlight_cache
+from .loader import module_dependencies
+
+__all__ = (
+    "Deck",
+    "DeckResult",
+    "build_decks",
+    "discover_decks",
+)
+
+STATE_FILE = ".ludic-slides-build.json"
+
+
+@dataclass(frozen=True)
+class Deck:
+    """A presentation to build.
+
+    Attributes:
+        python_input_file: The path to the Python file.
+        slides_variable: The name of the variable containing the slides object.
+        output_file: The path to the output HTML file.
+    """
+
+    python_input_file: str
+    slides_variable: str
+    output_file: str
+
+
+@dataclass
+class DeckResult:
+    """The outcome of building a deck.
+
+    Attributes:
+        deck: The deck.
+        status: One of ``"built"``, ``"skipped"`` or ``"failed"``.
+        elapsed: Time spent building the deck in seconds.
+        error: The error message if the build failed.
+    """
+
+    deck: Deck
+    status: str
+    elapsed: float = 0.0
+    error: str | None = None
+
+
+def _assigned_names(tree: ast.Module) -> set[str]:
+    names: set[str] = set()
+    for node in tree.body:
+        if isinstance(node, ast.Assign):
+            targets = node.targets
+        elif isinstance(node, ast.AnnAssign | ast.AugAssign):
+            targets = [node.target]
+        else:
+            continue
+        names.update(target.id for target in targets if isinstance(target, ast.Name))
+    return names
+
+
+def _defines_variable(path: Path, variable: str) -> bool:
+    try:
+        tree = ast.parse(path.read_bytes(), filename=str(path))
+    except (OSError, SyntaxError, ValueError):
+        return False
+    return variable in _assigned_names(tree)
+
+
+def _iter_python_files(directory: Path, exclude: Path | None) -> Iterator[Path]:
+    for root, dirs, files in os.walk(directory):
+        dirs[:] = sorted(
+            name
+            for name in dirs
+            if not name.startswith((".", "_"))
+            and (exclude is None or Path(root, name).resolve() != exclude)
+        )
+        for name in sorted(files):
+            if name.endswith(".py") and not name.startswith("_"):
+                yield Path(root, name)
+
+
+def _output_file(path: Path, variable: str, root: Path, output_dir: Path) -> str:
+    name = path.stem if variable == "slides" else f"{path.stem}.{variable}"
+    return str(output_dir / path.parent.relative_to(root) / f"{name}.html")
+
+
+def discover_decks(paths: Iterable[str], output_dir: str) -> list[Deck]:
+    """Find the decks to build.
+
+    Directories are searched recursively for Python files defining a module
+    level ``slides`` variable, files whose name or any parent directory starts
+    with a dot or an underscore are ignored. Files can also be given directly,
+    optionally followed by a colon and a variable name (e.g. ``deck.py:talk``).
+
+    Args:
+        paths: Directories and files to build.
+        output_dir: The directory HTML files are written to, the directory
+            structure of the searched directories is preserved.
+
+    Returns:
+        The decks in a deterministic order.
+
+    Raises:
+        SlidesError: If two decks would be written to the same output file.
+    """
+    output = Path(output_dir)
+    decks: list[Deck] = []
+    for path in paths:
+        python_input_file, slides_variable = parse_input_file(path)
+        source = Path(python_input_file)
+        if source.is_dir():
+            for file in _iter_python_files(source, output.resolve()):
+                if _defines_variable(file, slides_variable):
+                    output_file = _output_file(file, slides_variable, source, output)
+                    decks.append(Deck(str(file), slides_variable, output_file))
+        else:
+            output_file = _output_file(source, slides_variable, source.parent, output)
+            decks.append(Deck(python_input_file, slides_variable, output_file))
+    return _unique_decks(decks)
+
+
+def _unique_decks(decks: list[Deck]) -> list[Deck]:
+    unique: dict[str, Deck] = {}
+    for deck in decks:
+        other = unique.setdefault(deck.output_file, deck)
+        if (Path(other.python_input_file).resolve(), other.slides_variable) != (
+            Path(deck.python_input_file).resolve(),
+            deck.slides_variable,
+        ):
+            raise SlidesError(
+                f"Error: Decks '{other.python_input_file}' and "
+                f"'{deck.python_input_file}' are both written to "
+                f"'{deck.output_file}'."
+            )
+    return list(unique.values())
+
+
+def _deck_digest(deck: Deck, options: BuildOptions, assets: list[str]) -> str:
+    digest = hashlib.sha256(package_versions().encode())
+    digest.update(json.dumps([asdict(deck), asdict(options)]).encode())
+    for path in module_dependencies(deck.python_input_file):
+        digest.update(str(path).encode())
+        digest.update(path.read_bytes())
+    for asset in assets:
+        # assets are compared by their modification time and size, like the
+        # asset pipeline does, instead of reading them
+        try:
+            stat = os.stat(asset)
+        except OSError:
+            digest.update(f"{asset}:missing".encode())
+        else:
+            digest.update(f"{asset}:{stat.st_mtime_ns}:{stat.st_size}".encode())
+    return digest.hexdigest()
+
+
+def _referenced_files(deck: Deck) -> list[str]:
+    output = Path(deck.output_file)
+    pages = sorted(output.glob("*.html")) if output.is_dir() else [output]
+    assets = AssetPipeline(
+        Path(deck.python_input_file).resolve().parent,
+        output if output.is_dir() else output.parent,
+    )
+    found: set[Path] = set()
+    for page in pages:
+        found |= assets.sources(page.read_text(encoding="utf-8"))
+    return sorted(map(str, found))
+
+
+def _build_deck(deck: Deck, options: BuildOptions) -> DeckResult:
+    start = time.perf_counter()
+    try:
+        os.makedirs(os.path.dirname(deck.output_file) or ".", exist_ok=True)
+        build_slides(
+            deck.python_input_file, deck.slides_variable, deck.output_file, options
+        )
+    except (SlidesError, OSError) as e:
+        return DeckResult(deck, "failed", time.perf_counter() - start, str(e))
+    return DeckResult(deck, "built", time.perf_counter() - start)
+
+
+def _init_worker(cache_dir: str | None) -> None:
+    set_render_cache(RenderCache(directory=cache_dir))
+    if cache_dir is not None:
+        highlight_dir = os.path.join(cache_dir, "highlight")
+        set_highlight_cache(HighlightCache(directory=highlight_dir))
+
+
+def _load_state(path: str) -> dict[str, Any]:
+    try:
+        with open(path, encoding="utf-8") as f:
+            state = json.load(f)
+    except (OSError, ValueError):
+        return {}
+    return state if isinstance(state, dict) else {}
+
+
+def _save_state(path: str, state: dict[str, Any]) -> None:
+    os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+    tmp_path = f"{path}.{os.getpid()}.tmp"
+    with open(tmp_path, "w", encoding="utf-8") as f:
+        json.dump(state, f, indent=2, sort_keys=True)
+    os.replace(tmp_path, path)
+
+
+def build_decks(
+    decks: list[Deck],
+    output_dir: str,
+    options: BuildOptions | None = None,
+    jobs: int = 1,
+    cache_dir: str | None = None,
+    force: bool = False,
+) -> Iterator[DeckResult]:
+    """Build many decks sharing the imported modules, theme and caches.
+
+    Decks are built one after another in the current process, or distributed
+    over a pool of worker processes, each building many decks with warm
+    caches. A deck is skipped if its output exists and neither its source,
+    the local modules it imports, the files its slides reference (e.g.
+    images), the build options nor the installed versions of ludic,
+    ludic-slides and pygments changed since it was built.
+
+    Args:
+        decks: The decks to build, e.g. from :func:`discover_decks`.
+        output_dir: The directory containing the state of previous builds.
+        options: Options controlling how the slides are rendered.
+        jobs: The number of processes building decks in parallel.
+        cache_dir: Optional directory where rendered slides and highlighted
+            code are persisted.
+        force: Whether to build all decks, even if they did not change.
+
+    Yields:
+        DeckResult: The outcome of each deck in the order they were built
+    """
+    options = options or BuildOptions()
+    state_file = os.path.join(output_dir, STATE_FILE)
+    state = _load_state(state_file)
+
+    pending: list[Deck] = []
+    for deck in decks:
+        previous = state.get(deck.output_file)
+        if not isinstance(previous, dict):
+            previous = {}
+        try:
+            digest = _deck_digest(deck, options, previous.get("assets", []))
+        except OSError as e:
+            yield DeckResult(deck, "failed", error=f"Error reading deck: {e}")
+            continue
+        if (
+            not force
+            and previous.get("digest") == digest
+            and os.path.exists(deck.output_file)
+        ):
+            yield DeckResult(deck, "skipped")
+        else:
+            pending.append(deck)
+
+    try:
+        results = _build_all(pending, options, jobs, cache_dir)
+        for deck, result in zip(pending, results, strict=True):
+            state.pop(deck.output_file, None)
+            if result.status == "built" and (entry := _deck_state(deck, options)):
+                state[deck.output_file] = entry
+            yield result
+    finally:
+        if pending:
+            _save_state(state_file, state)
+
+
+def _deck_state(deck: Deck, options: BuildOptions) -> dict[str, Any] | None:
+    try:
+        assets = _referenced_files(deck)
+        return {"digest": _deck_digest(deck, options, assets), "assets": assets}
+    except (OSError, UnicodeDecodeError):
+        return None
+
+
+def _build_all(
+    decks: list[Deck], options: BuildOptions, jobs: int, cache_dir: str | None
+) -> Iterator[DeckResult]:
+    if jobs <= 1 or len(decks) <= 1:
+        if get_render_cache() is None:
+            set_render_cache(RenderCache(directory=cache_dir))
+        for deck in decks:
+            yield _build_deck(deck, options)
+        return
+
+    with ProcessPoolExecutor(
+        max_workers=min(jobs, len(decks)),
+        initializer=_init_worker,
+        initargs=(cache_dir,),
+    ) as executor:
+        yield from executor.map(_build_deck, decks, [options] * len(decks))
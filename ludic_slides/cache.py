@@ -0,0 +1,306 @@
+import hashlib
+import inspect
+import os
+import weakref
+from collections import OrderedDict
+from importlib import metadata
+from pathlib import Path
+from types import CodeType
+from typing import Any
+
+from ludic.base import BaseElement
+from ludic.html import style
+from ludic.styles.themes import get_default_theme
+
+__all__ = (
+    "RenderCache",
+    "fingerprint",
+    "get_render_cache",
+    "package_versions",
+    "set_render_cache",
+)
+
+_class_tokens: weakref.WeakKeyDictionary[type, bytes] = weakref.WeakKeyDictionary()
+
+
+def package_versions() -> str:
+    """Describe the installed versions of the packages affecting rendered output.
+
+    Caches include the description in their keys, so entries written by
+    other versions of ludic, ludic-slides or pygments are not reused.
+
+    Returns:
+        The versions, e.g. ``ludic==0.5.5,ludic-slides==0.1.0,pygments==2.19.1``.
+    """
+    versions = []
+    for package in ("ludic", "ludic-slides", "pygments"):
+        try:
+            versions.append(f"{package}=={metadata.version(package)}")
+        except metadata.PackageNotFoundError:
+            versions.append(f"{package}==unknown")
+    return ",".join(versions)
+
+
+def _update_code_object(digest: "hashlib._Hash", code: CodeType) -> None:
+    digest.update(code.co_code)
+    digest.update(repr(code.co_names).encode())
+    for const in code.co_consts:
+        # nested functions, lambdas and comprehensions are code objects, their
+        # repr contains a memory address which differs between processes
+        if isinstance(const, CodeType):
+            digest.update(b"<code>")
+            _update_code_object(digest, const)
+        else:
+            digest.update(repr(const).encode())
+
+
+def _update_code(digest: "hashlib._Hash", function: Any) -> None:
+    code = getattr(inspect.unwrap(function), "__code__", None)
+    if code is not None:
+        _update_code_object(digest, code)
+
+
+def _class_token(cls: type) -> bytes:
+    """Identify a component class including its code, classes and styles.
+
+    Editing the ``render`` method, the ``classes`` or the ``styles`` of a
+    custom component in a deck must not hit stale cache entries, so the
+    bytecode of every ``render`` in the MRO, the classes and the styles (or
+    the code of the function computing them from the theme) are part of the
+    token.
+    """
+    if (token := _class_tokens.get(cls)) is None:
+        digest = hashlib.sha256(f"{cls.__module__}.{cls.__qualname__}".encode())
+        for base in cls.__mro__:
+            if (render := base.__dict__.get("render")) is not None:
+                _update_code(digest, render)
+        digest.update(repr(getattr(cls, "classes", None)).encode())
+        if isinstance(styles := getattr(cls, "styles", None), style):
+            styles = styles.children[0]
+        if callable(styles):
+            _update_code(digest, styles)
+        else:
+            digest.update(repr(styles).encode())
+        token = _class_tokens[cls] = digest.digest()
+    return token
+
+
+def _update_digest(digest: "hashlib._Hash", obj: Any) -> None:
+    if isinstance(obj, BaseElement):
+        digest.update(b"<")
+        digest.update(_class_token(type(obj)))
+        for key, value in sorted(obj.attrs.items()):
+            digest.update(f" {key}=".encode())
+            _update_digest(digest, value)
+        digest.update(b">")
+        for child in obj.children:
+            _update_digest(digest, child)
+        digest.update(b"</>")
+    elif isinstance(obj, dict):
+        digest.update(b"{")
+        for key, value in obj.items():
+            _update_digest(digest, key)
+            _update_digest(digest, value)
+        digest.update(b"}")
+    elif isinstance(obj, list | tuple):
+        digest.update(b"[")
+        for item in obj:
+            _update_digest(digest, item)
+        digest.update(b"]")
+    else:
+        value = str(obj).encode()
+        digest.update(f"{type(obj).__qualname__}:{len(value)}:".encode())
+        digest.update(value)
+
+
+def fingerprint(element: BaseElement) -> str:
+    """Compute a stable hash of a component tree.
+
+    The hash covers the types, attributes and children of all elements in the
+    tree, but not the rendered output, so it is cheap to compute.
+
+    Args:
+        element: The root element of the tree.
+
+    Returns:
+        Hexadecimal digest of the tree.
+    """
+    digest = hashlib.sha256()
+    _update_digest(digest, element)
+    return digest.hexdigest()
+
+
+class RenderCache:
+    """A bounded cache of rendered slide fragments.
+
+    Each entry maps a hash of a slide's component tree and the current theme to
+    the slide's rendered HTML. Entries are kept in memory and evicted in least
+    recently used order. If a directory is given, the entries are also
+    persisted to disk, so they can be reused by subsequent builds.
+
+    Example usage:
+        cache = RenderCache(directory=".ludic-slides-cache")
+        html = cache.render(slide)
+    """
+
+    def __init__(
+        self,
+        max_entries: int = 2048,
+        directory: str | os.PathLike[str] | None = None,
+    ) -> None:
+        """Initialize the cache.
+
+        Args:
+            max_entries: Maximum number of fragments kept in memory.
+            directory: Optional directory where fragments are persisted.
+        """
+        self.max_entries = max_entries
+        self.directory = Path(directory) if directory is not None else None
+        self.hits = 0
+        self.misses = 0
+        self._entries: OrderedDict[str, str] = OrderedDict()
+        self._namespace = package_versions().encode()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def key(self, element: BaseElement) -> str:
+        """Compute the cache key of the given element.
+
+        Args:
+            element: The element to compute the key for.
+
+        Returns:
+            The cache key.
+        """
+        digest = hashlib.sha256(self._namespace)
+        digest.update(repr(get_default_theme()).encode())
+        digest.update(fingerprint(element).encode())
+        return digest.hexdigest()
+
+    def _path(self, key: str) -> Path:
+        assert self.directory is not None
+        return self.directory / key[:2] / f"{key}.html"
+
+    def get(self, key: str) -> str | None:
+        """Return the fragment stored under the given key.
+
+        Args:
+            key: The cache key.
+
+        Returns:
+            The rendered fragment or None if the key is not cached.
+        """
+        if (html := self._entries.get(key)) is not None:
+            self._entries.move_to_end(key)
+            return html
+
+        if self.directory is not None:
+            path = self._path(key)
+            try:
+                html = path.read_text(encoding="utf-8")
+            except OSError:
+                return None
+            path.touch()
+            self._store(key, html)
+        return html
+
+    def set(self, key: str, html: str) -> None:
+        """Store a fragment under the given key.
+
+        Args:
+            key: The cache key.
+            html: The rendered fragment.
+        """
+        self._store(key, html)
+
+        if self.directory is not None:
+            path = self._path(key)
+            path.parent.mkdir(parents=True, exist_ok=True)
+            tmp_path = path.with_suffix(f".{os.getpid()}.tmp")
+            tmp_path.write_text(html, encoding="utf-8")
+            os.replace(tmp_path, path)
+
+    def _store(self, key: str, html: str) -> None:
+        self._entries[key] = html
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+
+    def render(self, element: BaseElement) -> str:
+        """Render the given element, reusing a cached fragment when possible.
+
+        Args:
+            element: The element to render.
+
+        Returns:
+            The rendered HTML.
+        """
+        key = self.key(element)
+        if (html := self.get(key)) is not None:
+            self.hits += 1
+            return html
+
+        self.misses += 1
+        html = element.to_html()
+        self.set(key, html)
+        return html
+
+    def clear(self) -> None:
+        """Remove all fragments from memory and from the cache directory."""
+        self._entries.clear()
+        if self.directory is not None:
+            for path in self.directory.glob("*/*.html"):
+                path.unlink(missing_ok=True)
+
+    def prune(self, max_bytes: int) -> int:
+        """Shrink the cache directory to the given size.
+
+        The least recently used fragments are removed first.
+
+        Args:
+            max_bytes: Maximum total size of the cache directory in bytes.
+
+        Returns:
+            The number of removed fragments.
+        """
+        if self.directory is None:
+            return 0
+
+        files = []
+        for path in self.directory.glob("*/*.html"):
+            stat = path.stat()
+            files.append((stat.st_mtime, stat.st_size, path))
+        files.sort()
+
+        total = sum(size for _, size, _ in files)
+        removed = 0
+        for _, size, path in files:
+            if total <= max_bytes:
+                break
+            path.unlink(missing_ok=True)
+            total -= size
+            removed += 1
+        return removed
+
+
+_render_cache: RenderCache | None = None
+
+
+def set_render_cache(cache: RenderCache | None) -> None:
+    """Set the cache used when rendering slides.
+
+    Args:
+        cache: The cache to use or None to disable caching.
+    """
+    global _render_cache
+    _render_cache = cache
+
+
+def get_render_cache() -> RenderCache | None:
+    """Return the cache used when rendering slides.
+
+    Returns:
+        The current cache or None if caching is disabled.
+    """
+    return _render_cache
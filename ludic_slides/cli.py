@@ -1,76 +1,584 @@
 import argparse
+import filecmp
 import os
 import sys
-from typing import Any
+import time
+from collections.abc import Callable, Iterable
+from dataclasses import dataclass, replace
+from pathlib import Path
+from typing import TYPE_CHECKING, Any
 
+from .loader import get_deck_loader
+from .profiling import RenderProfile, phase
 
-def locate_and_render_slides(
-    python_input_file: str,
-    slides_variable: str = "slides",
-    output_file: str = "slides.html",
-) -> None:
-    """Locates a 'slides' variable within a Python file and renders it to HTML.
+if TYPE_CHECKING:
+    from .watch import FileWatcher
+
+# Modules importing ludic (and with it pygments) are imported inside of the
+# functions which need them, so commands like --help start quickly.
+
+WRITE_BUFFER_SIZE = 1024 * 1024
+
+
+class SlidesError(Exception):
+    """Raised when slides cannot be loaded, rendered or written."""
+
+
+@dataclass
+class BuildOptions:
+    """Options controlling how slides are rendered to HTML.
+
+    Attributes:
+        jobs: The number of processes rendering the slides in parallel.
+        lazy: Whether the slides are lazy loaded in the browser.
+        minify_css: Whether to merge, deduplicate and minify the stylesheets
+            and remove rules which are not used by the slides.
+        css_file: Whether to write the stylesheet to a separate content
+            addressed file next to the output file (implies minify_css).
+        assets: Whether to ``"copy"`` or ``"link"`` files referenced by the
+            slides into an assets directory next to the output file.
+        inline_assets: Referenced files up to this size in bytes are inlined
+            as data URIs when assets are collected.
+        pages: Whether to export one HTML page per slide into the output
+            directory instead of writing a single HTML file.
+        compress: Names of the formats (see :mod:`ludic_slides.compress`)
+            used to write precompressed copies of the output files.
+        printable: Whether the slides are rendered for printing, with one
+            slide per page and without navigation.
+        manifest: Whether to write a manifest listing the title, content hash
+            and size of every slide (see :mod:`ludic_slides.manifest`).
+        presenter: Whether to write a presenter view with speaker notes next
+            to the output file (see :mod:`ludic_slides.presenter`).
+        search: Whether to embed an index of the words on the slides, so the
+            slides can be searched in the browser.
+        overflow: Whether to ``"warn"`` about slides estimated to overflow,
+            ``"fit"`` their content by scaling it down or raise an ``"error"``.
+    """
+
+    jobs: int = 1
+    lazy: bool = False
+    minify_css: bool = False
+    css_file: bool = False
+    assets: str | None = None
+    inline_assets: int = 0
+    pages: bool = False
+    compress: tuple[str, ...] = ()
+    printable: bool = False
+    manifest: bool = False
+    presenter: bool = False
+    search: bool = False
+    overflow: str | None = None
+
+
+def load_slides(python_input_file: str, slides_variable: str = "slides") -> Any:
+    """Loads a Python file and returns the slides object it defines.
 
     Args:
         python_input_file: The path to the Python file.
         slides_variable: The name of the variable containing the slides object.
-        output_file: The path to the output HTML file.
+
+    Returns:
+        The slides object.
+
+    Raises:
+        SlidesError: If the file or the variable cannot be loaded.
     """
     if not os.path.isfile(python_input_file):
-        print(f"Error: File '{python_input_file}' not found.")
-        sys.exit(1)
+        raise SlidesError(f"Error: File '{python_input_file}' not found.")
 
     try:
-        # Create a dictionary to hold locals, it will allow us to access variables in
-        # the loaded module
-        module_namespace: dict[str, Any] = {}
-        # Execute file in a namespace
-        with open(python_input_file, encoding="utf-8") as f:
-            exec(f.read(), {}, module_namespace)  # noqa
-
+        # Load the file as a module, its bytecode is cached and unchanged modules
+        # it imports are reused between builds
+        module_namespace = vars(get_deck_loader().load(python_input_file))
     except Exception as e:
-        print(f"Error loading file '{python_input_file}': {e}")
-        sys.exit(1)
+        raise SlidesError(f"Error loading file '{python_input_file}': {e}")
 
     if slides_variable not in module_namespace:
-        print(
+        raise SlidesError(
             f"Error: File '{python_input_file}' does not contain a variable "
             f"named '{slides_variable}'."
         )
-        sys.exit(1)
 
     slides_obj = module_namespace[slides_variable]
 
     if not callable(getattr(slides_obj, "to_html", None)):
-        print(
+        raise SlidesError(
             f"Error: Variable '{slides_variable}' within file '{python_input_file}' "
             f"does not have a 'to_html' method"
         )
-        sys.exit(1)
+    return slides_obj
+
+
+def write_atomic(output_file: str, chunks: Iterable[str]) -> bool:
+    """Writes chunks of content to a file so that readers never see a partial file.
+
+    The chunks are written one by one to a buffered temporary file in the same
+    directory which then replaces the output file. If the content did not
+    change, the output file is left untouched, keeping its modification time.
+
+    Args:
+        output_file: The path to the output file.
+        chunks: The content to write.
+
+    Returns:
+        Whether the output file changed.
+    """
+    tmp_file = f"{output_file}.{os.getpid()}.tmp"
+    try:
+        with open(tmp_file, "w", encoding="utf-8", buffering=WRITE_BUFFER_SIZE) as f:
+            f.writelines(chunks)
+        if os.path.isfile(output_file) and filecmp.cmp(
+            tmp_file, output_file, shallow=False
+        ):
+            return False
+        os.replace(tmp_file, output_file)
+        return True
+    finally:
+        if os.path.exists(tmp_file):
+            os.remove(tmp_file)
+
+
+def stylesheet_writer(output_file: str) -> Callable[[str], str]:
+    """Creates a function writing stylesheets next to the given output file.
+
+    Args:
+        output_file: The path to the output HTML file.
+
+    Returns:
+        A function writing a stylesheet to a content addressed file and
+        returning its path relative to the output file.
+    """
+    from .css import stylesheet_name
+
+    def write_stylesheet(css: str) -> str:
+        prefix = os.path.splitext(os.path.basename(output_file))[0]
+        name = stylesheet_name(css, prefix=prefix)
+        path = os.path.join(os.path.dirname(output_file), name)
+        if not os.path.exists(path):
+            write_atomic(path, [css])
+        return name
+
+    return write_stylesheet
+
+
+def compress_outputs(paths: Iterable[str], formats: tuple[str, ...]) -> None:
+    """Writes precompressed copies of output files next to them.
+
+    Args:
+        paths: The paths to the output files.
+        formats: Names of the compression formats, nothing is written if empty.
+    """
+    if formats:
+        from .compress import compress_file
+
+        for path in paths:
+            compress_file(path, formats)
+
+
+def manifest_path(output_file: str, pages: bool = False) -> str:
+    """Returns the path to the manifest of slides written to the given output.
+
+    Args:
+        output_file: The path to the output HTML file (or the output directory
+            when exporting pages).
+        pages: Whether the slides are exported as pages.
+
+    Returns:
+        The path to the manifest.
+    """
+    if pages:
+        return os.path.join(output_file, "manifest.json")
+    return f"{os.path.splitext(output_file)[0]}.manifest.json"
+
+
+def presenter_path(output_file: str) -> str:
+    """Returns the path to the presenter view of slides written to the given file.
+
+    Args:
+        output_file: The path to the output HTML file.
+
+    Returns:
+        The path to the presenter view.
+    """
+    return f"{os.path.splitext(output_file)[0]}.presenter.html"
+
+
+def write_slides(
+    slides_obj: Any,
+    python_input_file: str,
+    output_file: str,
+    options: BuildOptions,
+) -> None:
+    """Writes slides to a single HTML file.
+
+    Args:
+        slides_obj: The slides object.
+        python_input_file: The path to the Python file.
+        output_file: The path to the output HTML file.
+        options: Options controlling how the slides are rendered.
+    """
+    from .assets import AssetPipeline
+    from .css import optimize_stylesheets
+    from .manifest import SlideEntry, record_slides, write_manifest
+
+    if callable(getattr(slides_obj, "iter_html", None)):
+        chunks = slides_obj.iter_html(jobs=options.jobs)
+    else:
+        chunks = iter([slides_obj.to_html()])
+
+    if options.assets:
+        assets = AssetPipeline(
+            os.path.dirname(os.path.abspath(python_input_file)),
+            os.path.dirname(os.path.abspath(output_file)),
+            inline_limit=options.inline_assets,
+            hardlink=options.assets == "link",
+        )
+        chunks = assets.rewrite_chunks(chunks)
+
+    entries: list[SlideEntry] = []
+    if options.manifest:
+        chunks = record_slides(chunks, entries)
+
+    written = [output_file]
+    if options.css_file:
+        write_stylesheet = stylesheet_writer(output_file)
+
+        def external(css: str) -> str:
+            name = write_stylesheet(css)
+            written.append(os.path.join(os.path.dirname(output_file), name))
+            return name
+
+        chunks = optimize_stylesheets(chunks, external=external)
+    elif options.minify_css:
+        chunks = optimize_stylesheets(chunks)
+
+    write_atomic(output_file, chunks)
+    if options.assets:
+        assets.save()
+    if options.manifest:
+        write_manifest(manifest_path(output_file), entries)
+    if options.presenter and hasattr(slides_obj, "children"):
+        from .presenter import presenter_html
+
+        path = presenter_path(output_file)
+        write_atomic(path, [presenter_html(slides_obj, os.path.basename(output_file))])
+        written.append(path)
+    compress_outputs(written, options.compress)
+
+
+def export_slides(
+    slides_obj: Any,
+    python_input_file: str,
+    output_dir: str,
+    options: BuildOptions,
+) -> None:
+    """Exports slides as one HTML page per slide into a directory.
+
+    Args:
+        slides_obj: The slides object.
+        python_input_file: The path to the Python file.
+        output_dir: The path to the output directory.
+        options: Options controlling how the slides are rendered.
+
+    Raises:
+        SlidesError: If the slides object cannot be exported as pages.
+    """
+    from .assets import AssetPipeline
+    from .export import export_pages
+    from .manifest import SlideEntry, slide_entry, write_manifest
+
+    if not callable(getattr(slides_obj, "render_slides", None)):
+        raise SlidesError("Error: Only Slides objects can be exported as pages.")
+    if options.presenter:
+        raise SlidesError("Error: The presenter view cannot be used with pages.")
+
+    assets = None
+    if options.assets:
+        assets = AssetPipeline(
+            os.path.dirname(os.path.abspath(python_input_file)),
+            output_dir,
+            inline_limit=options.inline_assets,
+            hardlink=options.assets == "link",
+        )
+    entries: list[SlideEntry] = []
+
+    def record(fragment: str) -> None:
+        entries.append(slide_entry(len(entries) + 1, fragment))
+
+    export_pages(
+        slides_obj,
+        output_dir,
+        jobs=options.jobs,
+        rewrite=assets.rewrite if assets else None,
+        on_slide=record if options.manifest else None,
+    )
+    if assets:
+        assets.save()
+    if options.manifest:
+        write_manifest(manifest_path(output_dir, pages=True), entries)
+    compress_outputs(
+        (
+            os.path.join(output_dir, name)
+            for name in sorted(os.listdir(output_dir))
+            if name.endswith((".html", ".css", ".js"))
+        ),
+        options.compress,
+    )
+
+
+def write_pdf_file(
+    slides_obj: Any,
+    python_input_file: str,
+    output_file: str,
+    options: BuildOptions,
+) -> None:
+    """Writes slides to a PDF file with one slide per page.
+
+    Args:
+        slides_obj: The slides object.
+        python_input_file: The path to the Python file, relative links in the
+            slides are resolved against its directory.
+        output_file: The path to the output PDF file.
+        options: Options controlling how the slides are rendered.
+
+    Raises:
+        SlidesError: If the slides object cannot be printed or the ``pdf``
+            extra is not installed.
+    """
+    from .pdf import write_pdf
+
+    if not callable(getattr(slides_obj, "iter_html", None)):
+        raise SlidesError("Error: Only Slides objects can be exported as PDF.")
+
+    base_url = os.path.dirname(os.path.abspath(python_input_file)) + os.sep
     try:
-        html_content = slides_obj.to_html()
+        write_pdf(slides_obj, output_file, base_url=base_url, jobs=options.jobs)
+    except ImportError as e:
+        raise SlidesError(f"Error: {e}")
+
+
+def check_slides_overflow(slides: Any, python_input_file: str, mode: str) -> None:
+    """Reports slides whose content is estimated not to fit on them.
+
+    A warning is printed for every overflowing slide. In the ``"fit"`` mode the
+    slides are rendered with their content scaled down to fit.
+
+    Args:
+        slides: The slides object.
+        python_input_file: The path to the Python file defining the slides.
+        mode: One of ``"warn"``, ``"fit"`` or ``"error"``.
+
+    Raises:
+        SlidesError: If a slide overflows in the ``"error"`` mode.
+    """
+    from .layout import check_overflow
+
+    overflowing = [fit for fit in check_overflow(slides) if fit.overflows]
+    for fit in overflowing:
+        message = (
+            f"Slide {fit.index} ({fit.title}) of '{python_input_file}' overflows "
+            f"by {fit.ratio - 1:.0%}"
+        )
+        if mode == "fit":
+            message += f", scaled to {fit.scale:.0%}"
+        print(f"Warning: {message}", file=sys.stderr)
+
+    if mode == "error" and overflowing:
+        raise SlidesError(
+            f"Error: {len(overflowing)} slide(s) of '{python_input_file}' overflow"
+        )
+    if mode == "fit":
+        slides.attrs["autofit"] = True
+
+
+def build_slides(
+    python_input_file: str,
+    slides_variable: str = "slides",
+    output_file: str = "slides.html",
+    options: BuildOptions | None = None,
+) -> None:
+    """Loads slides from a Python file and writes them to an HTML file.
+
+    Args:
+        python_input_file: The path to the Python file.
+        slides_variable: The name of the variable containing the slides object.
+        output_file: The path to the output HTML file (or the output directory
+            when exporting pages).
+        options: Options controlling how the slides are rendered.
+
+    Raises:
+        SlidesError: If the slides cannot be loaded, rendered or written.
+    """
+    options = options or BuildOptions()
+    with phase("load"):
+        slides_obj = load_slides(python_input_file, slides_variable)
+    for attribute in ("lazy", "printable", "search", "presenter"):
+        if getattr(options, attribute):
+            slides_obj.attrs[attribute] = True
+    if options.overflow:
+        check_slides_overflow(slides_obj, python_input_file, options.overflow)
+
+    try:
+        with phase("write"):
+            if options.pages:
+                export_slides(slides_obj, python_input_file, output_file, options)
+            elif output_file.endswith(".pdf"):
+                write_pdf_file(slides_obj, python_input_file, output_file, options)
+            else:
+                write_slides(slides_obj, python_input_file, output_file, options)
+    except OSError as e:
+        raise SlidesError(f"Error writing to file '{output_file}': {e}")
+    except SlidesError:
+        raise
     except Exception as e:
-        print(
+        raise SlidesError(
             f"Error calling 'to_html' on variable '{slides_variable}' within "
             f"file '{python_input_file}': {e}"
         )
-        sys.exit(1)
+
+
+def locate_and_render_slides(
+    python_input_file: str,
+    slides_variable: str = "slides",
+    output_file: str = "slides.html",
+    options: BuildOptions | None = None,
+) -> None:
+    """Locates a 'slides' variable within a Python file and renders it to HTML.
+
+    Args:
+        python_input_file: The path to the Python file.
+        slides_variable: The name of the variable containing the slides object.
+        output_file: The path to the output HTML file.
+        options: Options controlling how the slides are rendered.
+    """
     try:
-        with open(output_file, "w", encoding="utf-8") as f:
-            f.write(html_content)
-        print(f"Slides rendered to: {output_file}")
-    except Exception as e:
-        print(f"Error writing to file '{output_file}': {e}")
+        build_slides(python_input_file, slides_variable, output_file, options)
+    except SlidesError as e:
+        print(e)
         sys.exit(1)
+    print(f"Slides rendered to: {output_file}")
 
 
-def create_parser() -> argparse.ArgumentParser:
-    """Creates an argument parser for the CLI.
+def watch_deck_files(watcher: "FileWatcher", python_input_file: str) -> None:
+    """Watches the given deck and the local modules it imported for changes.
+
+    Args:
+        watcher: The watcher to update.
+        python_input_file: The path to the Python file.
+    """
+    paths = {Path(python_input_file).resolve(), *get_deck_loader().files()}
+    if paths != watcher.paths:
+        watcher.update(paths)
+
+
+def watch_and_render_slides(
+    python_input_file: str,
+    slides_variable: str = "slides",
+    output_file: str = "slides.html",
+    options: BuildOptions | None = None,
+    interval: float = 0.1,
+) -> None:
+    """Renders slides to HTML every time the Python file changes.
+
+    The process stays alive between builds, so imports and caches are reused.
+    Unless a render cache is already configured, an in-memory one is used, so
+    only the slides that changed are rendered again. Errors are reported
+    without stopping the watcher.
+
+    Args:
+        python_input_file: The path to the Python file.
+        slides_variable: The name of the variable containing the slides object.
+        output_file: The path to the output HTML file.
+        options: Options controlling how the slides are rendered.
+        interval: Polling interval in seconds when inotify is not available.
+    """
+    from .cache import RenderCache, get_render_cache, set_render_cache
+    from .watch import FileWatcher
+
+    if get_render_cache() is None:
+        set_render_cache(RenderCache())
+
+    watcher = FileWatcher([python_input_file], interval=interval)
+    print(f"Watching '{python_input_file}' for changes, press Ctrl+C to stop.")
+    try:
+        while True:
+            start = time.perf_counter()
+            try:
+                build_slides(python_input_file, slides_variable, output_file, options)
+            except SlidesError as e:
+                print(e)
+            else:
+                elapsed = (time.perf_counter() - start) * 1000
+                print(f"Slides rendered to: {output_file} ({elapsed:.1f} ms)")
+            watch_deck_files(watcher, python_input_file)
+            watcher.wait()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        watcher.close()
+
+
+def profile_slides(
+    python_input_file: str,
+    slides_variable: str = "slides",
+    output_file: str = "slides.html",
+    options: BuildOptions | None = None,
+    profile_output: str | None = None,
+) -> None:
+    """Renders slides to HTML and reports where the time was spent.
+
+    Args:
+        python_input_file: The path to the Python file.
+        slides_variable: The name of the variable containing the slides object.
+        output_file: The path to the output HTML file.
+        options: Options controlling how the slides are rendered.
+        profile_output: Optional path to a Chrome trace (``.json``) or cProfile
+            statistics file.
+    """
+    chrome_trace = profile_output is not None and profile_output.endswith(".json")
+    cprofile = profile_output is not None and not chrome_trace
+    with RenderProfile(cprofile=cprofile) as profile:
+        locate_and_render_slides(
+            python_input_file, slides_variable, output_file, options
+        )
+    print(profile.report())
+
+    if profile_output is not None:
+        if chrome_trace:
+            profile.write_chrome_trace(profile_output)
+        else:
+            profile.write_stats(profile_output)
+        print(f"Profile written to: {profile_output}")
+
+
+def parse_input_file(input_file: str) -> tuple[str, str]:
+    """Splits the input file argument into the file path and the variable name.
+
+    Args:
+        input_file: The input file optionally followed by a colon and a variable name.
 
     Returns:
-        An argparse.ArgumentParser instance.
+        The path to the Python file and the name of the slides variable.
+    """
+    try:
+        if ":" not in input_file:
+            return input_file, "slides"
+        python_input_file, slides_variable = input_file.split(":", 1)
+        return python_input_file, slides_variable
+    except ValueError:
+        print(
+            "Error: Invalid format for input_file. Use 'path/to/file.py' or "
+            "path/to/file.py:slides_var'."
+        )
+        sys.exit(1)
+
+
+def add_input_file_argument(parser: argparse.ArgumentParser) -> None:
+    """Adds the positional input file argument to the given parser.
+
+    Args:
+        parser: The parser to add the argument to.
     """
-    parser = argparse.ArgumentParser(description="Render slides from a Python file.")
     parser.add_argument(
         "input_file",
         help=(
@@ -78,15 +586,473 @@ def create_parser() -> argparse.ArgumentParser:
             "by a colon (e.g., my_slides.py:slides)"
         ),
     )
+
+
+def add_cache_dir_argument(parser: argparse.ArgumentParser) -> None:
+    """Adds the cache directory argument to the given parser.
+
+    Args:
+        parser: The parser to add the argument to.
+    """
+    parser.add_argument(
+        "--cache-dir",
+        required=False,
+        help=(
+            "Optionally specify a directory where rendered slides and highlighted "
+            "code are cached, so unchanged slides and code are not rendered again "
+            "by subsequent builds."
+        ),
+    )
+
+
+def parse_compress_formats(value: str) -> tuple[str, ...]:
+    """Parses a comma separated list of compression formats.
+
+    Args:
+        value: The argument value, e.g. ``gzip,br``.
+
+    Returns:
+        The names of the formats.
+
+    Raises:
+        argparse.ArgumentTypeError: If a format is unknown or not available.
+    """
+    from .compress import FORMATS, available_formats
+
+    formats = tuple(name.strip() for name in value.split(",") if name.strip())
+    if unknown := [name for name in formats if name not in FORMATS]:
+        raise argparse.ArgumentTypeError(
+            f"unknown format {unknown[0]!r}, choose from {', '.join(FORMATS)}"
+        )
+    available = available_formats()
+    if missing := [name for name in formats if name not in available]:
+        raise argparse.ArgumentTypeError(
+            f"format {missing[0]!r} is not available, install ludic-slides[compress]"
+        )
+    return formats
+
+
+def add_build_option_arguments(parser: argparse.ArgumentParser) -> None:
+    """Adds arguments controlling how slides are rendered to the given parser.
+
+    Args:
+        parser: The parser to add the arguments to.
+    """
+    parser.add_argument(
+        "--lazy",
+        action="store_true",
+        help=(
+            "Insert slides into the page only when the presenter gets near them, "
+            "useful for very large presentations."
+        ),
+    )
+    parser.add_argument(
+        "--minify-css",
+        action="store_true",
+        help="Merge, deduplicate and minify styles, removing rules which are unused.",
+    )
+    parser.add_argument(
+        "--css-file",
+        action="store_true",
+        help=(
+            "Write minified styles to a separate file with a content hash in its "
+            "name next to the output file."
+        ),
+    )
+    parser.add_argument(
+        "--assets",
+        nargs="?",
+        const="copy",
+        choices=["copy", "link"],
+        help=(
+            "Copy (or hard-link) images and other files referenced by the slides "
+            "into an assets directory next to the output file."
+        ),
+    )
+    parser.add_argument(
+        "--pages",
+        action="store_true",
+        help=(
+            "Export one HTML page per slide with shared styles and scripts into "
+            "the output directory, plus an index of all slides."
+        ),
+    )
+    parser.add_argument(
+        "--print",
+        action="store_true",
+        dest="printable",
+        help=(
+            "Render the slides for printing, one slide per page and without "
+            "navigation. Output files ending with .pdf are always printed and "
+            "require the 'pdf' extra."
+        ),
+    )
+    parser.add_argument(
+        "--compress",
+        nargs="?",
+        const="gzip",
+        type=parse_compress_formats,
+        default=(),
+        metavar="FORMATS",
+        help=(
+            "Write precompressed copies of the output files next to them, a comma "
+            "separated list of gzip, br and zstd (default: gzip). Brotli and zstd "
+            "require the 'compress' extra."
+        ),
+    )
+    parser.add_argument(
+        "--manifest",
+        action="store_true",
+        help=(
+            "Write a JSON manifest listing the title, content hash and size of "
+            "every slide next to the output, see 'ludic-slides diff --help'."
+        ),
+    )
+    parser.add_argument(
+        "--presenter",
+        action="store_true",
+        help=(
+            "Write a presenter view with the current and next slide, speaker "
+            "notes and a timer next to the output file, it stays in sync with "
+            "the windows showing the slides."
+        ),
+    )
+    parser.add_argument(
+        "--search",
+        action="store_true",
+        help=(
+            "Embed an index of the words on the slides, pressing '/' in the "
+            "browser searches for slides."
+        ),
+    )
+    parser.add_argument(
+        "--overflow",
+        choices=["warn", "fit", "error"],
+        help=(
+            "Estimate whether the content of every slide fits on it and warn "
+            "about overflowing slides, scale their content down to fit, or fail."
+        ),
+    )
+    parser.add_argument(
+        "--inline-assets",
+        type=int,
+        default=0,
+        metavar="BYTES",
+        help="Inline referenced files up to the given size as data URIs.",
+    )
+
+
+def build_options_from_args(
+    args_parsed: argparse.Namespace, jobs: int = 1
+) -> BuildOptions:
+    """Creates build options from parsed command line arguments.
+
+    Args:
+        args_parsed: Arguments parsed by a parser with build option arguments.
+        jobs: The number of processes rendering the slides of a deck in parallel.
+
+    Returns:
+        The build options.
+    """
+    return BuildOptions(
+        jobs=jobs,
+        lazy=args_parsed.lazy,
+        minify_css=args_parsed.minify_css,
+        css_file=args_parsed.css_file,
+        assets=args_parsed.assets or ("copy" if args_parsed.inline_assets else None),
+        inline_assets=args_parsed.inline_assets,
+        pages=args_parsed.pages,
+        compress=args_parsed.compress,
+        printable=args_parsed.printable,
+        manifest=args_parsed.manifest,
+        presenter=args_parsed.presenter,
+        search=args_parsed.search,
+        overflow=args_parsed.overflow,
+    )
+
+
+def configure_caches(cache_dir: str | None) -> None:
+    """Persists rendered slides and highlighted code in the given directory.
+
+    Args:
+        cache_dir: The cache directory, nothing is configured if not given.
+    """
+    if cache_dir:
+        from .cache import RenderCache, set_render_cache
+        from .highlight import HighlightCache, set_highlight_cache
+
+        set_render_cache(RenderCache(directory=cache_dir))
+        set_highlight_cache(
+            HighlightCache(directory=os.path.join(cache_dir, "highlight"))
+        )
+
+
+def create_parser() -> argparse.ArgumentParser:
+    """Creates an argument parser for the CLI.
+
+    Returns:
+        An argparse.ArgumentParser instance.
+    """
+    parser = argparse.ArgumentParser(
+        description="Render slides from a Python file.",
+        epilog=(
+            "Run 'ludic-slides serve --help' to see how to serve the slides, "
+            "'ludic-slides build --help' to see how to build many decks at once "
+            "and 'ludic-slides diff --help' to see how to compare manifests."
+        ),
+    )
+    add_input_file_argument(parser)
     parser.add_argument(
         "-o",
         "--output-file",
         required=False,
-        help="Optionally specify name and path to the output file.",
+        help=(
+            "Optionally specify name and path to the output file, files ending "
+            "with .pdf are written as PDF."
+        ),
     )
+    add_cache_dir_argument(parser)
+    parser.add_argument(
+        "-w",
+        "--watch",
+        action="store_true",
+        help="Render the slides again every time the input file changes.",
+    )
+    parser.add_argument(
+        "-j",
+        "--jobs",
+        type=int,
+        default=1,
+        help="Number of processes rendering the slides in parallel (default: 1).",
+    )
+    parser.add_argument(
+        "--profile",
+        action="store_true",
+        help=(
+            "Report the slowest slides and the time spent in each phase of "
+            "rendering, the slides are rendered in a single process."
+        ),
+    )
+    parser.add_argument(
+        "--profile-output",
+        metavar="FILE",
+        help=(
+            "Write a Chrome trace of the rendering phases (if the file name ends "
+            "with .json) or cProfile statistics (otherwise) to the given file."
+        ),
+    )
+    add_build_option_arguments(parser)
+    return parser
+
+
+def create_serve_parser() -> argparse.ArgumentParser:
+    """Creates an argument parser for the serve command.
+
+    Returns:
+        An argparse.ArgumentParser instance.
+    """
+    parser = argparse.ArgumentParser(
+        prog="ludic-slides serve",
+        description="Serve slides from a Python file with live reload.",
+    )
+    add_input_file_argument(parser)
+    parser.add_argument(
+        "--host",
+        default="127.0.0.1",
+        help="The host to bind the server to (default: %(default)s).",
+    )
+    parser.add_argument(
+        "-p",
+        "--port",
+        type=int,
+        default=8000,
+        help="The port to bind the server to (default: %(default)s).",
+    )
+    return parser
+
+
+def serve(args: list[str]) -> None:
+    """Runs the serve command.
+
+    Args:
+        args: A list of command line arguments of the command.
+    """
+    from .server import SlidesServer
+
+    args_parsed = create_serve_parser().parse_args(args)
+    python_input_file, slides_variable = parse_input_file(args_parsed.input_file)
+
+    try:
+        server = SlidesServer(
+            python_input_file,
+            slides_variable,
+            host=args_parsed.host,
+            port=args_parsed.port,
+        )
+    except SlidesError as e:
+        print(e)
+        sys.exit(1)
+
+    print(f"Serving slides on {server.url}, press Ctrl+C to stop.")
+    with server:
+        try:
+            server.serve()
+        except KeyboardInterrupt:
+            pass
+
+
+def create_build_parser() -> argparse.ArgumentParser:
+    """Creates an argument parser for the build command.
+
+    Returns:
+        An argparse.ArgumentParser instance.
+    """
+    parser = argparse.ArgumentParser(
+        prog="ludic-slides build",
+        description=(
+            "Render many decks at once. Directories are searched for Python files "
+            "defining a 'slides' variable, decks which did not change since the "
+            "last build are skipped."
+        ),
+    )
+    parser.add_argument(
+        "paths",
+        nargs="+",
+        help=(
+            "Directories containing decks or Python files, optionally with a "
+            "variable name separated by a colon (e.g., my_slides.py:slides)"
+        ),
+    )
+    parser.add_argument(
+        "-o",
+        "--out",
+        default="site",
+        help="The directory the HTML files are written to (default: %(default)s).",
+    )
+    add_cache_dir_argument(parser)
+    parser.add_argument(
+        "-j",
+        "--jobs",
+        type=int,
+        default=1,
+        help="Number of processes building decks in parallel (default: 1).",
+    )
+    parser.add_argument(
+        "-f",
+        "--force",
+        action="store_true",
+        help="Build all decks, even those which did not change.",
+    )
+    add_build_option_arguments(parser)
     return parser
 
 
+def build(args: list[str]) -> None:
+    """Runs the build command.
+
+    Args:
+        args: A list of command line arguments of the command.
+    """
+    from .build import build_decks, discover_decks
+
+    args_parsed = create_build_parser().parse_args(args)
+    configure_caches(args_parsed.cache_dir)
+
+    options = build_options_from_args(args_parsed)
+    try:
+        decks = discover_decks(args_parsed.paths, args_parsed.out)
+    except SlidesError as e:
+        print(e)
+        sys.exit(1)
+    if options.pages:
+        decks = [
+            replace(deck, output_file=os.path.splitext(deck.output_file)[0])
+            for deck in decks
+        ]
+    if not decks:
+        print("Error: No decks found.")
+        sys.exit(1)
+
+    start = time.perf_counter()
+    counts = {"built": 0, "skipped": 0, "failed": 0}
+    for result in build_decks(
+        decks,
+        args_parsed.out,
+        options,
+        jobs=args_parsed.jobs,
+        cache_dir=args_parsed.cache_dir,
+        force=args_parsed.force,
+    ):
+        counts[result.status] += 1
+        deck = result.deck
+        if result.status == "skipped":
+            print(f"Skipped {deck.python_input_file} (unchanged)")
+        elif result.status == "failed":
+            print(result.error)
+        else:
+            elapsed = result.elapsed * 1000
+            print(
+                f"Rendered {deck.python_input_file} to {deck.output_file} "
+                f"({elapsed:.1f} ms)"
+            )
+
+    elapsed = time.perf_counter() - start
+    print(
+        f"Built {counts['built']}, skipped {counts['skipped']} and failed "
+        f"{counts['failed']} decks in {elapsed:.2f} s."
+    )
+    if counts["failed"]:
+        sys.exit(1)
+
+
+def create_diff_parser() -> argparse.ArgumentParser:
+    """Creates an argument parser for the diff command.
+
+    Returns:
+        An argparse.ArgumentParser instance.
+    """
+    parser = argparse.ArgumentParser(
+        prog="ludic-slides diff",
+        description=(
+            "Compare two manifests written with --manifest and report which "
+            "slides were added, removed, moved or changed."
+        ),
+    )
+    parser.add_argument("old", help="The manifest of the previous build.")
+    parser.add_argument("new", help="The manifest of the current build.")
+    parser.add_argument(
+        "--json",
+        action="store_true",
+        help="Print the differences as JSON, e.g. for deploy tooling.",
+    )
+    return parser
+
+
+def diff(args: list[str]) -> None:
+    """Runs the diff command.
+
+    Args:
+        args: A list of command line arguments of the command.
+    """
+    import json
+
+    from .manifest import diff_manifests, read_manifest
+
+    args_parsed = create_diff_parser().parse_args(args)
+    try:
+        old = read_manifest(args_parsed.old)
+        new = read_manifest(args_parsed.new)
+    except (OSError, ValueError, TypeError, KeyError) as e:
+        print(f"Error reading manifest: {e}")
+        sys.exit(1)
+
+    differences = diff_manifests(old, new)
+    if args_parsed.json:
+        print(json.dumps(differences.to_dict(), indent=2))
+    else:
+        print(differences.format())
+
+
 def main(args: list[str] | None = None) -> None:
     """Main function for the CLI.
 
@@ -96,26 +1062,38 @@ def main(args: list[str] | None = None) -> None:
     if args is None:
         args = sys.argv[1:]
 
+    commands = {"serve": serve, "build": build, "diff": diff}
+    if args and args[0] in commands:
+        commands[args[0]](args[1:])
+        return
+
     parser = create_parser()
     args_parsed = parser.parse_args(args)
+    python_input_file, slides_variable = parse_input_file(args_parsed.input_file)
 
-    try:
-        if ":" not in args_parsed.input_file:
-            python_input_file, slides_variable = args_parsed.input_file, "slides"
-        else:
-            python_input_file, slides_variable = args_parsed.input_file.split(":", 1)
-    except ValueError:
-        print(
-            "Error: Invalid format for input_file. Use 'path/to/file.py' or "
-            "path/to/file.py:slides_var'."
+    configure_caches(args_parsed.cache_dir)
+
+    options = build_options_from_args(args_parsed, jobs=args_parsed.jobs)
+    default_output = os.path.splitext(python_input_file)[0]
+    if not options.pages:
+        default_output = python_input_file.replace(".py", ".html")
+
+    output_file = args_parsed.output_file or default_output
+    if args_parsed.profile or args_parsed.profile_output:
+        if args_parsed.watch:
+            print("Error: Profiling cannot be combined with --watch.")
+            sys.exit(1)
+        profile_slides(
+            python_input_file,
+            slides_variable,
+            output_file,
+            options,
+            args_parsed.profile_output,
         )
-        sys.exit(1)
+        return
 
-    locate_and_render_slides(
-        python_input_file,
-        slides_variable,
-        args_parsed.output_file or python_input_file.replace(".py", ".html"),
-    )
+    render = watch_and_render_slides if args_parsed.watch else locate_and_render_slides
+    render(python_input_file, slides_variable, output_file, options)
 
 
 if __name__ == "__main__":
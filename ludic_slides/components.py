@@ -1,7 +1,11 @@
-from typing import override
+from collections.abc import Iterable, Iterator
+from typing import Any, TextIO, cast, override
+from uuid import uuid4
 
 from ludic import html
 from ludic.attrs import Attrs, GlobalAttrs, NoAttrs
+from ludic.base import BaseElement
+from ludic.catalog import typography
 from ludic.catalog.headers import H1 as Header
 from ludic.catalog.items import Key, Pairs, Value
 from ludic.catalog.layouts import Stack
@@ -17,13 +21,18 @@ from ludic.catalog.messages import (
 from ludic.catalog.pages import Body, Head, HtmlPage
 from ludic.catalog.quotes import Quote
 from ludic.catalog.tables import Table, TableHead, TableRow
-from ludic.catalog.typography import Code, CodeBlock, Link, Paragraph
+from ludic.catalog.typography import Code, Link, Paragraph
 from ludic.components import Component, ComponentStrict
+from ludic.format import format_element
 from ludic.html import div, meta, script, style
 from ludic.styles import types
-from ludic.types import ComplexChildren, JavaScript
+from ludic.types import AnyChildren, ComplexChildren, JavaScript, Safe
 
-from .themes import SlidesTheme
+from .cache import get_render_cache
+from .highlight import get_highlight_cache
+from .profiling import RenderProfile, get_profile, phase
+from .search import SearchIndex
+from .themes import SlidesTheme, get_slides_theme, themed_styles
 
 __all__ = (
     "Header",
@@ -35,6 +44,7 @@ __all__ = (
     "Code",
     "CodeBlock",
     "Paragraph",
+    "Notes",
     "Slide",
     "SlideMain",
     "Slides",
@@ -51,8 +61,57 @@ __all__ = (
     "MessageSuccess",
     "MessageWarning",
     "Quote",
+    "RenderedSlide",
 )
 
+
+class CodeBlock(typography.CodeBlock):
+    """A code block whose highlighted HTML is memoized across slides and builds.
+
+    Identical snippets with the same language and theme are highlighted by
+    pygments only once, see :class:`ludic_slides.highlight.HighlightCache`.
+    """
+
+    @override
+    def render(self) -> html.pre:
+        highlighted = get_highlight_cache().render(self, self._highlight)
+        return html.pre(Safe(highlighted), **self.attrs_for(html.pre))
+
+    def _highlight(self) -> str:
+        return "".join(map(format_element, super().render().children))
+
+
+class Notes(Component[AnyChildren, NoAttrs]):
+    """Speaker notes of a slide.
+
+    Notes can be added anywhere among the content of a slide. They are left out
+    of the slides shown to the audience and displayed in the presenter view
+    (see :mod:`ludic_slides.presenter`) instead.
+
+    Example usage:
+        Slide(
+            Header("Results"),
+            Paragraph("..."),
+            Notes("Mention the benchmark setup."),
+        )
+    """
+
+    classes = ["slide-notes"]
+
+    @override
+    def render(self) -> div:
+        """Render the notes.
+
+        Returns:
+            div: HTML div element containing the notes
+        """
+        return div(*self.children)
+
+
+def _without_notes(children: tuple[Any, ...]) -> list[Any]:
+    return [child for child in children if not isinstance(child, Notes)]
+
+
 type Content = (
     Code
     | CodeBlock
@@ -68,6 +127,7 @@ type Content = (
     | MessageSuccess
     | MessageWarning
     | Quote
+    | Notes
     | html.a
     | html.b
     | html.s
@@ -102,64 +162,79 @@ class BaseSlide(Component[ComplexChildren, GlobalAttrs]):
 
     classes = ["slide"]
     styles = style[SlidesTheme].use(
-        lambda theme: {
-            ".slide": {
-                "position": "absolute",
-                "inset": "0",
-                "margin": "auto",
-                "max-width": "100%",
-                "max-height": "100%",
-                "aspect-ratio": "/".join(map(str, theme.aspect_ratio)),
-            },
-            ".slide-content": {
-                "height": f"calc(100% - {theme.sizes.xxxl})",
-                "border-radius": theme.sizes.xs,
-                "background-color": theme.colors.white,
-                "box-shadow": (
-                    f"0 {theme.sizes.xs} {theme.sizes.s} {theme.colors.light.darken(3)}"
+        themed_styles(
+            lambda theme: {
+                ".slide": {
+                    "position": "absolute",
+                    "inset": "0",
+                    "margin": "auto",
+                    "max-width": "100%",
+                    "max-height": "100%",
+                    "aspect-ratio": "/".join(map(str, theme.aspect_ratio)),
+                },
+                ".slide-content": {
+                    "height": f"calc(100% - {theme.sizes.xxxl})",
+                    "border-radius": theme.sizes.xs,
+                    "background-color": theme.colors.white,
+                    "box-shadow": (
+                        f"0 {theme.sizes.xs} {theme.sizes.s} "
+                        f"{theme.colors.light.darken(3)}"
+                    ),
+                    "font-size": theme.fonts.size,
+                    "padding-inline": theme.sizes.xxxl,
+                    "padding-block": theme.sizes.xxl,
+                    "margin": theme.sizes.xl,
+                    "overflow": "hidden",
+                },
+                # zoom is not among the properties known to ludic
+                ".slide-content > *": cast(
+                    types.CSSProperties, {"zoom": "var(--slide-scale, 1)"}
                 ),
-                "font-size": theme.fonts.size,
-                "padding-inline": theme.sizes.xxxl,
-                "padding-block": theme.sizes.xxl,
-                "margin": theme.sizes.xl,
-                "overflow": "hidden",
-            },
-            ".slide .stack > * + *": {
-                "inline-size": "auto",
-            },
-            ".slide h1": {
-                "text-align": "center",
-            },
-            (".slide .code-block", ".slide .code-block *", ".slide .code"): {
-                "font-size": theme.fonts.size * 0.85,
-            },
-            (".slide .code-block", ".slide .code"): {
-                "border": f"{theme.borders.thin} solid {theme.colors.light.darken(1)}",
-                "border-radius": theme.sizes.xxs,
-            },
-            ".slide ul > li::marker": {
-                "font-size": theme.fonts.size,
-            },
-            ".slide li": {
-                "padding-inline-start": theme.sizes.xs,
-            },
-            (".slide ol", ".slide ul"): {
-                "margin-inline-start": theme.sizes.s,
-            },
-            (".slide ol > li + li", ".slide ul > li + li"): {
-                "margin-block-start": theme.sizes.m,
-            },
-        }
+                ".slide .stack > * + *": {
+                    "inline-size": "auto",
+                },
+                ".slide h1": {
+                    "text-align": "center",
+                },
+                (".slide .code-block", ".slide .code-block *", ".slide .code"): {
+                    "font-size": theme.fonts.size * 0.85,
+                },
+                (".slide .code-block", ".slide .code"): {
+                    "border": (
+                        f"{theme.borders.thin} solid {theme.colors.light.darken(1)}"
+                    ),
+                    "border-radius": theme.sizes.xxs,
+                },
+                ".slide ul > li::marker": {
+                    "font-size": theme.fonts.size,
+                },
+                ".slide li": {
+                    "padding-inline-start": theme.sizes.xs,
+                },
+                (".slide ol", ".slide ul"): {
+                    "margin-inline-start": theme.sizes.s,
+                },
+                (".slide ol > li + li", ".slide ul > li + li"): {
+                    "margin-block-start": theme.sizes.m,
+                },
+            }
+        )
     )
 
     @override
     def render(self) -> div:
         """Render the slide component.
 
+        The content is placed directly in the content box, which also gets the
+        attributes of the slide (e.g. the classes of its layout), so every
+        slide renders two nested elements.
+
         Returns:
             div: HTML div element containing the slide content
         """
-        return div(div(div(*self.children, **self.attrs), classes=["slide-content"]))
+        attrs = self.attrs.copy()
+        attrs["classes"] = ["slide-content", *self.attrs.get("classes", ())]
+        return div(div(*self.children, **attrs))
 
 
 class Slide(ComponentStrict[Header, *tuple[Content, ...], NoAttrs]):
@@ -180,17 +255,23 @@ class Slide(ComponentStrict[Header, *tuple[Content, ...], NoAttrs]):
     def render(self) -> BaseSlide:
         """Render a standard slide.
 
+        The content is stacked by the content box of the slide instead of a
+        nested ``Stack`` component and wrapper element, so rendering allocates
+        fewer elements.
+
         Returns:
             BaseSlide: Rendered slide with stacked content layout
         """
-        return BaseSlide(Stack(*self.children), classes=["slide-regular"])
+        return BaseSlide(
+            *_without_notes(self.children), classes=["slide-regular", "stack"]
+        )
 
 
-class SlideMain(ComponentStrict[Header, *tuple[Paragraph, ...], NoAttrs]):
+class SlideMain(ComponentStrict[Header, *tuple[Paragraph | Notes, ...], NoAttrs]):
     """A component used to create a main/title slide in a presentation.
 
     Creates a centered main slide typically used for section titles or
-    presentation starts. Only accepts paragraphs as content.
+    presentation starts. Only accepts paragraphs (and speaker notes) as content.
 
     Args:
         Header: The main slide's header component
@@ -208,7 +289,6 @@ class SlideMain(ComponentStrict[Header, *tuple[Paragraph, ...], NoAttrs]):
             "display": "flex",
             "align-items": "center",
             "justify-content": "center",
-            "height": "100%",
         },
     }
 
@@ -219,7 +299,7 @@ class SlideMain(ComponentStrict[Header, *tuple[Paragraph, ...], NoAttrs]):
         Returns:
             BaseSlide: Rendered main slide with centered content
         """
-        return BaseSlide(Stack(*self.children), classes=["slide-main"])
+        return BaseSlide(Stack(*_without_notes(self.children)), classes=["slide-main"])
 
 
 class SlidesAttrs(Attrs, total=False):
@@ -227,23 +307,139 @@ class SlidesAttrs(Attrs, total=False):
 
     Attributes:
         title: The title of the slideshow, displayed in the browser title
+        lazy: Whether slides are kept as inert templates and inserted into the
+            document only when the presenter gets near them, useful for very
+            large slideshows
+        printable: Whether the slideshow is rendered for printing, with one
+            slide per page and without the navigation script
+        search: Whether an index of the words on the slides is embedded, so
+            the presenter can search for slides by pressing ``/``
+        presenter: Whether the slideshow follows the presenter view (see
+            :mod:`ludic_slides.presenter`) and other windows showing it
+        autofit: Whether the content of slides estimated to overflow is scaled
+            down to fit, see :func:`ludic_slides.layout.check_overflow`
+    """
+
+    lazy: bool
+    printable: bool
+    search: bool
+    presenter: bool
+    autofit: bool
+
+
+# line of the navigation script replaced by the optional features
+_FEATURES_MARKER = "// features\n"
+
+# height of printed pages, the width follows from the aspect ratio of the theme
+PRINT_PAGE_HEIGHT = 7.5
+
+
+# one slide per printed page instead of the absolutely positioned slides
+@themed_styles
+def _print_styles(theme: SlidesTheme) -> types.GlobalStyles:
+    width, height = theme.aspect_ratio
+    page_width = round(PRINT_PAGE_HEIGHT * width / height, 3)
+    return {
+        # the paged media properties are not among the properties known to ludic
+        "@page": cast(
+            types.CSSProperties,
+            {
+                "size": f"{page_width:g}in {PRINT_PAGE_HEIGHT:g}in",
+                "margin": "0",
+            },
+        ),
+        ("html", "body"): {
+            "margin": "0",
+            "padding": "0",
+        },
+        ".slides": {
+            "min-height": "auto",
+        },
+        ".slide": cast(
+            types.CSSProperties,
+            {
+                "position": "relative",
+                "display": "block",
+                "width": f"{page_width:g}in",
+                "height": f"{PRINT_PAGE_HEIGHT:g}in",
+                "break-after": "page",
+                "break-inside": "avoid",
+                "overflow": "hidden",
+            },
+        ),
+        ".slide:last-child": cast(types.CSSProperties, {"break-after": "auto"}),
+        ".slide-content": {
+            "box-shadow": "none",
+        },
+    }
+
+
+# the search box, only included in searchable slideshows
+@themed_styles
+def _search_styles(theme: SlidesTheme) -> types.GlobalStyles:
+    return {
+        ".slides-search": {
+            "position": "fixed",
+            "top": theme.sizes.xxxxl,
+            "left": "50%",
+            "transform": "translateX(-50%)",
+            "z-index": "10",
+            "width": "min(90vw, 40em)",
+            "padding": theme.sizes.m,
+            "border-radius": theme.sizes.xs,
+            "background-color": theme.colors.white,
+            "box-shadow": f"0 {theme.sizes.xs} {theme.sizes.l} rgba(0,0,0,.3)",
+            "font-size": theme.fonts.size,
+        },
+        ".slides-search input": {
+            "box-sizing": "border-box",
+            "width": "100%",
+            "padding": theme.sizes.s,
+            "font-size": "inherit",
+        },
+        ".slides-search ol": {
+            "margin": "0",
+            "padding": "0",
+            "list-style": "none",
+        },
+        ".slides-search li": {
+            "padding": theme.sizes.s,
+            "cursor": "pointer",
+        },
+        ".slides-search li[aria-selected=true]": {
+            "background-color": theme.colors.light,
+        },
+    }
+
+
+class RenderedSlide(Safe):
+    """A slide rendered by :meth:`Slides.compact`.
+
+    Unlike other safe strings passed to :class:`Slides`, the HTML is final: it
+    is already wrapped in a template if the compacted slideshow is lazy loaded
+    and already scaled down if it overflows, so it is used as it is.
     """
 
 
-class Slides(Component[Slide | SlideMain, SlidesAttrs]):
+class Slides(Component[Slide | SlideMain | Safe, SlidesAttrs]):
     """A component rendering as an interactive slideshow.
 
     Creates a complete slideshow presentation with navigation controls and responsive
     layout. Supports keyboard navigation and click interactions.
 
     Args:
-        *children: Collection of Slide or SlideMain components
+        *children: Collection of Slide or SlideMain components (or already
+            rendered slides as safe strings)
         attrs: SlidesAttrs configuration including title
 
     Attributes:
         classes: CSS classes for the slideshow container
         styles: Theme-based styling for the slideshow
         javascript: Interactive navigation and control script
+        lazy_javascript: Part of the script lazy loading the slides
+        presenter_javascript: Part of the script keeping the slideshow in sync
+            with the presenter view
+        search_javascript: Part of the script searching the slides
 
     Example usage:
         Slides(
@@ -255,67 +451,184 @@ class Slides(Component[Slide | SlideMain, SlidesAttrs]):
 
     classes = ["slides"]
     styles = style[SlidesTheme].use(
-        lambda theme: {
-            ".slides": {
-                "background-color": theme.colors.light,
-                "min-height": types.Size(100, "vh"),
-                "position": "relative",
+        themed_styles(
+            lambda theme: {
+                ".slides": {
+                    "background-color": theme.colors.light,
+                    "min-height": types.Size(100, "vh"),
+                    "position": "relative",
+                },
             }
-        }
+        )
     )
     javascript = JavaScript(
         """
         document.addEventListener('DOMContentLoaded', () => {
-            const slides = document.querySelectorAll('.slide');
+            // the root element of the page has the class of the slideshow as well
+            const container = document.querySelector('div.slides');
+
+            if (!container) return;
 
-            if (!slides.length) return;
+            // Each entry holds the slide's node in the document, which is either
+            // the rendered slide or, when lazy loaded, the template of the slide
+            let entries = [];
+            let current = 0;
+
+            // The optional features (lazy loading, presenter view, search) are
+            // inserted below and hook into collecting and showing the slides,
+            // navigating to a slide and handling keys
+            const hooks = { collect: [], show: [], navigate: [] };
+            const keys = {};
+            let passive = false;
+
+            const collect = () => {
+                const previous = new Map(entries.map(entry => [entry.node, entry]));
+                entries = [...container.children]
+                    .filter(node => node.matches('.slide, template.slide-template'))
+                    .map(node => previous.get(node) ?? {
+                        node: node,
+                        template: node.tagName === 'TEMPLATE' ? node : null,
+                    });
+                for (const entry of entries) {
+                    if (entry.node !== entry.template) {
+                        entry.node.style.display = 'none';
+                    }
+                }
+                hooks.collect.forEach((hook) => hook());
+            };
 
             const getSlideNumberFromHash = () => {
                 const hash = window.location.hash.slice(1);
                 const n = parseInt(hash, 10);
-                return !isNaN(n) && n > 0 && n <= slides.length ? n : 1;
+                return !isNaN(n) && n > 0 && n <= entries.length ? n : 1;
+            };
+
+            // Images of the neighbouring slides are fetched and decoded while
+            // the browser is idle, so showing them does not block a frame
+            const prefetched = new Set();
+            const whenIdle = window.requestIdleCallback
+                ?? ((callback) => setTimeout(callback, 50));
+
+            const prefetch = (index) => {
+                const entry = entries[index];
+                if (!entry) return;
+                const root = entry.node === entry.template
+                    ? entry.template.content
+                    : entry.node;
+                for (const img of root.querySelectorAll('img[src]')) {
+                    const src = new URL(img.getAttribute('src'), document.baseURI).href;
+                    if (prefetched.has(src)) continue;
+                    prefetched.add(src);
+                    const image = new Image();
+                    image.decoding = 'async';
+                    image.src = src;
+                    image.decode().catch(() => {});
+                }
             };
 
             const showSlide = (n) => {
-                slides.forEach((slide, index) => {
-                    slide.style.display = index + 1 === n ? 'block' : 'none';
+                hooks.show.forEach((hook) => hook(n));
+                // Only the outgoing and the incoming slide are touched
+                if (entries[current - 1]?.node.matches('.slide')) {
+                    entries[current - 1].node.style.display = 'none';
+                }
+                entries[n - 1].node.style.display = 'block';
+                current = n;
+                whenIdle(() => {
+                    prefetch(n);
+                    prefetch(n - 2);
                 });
             };
 
+            const goToSlide = (n) => {
+                n = Math.min(Math.max(n, 1), entries.length);
+                if (n === current) return;
+                window.location.hash = `#${n}`;
+                showSlide(n);
+                hooks.navigate.forEach((hook) => hook(n));
+            };
+
             const navigateSlides = (direction) => {
-                const currentSlide = getSlideNumberFromHash();
-                const newSlide = currentSlide + direction;
+                const newSlide = current + direction;
 
-                if (newSlide >= 1 && newSlide <= slides.length) {
-                    window.location.hash = `#${newSlide}`;
-                    showSlide(newSlide);
+                if (newSlide >= 1 && newSlide <= entries.length) {
+                    goToSlide(newSlide);
+                    return;
                 }
+
+                // Slides exported as separate pages link to their neighbours
+                const rel = direction > 0 ? 'next' : 'prev';
+                const link = document.querySelector(`link[rel="${rel}"]`);
+                if (link) window.location.href = link.href;
             };
 
+            // features
+
             // Initialize the slides
+            collect();
+            if (!entries.length) return;
             showSlide(getSlideNumberFromHash());
 
+            // Allow other scripts (e.g. live reload) to refresh the slides
+            window.ludicSlides = {
+                refresh: () => {
+                    collect();
+                    current = 0;
+                    if (entries.length) showSlide(getSlideNumberFromHash());
+                },
+                goTo: goToSlide,
+            };
+
             // Listen for hash changes (e.g., user navigates directly to a slide)
             window.addEventListener('hashchange', () => {
-                showSlide(getSlideNumberFromHash());
+                const n = getSlideNumberFromHash();
+                if (n === current) return;
+                showSlide(n);
+                hooks.navigate.forEach((hook) => hook(n));
             });
 
-            // Keyboard navigation
+            // Keyboard navigation, typing a number followed by Enter jumps to
+            // the slide with that number, other keys are handled by the features
+            let typed = '';
+            let typedTimeout = null;
+
             document.addEventListener('keydown', (event) => {
-                if (event.key === 'ArrowRight') {
+                if (passive || event.altKey || event.ctrlKey || event.metaKey) return;
+                const editable = 'input, textarea, select, [contenteditable]';
+                if (event.target.closest?.(editable)) return;
+
+                if (/^[0-9]$/.test(event.key)) {
+                    typed += event.key;
+                    clearTimeout(typedTimeout);
+                    typedTimeout = setTimeout(() => { typed = ''; }, 1500);
+                    return;
+                }
+
+                if (event.key === 'ArrowRight' || event.key === 'PageDown') {
                     navigateSlides(1);
-                } else if (event.key === 'ArrowLeft') {
+                } else if (event.key === 'ArrowLeft' || event.key === 'PageUp') {
                     navigateSlides(-1);
+                } else if (event.key === 'Home') {
+                    goToSlide(1);
+                } else if (event.key === 'End') {
+                    goToSlide(entries.length);
+                } else if (event.key === 'Enter' && typed) {
+                    goToSlide(parseInt(typed, 10));
+                } else if (!keys[event.key]?.()) {
+                    return;
                 }
+                typed = '';
+                event.preventDefault();
             });
 
             document.addEventListener('click', (event) => {
+                if (passive) return;
                 const viewportWidth = window.innerWidth;
-                const clickedElement = event.target;
 
-                // Check if click is outside any .slide element
-                const isOutsideSlide = ![...slides].some(
-                    slide => slide.contains(clickedElement));
+                // Check if click is outside any .slide element or link
+                const isOutsideSlide = !event.target.closest(
+                    '.slide, a, .slides-search'
+                );
 
                 if (isOutsideSlide) {
                     if (event.clientX > viewportWidth / 2) {
@@ -328,25 +641,432 @@ class Slides(Component[Slide | SlideMain, SlidesAttrs]):
         });
         """
     )
+    lazy_javascript = JavaScript(
+        """
+            // Lazy loading, only the slides around the current one are kept in
+            // the document, the others stay inert templates
+            const LAZY_WINDOW = 2;
+            const inflated = new Set();
+
+            const inflate = (index) => {
+                const entry = entries[index];
+                if (!entry || entry.node !== entry.template) return;
+                const slide = entry.template.content.firstElementChild.cloneNode(true);
+                slide.style.display = 'none';
+                entry.template.replaceWith(slide);
+                entry.node = slide;
+                inflated.add(index);
+            };
+
+            const deflate = (index) => {
+                const entry = entries[index];
+                entry.node.replaceWith(entry.template);
+                entry.node = entry.template;
+                inflated.delete(index);
+            };
+
+
+            hooks.collect.push(() => {
+                inflated.clear();
+                entries.forEach((entry, index) => {
+                    if (entry.template && entry.node !== entry.template) {
+                        inflated.add(index);
+                    }
+                });
+            });
+
+            hooks.show.push((n) => {
+                for (let offset = -LAZY_WINDOW; offset <= LAZY_WINDOW; offset++) {
+                    inflate(n - 1 + offset);
+                }
+                for (const index of inflated) {
+                    if (Math.abs(index - (n - 1)) > LAZY_WINDOW) deflate(index);
+                }
+            });
+        """
+    )
+    presenter_javascript = JavaScript(
+        """
+            // Windows showing the same slides (e.g. the presenter view) are kept
+            // in sync by messages, previews embedded in the presenter view only
+            // follow the messages of their parent
+            const preview = new URLSearchParams(window.location.search).has('preview');
+            const channel = !preview && 'BroadcastChannel' in window
+                ? new BroadcastChannel(`ludic-slides:${window.location.pathname}`)
+                : null;
+            passive = preview;
+
+            hooks.navigate.push((n) => {
+                if (preview) return;
+                const message = { type: 'ludic-slides', slide: n };
+                channel?.postMessage(message);
+                // windows of slides opened from files do not share a channel
+                window.opener?.postMessage(message, '*');
+            });
+
+            const receive = (message) => {
+                if (message?.type !== 'ludic-slides') return;
+                const n = Math.min(Math.max(message.slide, 1), entries.length);
+                if (n === current) return;
+                history.replaceState(null, '', `#${n}`);
+                showSlide(n);
+            };
+
+            channel?.addEventListener('message', (event) => receive(event.data));
+            window.addEventListener('message', (event) => receive(event.data));
+        """
+    )
+    search_javascript = JavaScript(
+        """
+            // Search for slides by their words, the index is built when the
+            // slides are rendered and parsed on first use. Words are matched by
+            // prefix with a binary search over the sorted words, a slash opens
+            // the search
+            let search = null;
+            let overlay = null;
+
+            const loadSearch = () => {
+                const data = document.getElementById('slides-search-index');
+                if (!search && data) {
+                    const { titles, words } = JSON.parse(data.textContent);
+                    search = {
+                        titles,
+                        words,
+                        sorted: Object.keys(words).sort(),
+                        decoded: new Map(),
+                    };
+                }
+                return search;
+            };
+
+            const slidesWith = (word) => {
+                let numbers = search.decoded.get(word);
+                if (!numbers) {
+                    let number = 0;
+                    numbers = search.words[word].map((delta) => (number += delta));
+                    search.decoded.set(word, numbers);
+                }
+                return numbers;
+            };
+
+            const slidesMatching = (term) => {
+                const { sorted } = search;
+                let low = 0;
+                let high = sorted.length;
+                while (low < high) {
+                    const middle = (low + high) >> 1;
+                    if (sorted[middle] < term) low = middle + 1;
+                    else high = middle;
+                }
+                const found = new Set();
+                for (let i = low; sorted[i]?.startsWith(term); i++) {
+                    for (const number of slidesWith(sorted[i])) found.add(number);
+                }
+                return found;
+            };
+
+            const searchSlides = (query) => {
+                const terms = query.normalize('NFKD').replace(/\\p{M}/gu, '')
+                    .toLowerCase().match(/[\\p{L}\\p{N}_]+/gu) ?? [];
+                let result = null;
+                for (const term of terms) {
+                    const found = slidesMatching(term);
+                    result = result ? result.filter((n) => found.has(n)) : [...found];
+                    if (!result.length) break;
+                }
+                return (result ?? []).sort((a, b) => a - b);
+            };
+
+            const closeSearch = () => {
+                if (overlay) overlay.hidden = true;
+            };
+
+            const openSearch = () => {
+                if (!loadSearch()) return;
+                if (!overlay) {
+                    overlay = document.createElement('div');
+                    overlay.className = 'slides-search';
+                    const input = document.createElement('input');
+                    input.type = 'search';
+                    input.placeholder = 'Search slides';
+                    const list = document.createElement('ol');
+                    overlay.append(input, list);
+                    document.body.append(overlay);
+
+                    let results = [];
+                    let selected = 0;
+                    const renderResults = () => {
+                        list.replaceChildren(...results.slice(0, 10).map((n, i) => {
+                            const item = document.createElement('li');
+                            item.textContent = `${n}. ${search.titles[n - 1]}`;
+                            item.setAttribute('aria-selected', i === selected);
+                            item.addEventListener('click', () => {
+                                closeSearch();
+                                goToSlide(n);
+                            });
+                            return item;
+                        }));
+                    };
+                    input.addEventListener('input', () => {
+                        results = searchSlides(input.value);
+                        selected = 0;
+                        renderResults();
+                    });
+                    input.addEventListener('keydown', (event) => {
+                        const shown = Math.min(results.length, 10);
+                        if (event.key === 'Escape') {
+                            closeSearch();
+                        } else if (event.key === 'Enter' && shown) {
+                            closeSearch();
+                            goToSlide(results[selected]);
+                        } else if (event.key === 'ArrowDown' && shown) {
+                            selected = (selected + 1) % shown;
+                            renderResults();
+                        } else if (event.key === 'ArrowUp' && shown) {
+                            selected = (selected + shown - 1) % shown;
+                            renderResults();
+                        } else {
+                            return;
+                        }
+                        event.preventDefault();
+                    });
+                }
+                overlay.hidden = false;
+                overlay.querySelector('input').select();
+                overlay.querySelector('input').focus();
+            };
+
+            keys['/'] = () => {
+                if (!loadSearch()) return false;
+                openSearch();
+                return true;
+            };
+        """
+    )
+
+    def render_slides(self, jobs: int = 1) -> Iterator[str]:
+        """Render the individual slides of the slideshow.
+
+        Uses the render cache (see :func:`ludic_slides.cache.set_render_cache`)
+        if one is configured, so unchanged slides are not rendered again.
+        Children which are already rendered (safe strings) are passed through.
+        Slides of lazy loaded slideshows, including the rendered ones, are
+        wrapped in templates, unless the slideshow is rendered for printing.
+        Slides compacted by :meth:`compact` (:class:`RenderedSlide`) are used
+        as they are. The content of overflowing slides
+        is scaled down if the ``autofit`` attribute is set.
+
+        Args:
+            jobs: Number of worker processes rendering the slides in parallel
+
+        Yields:
+            str: Rendered HTML of each slide in order
+        """
+        if jobs > 1 and get_profile() is None:
+            from .parallel import render_parallel
+
+            fragments = render_parallel(self.children, jobs, self._render_serial)
+        else:
+            fragments = self._render_serial()
+
+        if self.attrs.get("autofit"):
+            fragments = self._fit_fragments(fragments)
+
+        lazy = self.attrs.get("lazy", False) and not self.attrs.get("printable")
+        for slide, fragment in zip(self.children, fragments, strict=True):
+            if lazy and not isinstance(slide, RenderedSlide):
+                yield f'<template class="slide-template">{fragment}</template>'
+            else:
+                yield fragment
+
+    def _fit_fragments(self, fragments: Iterable[str]) -> Iterator[str]:
+        from .layout import check_overflow, scale_fragment
+
+        scales = {fit.index: fit.scale for fit in check_overflow(self)}
+        for index, fragment in enumerate(fragments, start=1):
+            yield scale_fragment(fragment, scales.get(index, 1.0))
+
+    def _render_serial(self, start: int = 0) -> Iterator[str]:
+        if (profile := get_profile()) is not None:
+            yield from self._render_profiled(profile)
+            return
+
+        cache = get_render_cache()
+        for slide in self.children[start:]:
+            if isinstance(slide, Safe):
+                yield slide
+            elif cache is not None:
+                yield cache.render(slide)
+            else:
+                yield slide.to_html()
+
+    def _render_profiled(self, profile: RenderProfile) -> Iterator[str]:
+        from .export import slide_title
+
+        cache = get_render_cache()
+        for index, slide in enumerate(self.children, start=1):
+            if isinstance(slide, Safe):
+                yield slide
+                continue
+            with profile.slide(index) as record:
+                if cache is not None:
+                    html = cache.render(slide)
+                else:
+                    html = slide.to_html()
+                record.size = len(html.encode("utf-8"))
+                record.title = slide_title(html, index)
+            yield html
+
+    def iter_html(self, jobs: int = 1) -> Iterator[str]:
+        """Render the slideshow as a sequence of HTML chunks.
+
+        Yields the page up to the slides, then each slide, then the rest of the
+        page. Joining the chunks gives the same document as :meth:`to_html`,
+        but only one slide is held in memory at a time.
+
+        Args:
+            jobs: Number of worker processes rendering the slides in parallel
+
+        Yields:
+            str: Chunks of the HTML document
+        """
+        marker = RenderedSlide(f"<!--{uuid4().hex}-->")
+        shell = type(self)(marker, **self.attrs)
+        with phase("styles"):
+            head, tail = shell.to_html().split(marker, 1)
+        yield head
+
+        if not self._has_search():
+            yield from self.render_slides(jobs=jobs)
+            yield tail
+            return
+
+        # the index is built while the slides are rendered and replaces the
+        # index of the marker, which render() embedded at the end of the page
+        shell_index = SearchIndex()
+        shell_index.add(marker)
+        index = SearchIndex()
+        for fragment in self.render_slides(jobs=jobs):
+            index.add(fragment)
+            yield fragment
+        yield tail.replace(shell_index.script(), index.script(), 1)
+
+    def _has_search(self) -> bool:
+        return bool(self.attrs.get("search") and not self.attrs.get("printable"))
+
+    def _javascript(self) -> JavaScript:
+        features = (
+            (self.attrs.get("lazy", False), self.lazy_javascript),
+            (self.attrs.get("presenter", False), self.presenter_javascript),
+            (self._has_search(), self.search_javascript),
+        )
+        code = self.javascript.replace(
+            _FEATURES_MARKER,
+            "".join(f"{feature}\n" for enabled, feature in features if enabled),
+            1,
+        )
+        # indentation and comments are left out, the line breaks are kept so
+        # the semantics of the script do not change
+        lines = (line.strip() for line in code.splitlines())
+        return JavaScript(
+            "\n".join(line for line in lines if line and not line.startswith("//"))
+        )
+
+    def write_to(self, f: TextIO, jobs: int = 1) -> int:
+        """Write the slideshow to a file object chunk by chunk.
+
+        Args:
+            f: A text file object opened for writing
+            jobs: Number of worker processes rendering the slides in parallel
+
+        Returns:
+            int: Number of characters written
+        """
+        written = 0
+        for chunk in self.iter_html(jobs=jobs):
+            written += f.write(chunk)
+        return written
+
+    def compact(self, jobs: int = 1) -> "Slides":
+        """Return a copy of the slideshow with every slide already rendered.
+
+        The slides are replaced by their HTML (:class:`RenderedSlide`), so the
+        components of the slides and all of their content can be freed.
+        Generated decks with many slides otherwise keep every component alive
+        until they are written. Lazy loading and the scaling of overflowing
+        slides are applied before, so the compacted slideshow renders the
+        same HTML.
+
+        Example usage:
+            slides = generate_slides().compact()
+
+        Args:
+            jobs: Number of worker processes rendering the slides in parallel
+
+        Returns:
+            Slides: The compacted slideshow, rendering the same HTML
+        """
+        return type(self)(
+            *map(RenderedSlide, self.render_slides(jobs=jobs)), **self.attrs
+        )
+
+    def profile(self, cprofile: bool = False) -> RenderProfile:
+        """Render the slideshow and measure where the time is spent.
+
+        Example usage:
+            print(slides.profile().report())
+
+        Args:
+            cprofile: Whether to also collect function level statistics.
+
+        Returns:
+            RenderProfile: Timings of every slide and of the rendering phases
+        """
+        with RenderProfile(cprofile=cprofile) as profile:
+            chunks = self.iter_html()
+            with phase("write"):
+                for _ in chunks:
+                    pass
+        return profile
 
     @override
     def render(self) -> HtmlPage:
         """Render the complete slideshow.
 
         Generates a full HTML page with slideshow content, navigation
-        controls, and required metadata.
+        controls, and required metadata. Printable slideshows get styles with
+        one slide per page instead of the navigation controls. The scripts and
+        styles of lazy loading, the presenter view and the search are only
+        included if the slideshow uses them.
 
         Returns:
             HtmlPage: Complete HTML document with slideshow
         """
+        fragments = list(self.render_slides())
+        if self.attrs.get("printable"):
+            extra_head: tuple[BaseElement, ...] = (
+                style(_print_styles(get_slides_theme())),
+            )
+            extra_body: tuple[BaseElement | str, ...] = ()
+        else:
+            extra_head = ()
+            extra_body = (script(self._javascript(), type="text/javascript"),)
+        if self._has_search():
+            extra_head += (style(_search_styles(get_slides_theme())),)
+            index = SearchIndex()
+            for fragment in fragments:
+                index.add(fragment)
+            extra_body += (Safe(index.script()),)
+
         return HtmlPage(
             Head(
                 meta(charset="utf-8"),
                 meta(name="viewport", content="width=device-width, initial-scale=1.0"),
+                *extra_head,
                 title=self.attrs.get("title", "My Slides"),
             ),
             Body(
-                div(*self.children, classes=self.classes),
-                script(self.javascript, type="text/javascript"),
+                div(*map(Safe, fragments), classes=self.classes),
+                *extra_body,
             ),
         )
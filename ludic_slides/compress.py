@@ -0,0 +1,132 @@
+import os
+import zlib
+from collections.abc import Callable, Iterable
+from contextlib import ExitStack
+from typing import Any, Protocol
+
+__all__ = (
+    "available_formats",
+    "compress_file",
+)
+
+BLOCK_SIZE = 1024 * 1024
+
+
+class _Compressor(Protocol):
+    def compress(self, data: bytes) -> bytes: ...
+
+    def flush(self) -> bytes: ...
+
+
+class _BrotliCompressor:
+    def __init__(self) -> None:
+        import brotli
+
+        self._compressor = brotli.Compressor(quality=11)
+
+    def compress(self, data: bytes) -> bytes:
+        return self._compressor.process(data)  # type: ignore[no-any-return]
+
+    def flush(self) -> bytes:
+        return self._compressor.finish()  # type: ignore[no-any-return]
+
+
+def _gzip() -> _Compressor:
+    # no file name or timestamp in the header, so the output is reproducible
+    return zlib.compressobj(9, zlib.DEFLATED, 16 + zlib.MAX_WBITS)
+
+
+def _zstd() -> _Compressor:
+    try:
+        from compression import zstd
+
+        compressor: Any = zstd.ZstdCompressor(level=19)
+    except ImportError:
+        import zstandard
+
+        compressor = zstandard.ZstdCompressor(level=19).compressobj()
+    return compressor  # type: ignore[no-any-return]
+
+
+# file extensions and factories of the supported formats
+FORMATS: dict[str, tuple[str, Callable[[], _Compressor]]] = {
+    "gzip": (".gz", _gzip),
+    "br": (".br", _BrotliCompressor),
+    "zstd": (".zst", _zstd),
+}
+
+
+def available_formats() -> list[str]:
+    """Return the compression formats which can be used.
+
+    Gzip is always available, brotli requires the ``brotli`` package and
+    zstd the ``zstandard`` package (or Python 3.14).
+
+    Returns:
+        The names of the available formats.
+    """
+    available = []
+    for name, (_, factory) in FORMATS.items():
+        try:
+            factory()
+        except ImportError:
+            continue
+        available.append(name)
+    return available
+
+
+def _is_up_to_date(path: str, target: str) -> bool:
+    try:
+        return os.stat(target).st_mtime_ns >= os.stat(path).st_mtime_ns
+    except OSError:
+        return False
+
+
+def _compress_blocks(path: str, pending: list[tuple[_Compressor, str, str]]) -> None:
+    compressors = [compressor for compressor, _, _ in pending]
+    with ExitStack() as stack:
+        outputs = [
+            stack.enter_context(open(tmp_target, "wb")) for _, _, tmp_target in pending
+        ]
+        with open(path, "rb") as f:
+            while block := f.read(BLOCK_SIZE):
+                for compressor, output in zip(compressors, outputs, strict=True):
+                    output.write(compressor.compress(block))
+        for compressor, output in zip(compressors, outputs, strict=True):
+            output.write(compressor.flush())
+
+
+def compress_file(path: str, formats: Iterable[str]) -> list[str]:
+    """Write precompressed copies of a file next to it.
+
+    The file is read and compressed block by block, so large files are never
+    held in memory. Copies which are newer than the file are not compressed
+    again.
+
+    Args:
+        path: The file to compress.
+        formats: Names of the formats, see :data:`FORMATS`.
+
+    Returns:
+        Paths of the compressed copies which were written.
+    """
+    pending = []
+    for name in formats:
+        extension, factory = FORMATS[name]
+        target = f"{path}{extension}"
+        if not _is_up_to_date(path, target):
+            pending.append((factory(), target, f"{target}.{os.getpid()}.tmp"))
+    if not pending:
+        return []
+
+    try:
+        _compress_blocks(path, pending)
+    except BaseException:
+        for _, _, tmp_target in pending:
+            if os.path.exists(tmp_target):
+                os.remove(tmp_target)
+        raise
+
+    for _, target, tmp_target in pending:
+        os.replace(tmp_target, target)
+    return [target for _, target, _ in pending]
@@ -0,0 +1,290 @@
+import hashlib
+import itertools
+import re
+import tempfile
+from collections.abc import Callable, Iterable, Iterator
+from dataclasses import dataclass, field
+from typing import IO
+
+__all__ = (
+    "optimize_css",
+    "optimize_stylesheets",
+    "stylesheet_name",
+    "used_names",
+)
+
+_COMMENT_RE = re.compile(r"/\*.*?\*/", re.DOTALL)
+_STYLE_RE = re.compile(r"<style[^>]*>(.*?)</style>", re.DOTALL | re.IGNORECASE)
+_NAME_RE = re.compile(r"[A-Za-z_][\w-]*")
+_PARTIAL_NAME_RE = re.compile(r"[\w-]+\Z")
+_CLASS_RE = re.compile(r"\.(-?[A-Za-z_][\w-]*)")
+_PARENS_RE = re.compile(r"\([^()]*\)")
+_SPACE_RE = re.compile(r"\s+")
+_COMBINATOR_RE = re.compile(r"\s*([>+~,])\s*")
+
+# the document is spooled to disk while it is pruned once it exceeds this size
+_SPOOL_SIZE = 1 << 20
+_SPOOL_BLOCK_SIZE = 1 << 16
+
+# at-rules containing declarations rather than nested rules
+_DECLARATION_AT_RULES = (
+    "@font-face",
+    "@page",
+    "@property",
+    "@counter-style",
+    "@font-palette-values",
+)
+
+
+@dataclass
+class _Rule:
+    prelude: str
+    body: str
+
+
+@dataclass
+class _Block:
+    prelude: str
+    children: list["_Rule | _Block | str"] = field(default_factory=list)
+
+
+type _Node = _Rule | _Block | str
+
+
+def _skip_string(css: str, pos: int) -> int:
+    quote = css[pos]
+    pos += 1
+    while pos < len(css) and css[pos] != quote:
+        pos += 2 if css[pos] == "\\" else 1
+    return pos + 1
+
+
+def _find_block_end(css: str, pos: int) -> int:
+    depth = 1
+    while pos < len(css):
+        char = css[pos]
+        if char in "\"'":
+            pos = _skip_string(css, pos)
+            continue
+        if char == "{":
+            depth += 1
+        elif char == "}":
+            depth -= 1
+            if depth == 0:
+                return pos
+        pos += 1
+    return pos
+
+
+def _parse(css: str, pos: int = 0) -> tuple[list[_Node], int]:
+    nodes: list[_Node] = []
+    start = pos
+    while pos < len(css):
+        char = css[pos]
+        if char in "\"'":
+            pos = _skip_string(css, pos)
+            continue
+        if char == "{":
+            prelude = css[start:pos].strip()
+            if prelude.startswith("@") and not prelude.startswith(
+                _DECLARATION_AT_RULES
+            ):
+                children, pos = _parse(css, pos + 1)
+                nodes.append(_Block(prelude, children))
+            else:
+                end = _find_block_end(css, pos + 1)
+                nodes.append(_Rule(prelude, css[pos + 1 : end]))
+                pos = end + 1
+            start = pos
+            continue
+        if char == "}":
+            return nodes, pos + 1
+        if char == ";":
+            if statement := css[start : pos + 1].strip():
+                nodes.append(statement)
+            start = pos + 1
+        pos += 1
+    return nodes, pos
+
+
+def _split(text: str, separator: str) -> list[str]:
+    parts, depth, start, pos = [], 0, 0, 0
+    while pos < len(text):
+        char = text[pos]
+        if char in "\"'":
+            pos = _skip_string(text, pos)
+            continue
+        if char in "([":
+            depth += 1
+        elif char in ")]":
+            depth -= 1
+        elif char == separator and depth == 0:
+            parts.append(text[start:pos])
+            start = pos + 1
+        pos += 1
+    parts.append(text[start:])
+    return parts
+
+
+def _minify_selector(selector: str) -> str:
+    return _COMBINATOR_RE.sub(r"\1", _SPACE_RE.sub(" ", selector).strip())
+
+
+def _minify_body(body: str) -> str:
+    declarations = []
+    for declaration in _split(body, ";"):
+        name, colon, value = declaration.partition(":")
+        if colon and (value := _SPACE_RE.sub(" ", value).strip()):
+            declarations.append(f"{name.strip()}:{value}")
+    return ";".join(declarations)
+
+
+def _selector_is_used(selector: str, used: set[str]) -> bool:
+    # classes inside functional pseudo-classes like :not() are not required
+    while (stripped := _PARENS_RE.sub("", selector)) != selector:
+        selector = stripped
+    return all(name in used for name in _CLASS_RE.findall(selector))
+
+
+def _serialize(nodes: list[_Node], used: set[str] | None) -> str:
+    rules: dict[tuple[str, str], str] = {}
+    for node in nodes:
+        if isinstance(node, str):
+            css = _SPACE_RE.sub(" ", node)
+            rules[(css, "")] = css
+        elif isinstance(node, _Block):
+            if children := _serialize(node.children, used):
+                prelude = _SPACE_RE.sub(" ", node.prelude)
+                rules[(prelude, children)] = f"{prelude}{{{children}}}"
+        else:
+            selectors = [_minify_selector(part) for part in _split(node.prelude, ",")]
+            if used is not None and not node.prelude.startswith("@"):
+                selectors = [sel for sel in selectors if _selector_is_used(sel, used)]
+            if selectors and (body := _minify_body(node.body)):
+                selector = ",".join(selectors)
+                # identical rules are emitted only once, at their last position
+                rules.pop((selector, body), None)
+                rules[(selector, body)] = f"{selector}{{{body}}}"
+    return "".join(rules.values())
+
+
+def optimize_css(css: str, used: set[str] | None = None) -> str:
+    """Minify the given stylesheet, remove duplicate and optionally unused rules.
+
+    A selector is considered unused if it references a class whose name is not
+    in the given set of used names. Rules without any used selectors are
+    removed.
+
+    Args:
+        css: The stylesheet.
+        used: Names used in the document (see :func:`used_names`), if given,
+            rules for classes which are not used are removed.
+
+    Returns:
+        The optimized stylesheet.
+    """
+    nodes, _ = _parse(_COMMENT_RE.sub("", css))
+    return _serialize(nodes, used)
+
+
+def used_names(chunks: Iterable[str]) -> set[str]:
+    """Collect names which may be referenced by CSS classes in an HTML document.
+
+    Any word in the document, including attributes and scripts (which may add
+    classes dynamically), counts as used, which errs on the side of keeping
+    rules.
+
+    Args:
+        chunks: Chunks of the HTML document without the stylesheets.
+
+    Returns:
+        The set of names.
+    """
+    names: set[str] = set()
+    partial = ""
+    for chunk in chunks:
+        chunk = partial + chunk
+        # a name at the end of the chunk may continue in the next one
+        match = _PARTIAL_NAME_RE.search(chunk)
+        partial = match.group() if match else ""
+        names.update(_NAME_RE.findall(chunk, 0, len(chunk) - len(partial)))
+    names.update(_NAME_RE.findall(partial))
+    return names
+
+
+def _spool(chunks: Iterable[str], file: IO[str]) -> Iterator[str]:
+    for chunk in chunks:
+        file.write(chunk)
+        yield chunk
+
+
+def optimize_stylesheets(
+    chunks: Iterable[str],
+    prune: bool = True,
+    external: Callable[[str], str] | None = None,
+) -> Iterator[str]:
+    """Optimize the stylesheets of an HTML document rendered in chunks.
+
+    All ``<style>`` elements in the first chunk (the head of the document) are
+    merged into one, deduplicated and minified. If pruning is enabled, the
+    rest of the document needs to be rendered first to find out which rules
+    are used. It is collected in a temporary file meanwhile, which is kept in
+    memory only while it is small, so the document is not held in memory but
+    nothing is yielded before the last slide was rendered.
+
+    Args:
+        chunks: Chunks of the HTML document, e.g. from ``Slides.iter_html()``.
+        prune: Whether to remove rules for classes not used in the document.
+        external: Optional function storing the stylesheet externally and
+            returning its URL, the stylesheet is then linked instead of inlined.
+
+    Yields:
+        str: Chunks of the HTML document with the optimized stylesheet
+    """
+    chunks = iter(chunks)
+    head = next(chunks, "")
+    stylesheets = _STYLE_RE.findall(head)
+    if not stylesheets:
+        yield head
+        yield from chunks
+        return
+
+    first = _STYLE_RE.search(head)
+    assert first is not None
+    head_start = head[: first.start()]
+    head_end = _STYLE_RE.sub("", head[first.start() :])
+
+    def stylesheet(used: set[str] | None) -> str:
+        css = optimize_css("\n".join(stylesheets), used)
+        if external is not None:
+            return f'<link rel="stylesheet" href="{external(css)}">'
+        return f"<style>{css}</style>"
+
+    if not prune:
+        yield head_start + stylesheet(None) + head_end
+        yield from chunks
+        return
+
+    with tempfile.SpooledTemporaryFile(
+        _SPOOL_SIZE, mode="w+", encoding="utf-8"
+    ) as spool:
+        used = used_names(
+            itertools.chain([head_start, head_end], _spool(chunks, spool))
+        )
+        yield head_start + stylesheet(used) + head_end
+        spool.seek(0)
+        yield from iter(lambda: spool.read(_SPOOL_BLOCK_SIZE), "")
+
+
+def stylesheet_name(css: str, prefix: str = "slides") -> str:
+    """Return a content addressed file name for the given stylesheet.
+
+    Args:
+        css: The stylesheet.
+        prefix: Prefix of the file name.
+
+    Returns:
+        File name containing a hash of the stylesheet.
+    """
+    digest = hashlib.sha256(css.encode("utf-8")).hexdigest()[:12]
+    return f"{prefix}.{digest}.css"
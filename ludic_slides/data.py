@@ -0,0 +1,137 @@
+import csv
+import itertools
+import json
+import math
+import os
+from collections.abc import Iterable, Iterator, Mapping, Sequence
+from typing import Any
+
+from .components import Header, Slide, Table, TableHead, TableRow
+from .layout import LINE_HEIGHT, SlideBox
+from .themes import SlidesTheme
+
+__all__ = (
+    "read_csv",
+    "read_json_lines",
+    "rows_per_slide",
+    "table_slides",
+)
+
+type Row = Sequence[Any] | Mapping[str, Any]
+
+
+def read_csv(
+    path: str | os.PathLike[str], delimiter: str = ",", encoding: str = "utf-8"
+) -> Iterator[dict[str, str]]:
+    """Read the rows of a CSV file one by one.
+
+    The first line of the file contains the names of the columns.
+
+    Args:
+        path: The path to the CSV file.
+        delimiter: The character separating the values.
+        encoding: The encoding of the file.
+
+    Yields:
+        The rows, mapping the names of the columns to the values.
+    """
+    with open(path, newline="", encoding=encoding) as f:
+        yield from csv.DictReader(f, delimiter=delimiter)
+
+
+def read_json_lines(
+    path: str | os.PathLike[str], encoding: str = "utf-8"
+) -> Iterator[Any]:
+    """Read the rows of a JSON Lines file one by one.
+
+    Args:
+        path: The path to the file with one JSON object or array per line.
+        encoding: The encoding of the file.
+
+    Yields:
+        The decoded rows, empty lines are skipped.
+    """
+    with open(path, encoding=encoding) as f:
+        for line in f:
+            if line.strip():
+                yield json.loads(line)
+
+
+def rows_per_slide(theme: SlidesTheme | None = None, header: bool = True) -> int:
+    """Estimate how many table rows fit on a slide.
+
+    The estimate assumes single line cells and a viewport with the aspect ratio
+    of the slides, it is derived from the aspect ratio, the font size and the
+    spacing of the theme.
+
+    Args:
+        theme: The theme of the slides, defaults to the current default theme.
+        header: Whether the table has a header row.
+
+    Returns:
+        The number of rows, at least one.
+    """
+    box = SlideBox.from_theme(theme)
+    available = box.height - box.header_size * LINE_HEIGHT - box.gap
+    if header:
+        available -= box.row_height
+    return max(1, math.floor(available / box.row_height))
+
+
+def _cells(row: Row, columns: Sequence[str] | None) -> list[str]:
+    if isinstance(row, Mapping):
+        return [str(row.get(column, "")) for column in columns or row]
+    return [str(value) for value in row]
+
+
+def table_slides(
+    rows: Iterable[Row],
+    title: str,
+    columns: Sequence[str] | None = None,
+    per_slide: int | None = None,
+    theme: SlidesTheme | None = None,
+) -> Iterator[Slide]:
+    """Paginate rows of data into slides with tables.
+
+    The rows are consumed lazily, each slide is created as soon as its rows
+    were read. The slides are regular :class:`ludic_slides.Slide` components,
+    so they are lazy loaded, checked for overflow and searched like any other
+    slide. For sources with many thousands of rows, compact the slideshow
+    (see :meth:`ludic_slides.Slides.compact`) so the components of the tables
+    are not kept in memory until the slides are written.
+
+    Example usage:
+        slides = Slides(
+            SlideMain(Header("Report")),
+            *table_slides(read_csv("sales.csv"), title="Sales"),
+        ).compact()
+
+    Args:
+        rows: The rows, either sequences of values or mappings of column names
+            to values, e.g. from :func:`read_csv` or :func:`read_json_lines`.
+        title: The header of every slide.
+        columns: Names of the columns. Defaults to the keys of the first row if
+            the rows are mappings, otherwise the table has no header row.
+        per_slide: Number of rows on each slide, defaults to the estimate of
+            :func:`rows_per_slide`.
+        theme: The theme used to estimate the number of rows per slide.
+
+    Yields:
+        The slides.
+    """
+    iterator = iter(rows)
+    try:
+        first = next(iterator)
+    except StopIteration:
+        return
+    if columns is None and isinstance(first, Mapping):
+        columns = list(first)
+
+    if per_slide is None:
+        per_slide = rows_per_slide(theme, header=columns is not None)
+    head = (TableHead(*columns),) if columns is not None else ()
+
+    iterator = itertools.chain([first], iterator)
+    while page := list(itertools.islice(iterator, per_slide)):
+        table = Table(*head, *(TableRow(*_cells(row, columns)) for row in page))
+        yield Slide(Header(title), table)
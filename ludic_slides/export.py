@@ -0,0 +1,203 @@
+import hashlib
+import json
+import os
+import re
+from collections.abc import Callable
+from html import escape, unescape
+from pathlib import Path
+from typing import Any
+from uuid import uuid4
+
+from .css import optimize_stylesheets
+
+__all__ = (
+    "export_pages",
+    "slide_title",
+)
+
+_SCRIPT_RE = re.compile(
+    r"<script(?![^>]*\ssrc=)[^>]*>(.*?)</script>", re.DOTALL | re.IGNORECASE
+)
+_TITLE_RE = re.compile(r"<title>(.*?)</title>", re.DOTALL | re.IGNORECASE)
+_HEADER_RE = re.compile(r"<h[1-6][^>]*>(.*?)</h[1-6]>", re.DOTALL | re.IGNORECASE)
+_TAG_RE = re.compile(r"<[^>]+>")
+
+# lists the files written by the last export, only those are removed when they
+# are no longer needed, so other files in the directory are kept
+FILES_NAME = ".ludic-slides-files.json"
+
+# styles of the links between pages, appended to the shared stylesheet
+PAGES_CSS = (
+    ".slide-pages{position:fixed;bottom:0;right:0;padding:.5em;font-size:.75em}"
+    ".slide-pages a{padding:0 .5em}"
+)
+
+
+def _bundle_name(content: str, prefix: str, extension: str) -> str:
+    digest = hashlib.sha256(content.encode("utf-8")).hexdigest()[:12]
+    return f"{prefix}.{digest}.{extension}"
+
+
+def _write_if_changed(path: Path, content: str) -> bool:
+    data = content.encode("utf-8")
+    try:
+        if path.read_bytes() == data:
+            return False
+    except OSError:
+        pass
+    tmp_path = path.with_name(f"{path.name}.{os.getpid()}.tmp")
+    tmp_path.write_bytes(data)
+    os.replace(tmp_path, path)
+    return True
+
+
+def _read_files(directory: Path) -> set[str]:
+    try:
+        files = json.loads((directory / FILES_NAME).read_text("utf-8"))["files"]
+    except (OSError, ValueError, KeyError, TypeError):
+        return set()
+    # names containing a path are not written by the export
+    return {name for name in files if isinstance(name, str) and Path(name).name == name}
+
+
+def slide_title(fragment: str, number: int) -> str:
+    """Return the text of the first header of a rendered slide.
+
+    Args:
+        fragment: The rendered slide.
+        number: The position of the slide, used when it has no header.
+
+    Returns:
+        The title of the slide.
+    """
+    if match := _HEADER_RE.search(fragment):
+        if title := " ".join(unescape(_TAG_RE.sub("", match.group(1))).split()):
+            return title
+    return f"Slide {number}"
+
+
+def _navigation(previous: str | None, following: str | None) -> tuple[str, str]:
+    links, anchors = [], []
+    if previous is not None:
+        links.append(f'<link rel="prev" href="{previous}">')
+        anchors.append(f'<a rel="prev" href="{previous}">&larr;</a>')
+    anchors.append('<a href="index.html">&#9776;</a>')
+    if following is not None:
+        links.append(f'<link rel="next" href="{following}">')
+        anchors.append(f'<a rel="next" href="{following}">&rarr;</a>')
+    return "".join(links), f'<nav class="slide-pages">{"".join(anchors)}</nav>'
+
+
+def _index(title: str, pages: list[tuple[str, str]], stylesheet: str) -> str:
+    items = "".join(
+        f'<li><a href="{name}">{escape(page_title)}</a></li>'
+        for name, page_title in pages
+    )
+    return (
+        '<!DOCTYPE html><html><head><meta charset="utf-8">'
+        '<meta name="viewport" content="width=device-width, initial-scale=1.0">'
+        f'<title>{title}</title><link rel="stylesheet" href="{stylesheet}">'
+        f"</head><body><h1>{title}</h1><ol>{items}</ol></body></html>"
+    )
+
+
+def export_pages(
+    slides: Any,
+    output_dir: str | os.PathLike[str],
+    jobs: int = 1,
+    rewrite: Callable[[str], str] | None = None,
+    on_slide: Callable[[str], Any] | None = None,
+) -> int:
+    """Export a slideshow as one HTML page per slide.
+
+    Pages are named ``001.html``, ``002.html`` and so on and link to the
+    previous and next page, so the keyboard and click navigation of the
+    slideshow continues across pages. All pages share one minified stylesheet
+    and one script with a content hash in their names, so browsers and CDNs
+    can cache them. An ``index.html`` lists the titles of all slides.
+
+    Pages whose content did not change are not written again, and pages of
+    slides which no longer exist are removed, as well as stylesheets and
+    scripts of previous exports. The written files are listed in a hidden
+    file in the directory (see ``FILES_NAME``), other files are never removed.
+
+    Args:
+        slides: The slideshow.
+        output_dir: The directory the pages are written to.
+        jobs: Number of worker processes rendering the slides in parallel.
+        rewrite: Optional function rewriting the content of every page and of
+            the stylesheet, e.g. :meth:`ludic_slides.assets.AssetPipeline.rewrite`.
+        on_slide: Optional function called with the rendered fragment of every
+            slide, in order.
+
+    Returns:
+        The number of pages.
+    """
+    from .components import RenderedSlide
+
+    directory = Path(output_dir)
+    directory.mkdir(parents=True, exist_ok=True)
+    rewrite = rewrite or (lambda content: content)
+
+    marker = RenderedSlide(f"<!--{uuid4().hex}-->")
+    # the search index covers a single page only, so pages are not searchable
+    shell = type(slides)(marker, **{**slides.attrs, "search": False})
+    head, tail = shell.to_html().split(marker, 1)
+
+    stylesheets: list[str] = []
+
+    def write_stylesheet(css: str) -> str:
+        css = rewrite(css + PAGES_CSS)
+        stylesheets.append(name := _bundle_name(css, "slides", "css"))
+        _write_if_changed(directory / name, css)
+        return name
+
+    head = "".join(optimize_stylesheets([head], prune=False, external=write_stylesheet))
+    if not stylesheets:
+        link = f'<link rel="stylesheet" href="{write_stylesheet("")}">'
+        head = head.replace("</head>", f"{link}</head>", 1)
+
+    bundles = set(stylesheets)
+    javascript = "\n".join(_SCRIPT_RE.findall(tail))
+    if javascript:
+        script_name = _bundle_name(javascript, "slides", "js")
+        _write_if_changed(directory / script_name, javascript)
+        bundles.add(script_name)
+        tail = _SCRIPT_RE.sub("", tail).replace(
+            "</body>", f'<script src="{script_name}" defer></script></body>', 1
+        )
+
+    title_match = _TITLE_RE.search(head)
+    title = title_match.group(1) if title_match else ""
+
+    count = len(slides.children)
+    width = max(3, len(str(count)))
+    names = [f"{number:0{width}d}.html" for number in range(1, count + 1)]
+
+    pages = []
+    for index, fragment in enumerate(slides.render_slides(jobs=jobs)):
+        links, nav = _navigation(
+            names[index - 1] if index > 0 else None,
+            names[index + 1] if index + 1 < len(names) else None,
+        )
+        page_head = head.replace("</head>", f"{links}</head>", 1)
+        if title_match:
+            page_title = f"{title} ({index + 1}/{count})"
+            page_head = page_head.replace(
+                title_match.group(0), f"<title>{page_title}</title>", 1
+            )
+        _write_if_changed(
+            directory / names[index], rewrite(page_head + fragment + nav + tail)
+        )
+        pages.append((names[index], slide_title(fragment, index + 1)))
+        if on_slide is not None:
+            on_slide(fragment)
+
+    _write_if_changed(directory / "index.html", _index(title, pages, stylesheets[0]))
+
+    current = {*names, *bundles, "index.html"}
+    for name in sorted(_read_files(directory) - current):
+        (directory / name).unlink(missing_ok=True)
+    files = {"files": sorted(current)}
+    _write_if_changed(directory / FILES_NAME, json.dumps(files, indent=2) + "\n")
+    return count
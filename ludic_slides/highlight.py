@@ -0,0 +1,149 @@
+import hashlib
+import os
+from collections import OrderedDict
+from collections.abc import Callable
+from pathlib import Path
+
+from ludic.base import BaseElement
+from ludic.styles.themes import get_default_theme
+
+from .cache import fingerprint, package_versions
+from .profiling import phase
+
+__all__ = (
+    "HighlightCache",
+    "get_highlight_cache",
+    "set_highlight_cache",
+)
+
+
+class HighlightCache:
+    """A bounded cache of highlighted code.
+
+    Highlighting code with pygments is the most expensive part of rendering
+    technical slides. This cache memoizes the highlighted HTML of code
+    components keyed by their source, attributes (e.g. the language), the
+    current theme (which defines the highlighting style) and the versions of
+    ludic and pygments, so identical snippets are only lexed once. If a
+    directory is given, the highlighted HTML is also persisted to disk and
+    reused by subsequent builds.
+
+    Example usage:
+        set_highlight_cache(HighlightCache(directory=".ludic-slides-cache"))
+    """
+
+    def __init__(
+        self,
+        max_entries: int = 1024,
+        directory: str | os.PathLike[str] | None = None,
+    ) -> None:
+        """Initialize the cache.
+
+        Args:
+            max_entries: Maximum number of highlighted snippets kept in memory.
+            directory: Optional directory where highlighted snippets are persisted.
+        """
+        self.max_entries = max_entries
+        self.directory = Path(directory) if directory is not None else None
+        self.hits = 0
+        self.misses = 0
+        self._entries: OrderedDict[str, str] = OrderedDict()
+        self._namespace = package_versions().encode()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def key(self, element: BaseElement) -> str:
+        """Compute the cache key of the given code component.
+
+        Args:
+            element: The code component.
+
+        Returns:
+            The cache key.
+        """
+        digest = hashlib.sha256(self._namespace)
+        digest.update(repr(get_default_theme()).encode())
+        digest.update(fingerprint(element).encode())
+        return digest.hexdigest()
+
+    def _path(self, key: str) -> Path:
+        assert self.directory is not None
+        return self.directory / key[:2] / f"{key}.html"
+
+    def _load(self, key: str) -> str | None:
+        if self.directory is None:
+            return None
+        try:
+            return self._path(key).read_text(encoding="utf-8")
+        except OSError:
+            return None
+
+    def _save(self, key: str, html: str) -> None:
+        if self.directory is None:
+            return
+        path = self._path(key)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = path.with_suffix(f".{os.getpid()}.tmp")
+        tmp_path.write_text(html, encoding="utf-8")
+        os.replace(tmp_path, path)
+
+    def render(self, element: BaseElement, render: Callable[[], str]) -> str:
+        """Return the highlighted HTML of a code component.
+
+        Only the HTML is cached, callers wrap it in a new element every time,
+        so the elements of different slides are never shared.
+
+        Args:
+            element: The code component.
+            render: Function highlighting the code on a cache miss.
+
+        Returns:
+            The highlighted HTML.
+        """
+        key = self.key(element)
+        if (html := self._entries.get(key)) is None:
+            html = self._load(key)
+
+        if html is None:
+            self.misses += 1
+            with phase("highlight"):
+                html = render()
+            self._save(key, html)
+        else:
+            self.hits += 1
+
+        self._entries[key] = html
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+        return html
+
+    def clear(self) -> None:
+        """Remove all entries from memory and from the cache directory."""
+        self._entries.clear()
+        if self.directory is not None:
+            for path in self.directory.glob("*/*.html"):
+                path.unlink(missing_ok=True)
+
+
+_highlight_cache = HighlightCache()
+
+
+def set_highlight_cache(cache: HighlightCache) -> None:
+    """Set the cache used when rendering code components.
+
+    Args:
+        cache: The cache to use.
+    """
+    global _highlight_cache
+    _highlight_cache = cache
+
+
+def get_highlight_cache() -> HighlightCache:
+    """Return the cache used when rendering code components.
+
+    Returns:
+        The current cache.
+    """
+    return _highlight_cache
@@ -0,0 +1,262 @@
+import math
+import re
+from collections.abc import Iterable
+from dataclasses import dataclass
+from typing import Any
+
+from ludic.styles.types import BaseSize, Size, SizeClamp, SizeUnit
+
+from .components import (
+    CodeBlock,
+    Header,
+    Item,
+    List,
+    Notes,
+    NumberedList,
+    Slide,
+    SlideMain,
+    Table,
+)
+from .themes import SlidesTheme, get_slides_theme
+
+__all__ = (
+    "SlideBox",
+    "SlideFit",
+    "check_overflow",
+    "scale_fragment",
+)
+
+# line height of text relative to the font size
+LINE_HEIGHT = 1.5
+
+# average width of a character relative to the font size
+CHAR_WIDTH = 0.5
+
+# slides are not scaled down further, smaller text would not be readable
+MIN_SCALE = 0.5
+
+# sizes in other units are converted assuming a 16px font and a 768px viewport,
+# viewport units are treated as vmin
+_PX_PER_VMIN = 7.68
+_PX_PER_EM = 16
+
+_SLIDE_RE = re.compile(r'^<div class="slide[ "]')
+
+
+def _unit_to_vmin(value: float, unit: SizeUnit) -> float:
+    match unit:
+        case "vmin" | "vw" | "vh" | "vmax":
+            return float(value)
+        case "px":
+            return value / _PX_PER_VMIN
+        case _:
+            return value * _PX_PER_EM / _PX_PER_VMIN
+
+
+def _to_vmin(size: BaseSize) -> float:
+    if isinstance(size, SizeClamp):
+        return min(
+            max(
+                _unit_to_vmin(size.value, size.viewport_unit),
+                _unit_to_vmin(size.minimum, size.base_unit),
+            ),
+            _unit_to_vmin(size.maximum, size.base_unit),
+        )
+    if isinstance(size, Size):
+        return _unit_to_vmin(size.value, size.unit)
+    return _unit_to_vmin(1, "em")
+
+
+@dataclass(frozen=True)
+class SlideBox:
+    """The space available for the content of a slide.
+
+    All sizes are in ``vmin`` of a viewport with the aspect ratio of the slides,
+    derived from the aspect ratio, font sizes and spacing of a theme.
+
+    Attributes:
+        width: Width of the content.
+        height: Height of the content.
+        font_size: Size of the text.
+        header_size: Size of the header.
+        code_size: Size of the text of code blocks.
+        gap: Space between the blocks of content.
+        item_gap: Space between the items of lists.
+        padding: Padding of table cells and code blocks.
+    """
+
+    width: float
+    height: float
+    font_size: float
+    header_size: float
+    code_size: float
+    gap: float
+    item_gap: float
+    padding: float
+
+    @classmethod
+    def from_theme(cls, theme: SlidesTheme | None = None) -> "SlideBox":
+        """Compute the box of the slides of a theme.
+
+        Args:
+            theme: The theme, defaults to the current default theme.
+
+        Returns:
+            The box.
+        """
+        theme = theme or get_slides_theme()
+        ratio_width, ratio_height = theme.aspect_ratio
+        shorter = min(ratio_width, ratio_height)
+        sizes = theme.sizes
+        font_size = _to_vmin(theme.fonts.size)
+        return cls(
+            width=100 * ratio_width / shorter
+            - 2 * (_to_vmin(sizes.xl) + _to_vmin(sizes.xxxl)),
+            height=100 * ratio_height / shorter
+            - _to_vmin(sizes.xxxl)
+            - 2 * _to_vmin(sizes.xxl),
+            font_size=font_size,
+            header_size=_to_vmin(theme.headers.h1.size),
+            code_size=font_size * 0.85,
+            gap=_to_vmin(sizes.l),
+            item_gap=_to_vmin(sizes.m),
+            padding=_to_vmin(sizes.xs),
+        )
+
+    @property
+    def row_height(self) -> float:
+        """Height of a table row with single line cells."""
+        return self.font_size * LINE_HEIGHT + 2 * self.padding
+
+    def text_height(
+        self, text: str, size: float | None = None, char_width: float = CHAR_WIDTH
+    ) -> float:
+        """Estimate the height of wrapped text.
+
+        Args:
+            text: The text.
+            size: The font size, defaults to the size of the text of slides.
+            char_width: The average width of a character relative to the size.
+
+        Returns:
+            The height.
+        """
+        size = size or self.font_size
+        per_line = max(1, int(self.width / (size * char_width)))
+        lines = sum(
+            max(1, math.ceil(len(line) / per_line)) for line in text.splitlines()
+        )
+        return max(1, lines) * size * LINE_HEIGHT
+
+
+@dataclass(frozen=True)
+class SlideFit:
+    """The estimated size of the content of a slide.
+
+    Attributes:
+        index: The position of the slide, starting at 1.
+        title: The text of the header of the slide.
+        height: The estimated height of the content.
+        available: The height available for the content.
+    """
+
+    index: int
+    title: str
+    height: float
+    available: float
+
+    @property
+    def ratio(self) -> float:
+        """The height of the content relative to the available height."""
+        return self.height / self.available
+
+    @property
+    def overflows(self) -> bool:
+        """Whether the content is estimated not to fit on the slide."""
+        return self.ratio > 1
+
+    @property
+    def scale(self) -> float:
+        """The scale making the content fit, at least :data:`MIN_SCALE`."""
+        return max(MIN_SCALE, min(1.0, 1 / self.ratio))
+
+
+def _text(element: Any) -> str:
+    return str(getattr(element, "text", element))
+
+
+def _blocks_height(elements: Iterable[Any], box: SlideBox, gap: float) -> float:
+    heights = [
+        _height(element, box) for element in elements if not isinstance(element, Notes)
+    ]
+    return sum(heights) + gap * max(0, len(heights) - 1)
+
+
+def _height(element: Any, box: SlideBox) -> float:
+    if isinstance(element, Header):
+        return box.text_height(_text(element), box.header_size)
+    if isinstance(element, CodeBlock):
+        lines = max(1, len(_text(element).rstrip("\n").splitlines()))
+        return lines * box.code_size * LINE_HEIGHT + 2 * box.padding
+    if isinstance(element, Table):
+        return len(element.children) * box.row_height
+    if isinstance(element, List | NumberedList):
+        return _blocks_height(element.children, box, box.item_gap)
+    if isinstance(element, Item) and any(
+        isinstance(child, List | NumberedList) for child in element.children
+    ):
+        return _blocks_height(element.children, box, box.item_gap)
+    return box.text_height(_text(element))
+
+
+def check_overflow(slides: Any, theme: SlidesTheme | None = None) -> list[SlideFit]:
+    """Estimate whether the content of the slides fits on them.
+
+    The estimate is computed from the components without rendering them or
+    running a browser: lines of code blocks, list items, table rows and the
+    length of text (wrapped at the width of the slide) are compared to the
+    size of the slides derived from the theme. It is meant to catch slides
+    which lose content, as the content of slides is cut off when it overflows.
+
+    Example usage:
+        for fit in check_overflow(slides):
+            if fit.overflows:
+                print(f"Slide {fit.index} overflows by {fit.ratio - 1:.0%}")
+
+    Args:
+        slides: The slideshow.
+        theme: The theme of the slides, defaults to the current default theme.
+
+    Returns:
+        The estimates of all slides, already rendered slides are left out.
+    """
+    box = SlideBox.from_theme(theme)
+    fits = []
+    for index, slide in enumerate(slides.children, start=1):
+        if not isinstance(slide, Slide | SlideMain):
+            continue
+        header = next((c for c in slide.children if isinstance(c, Header)), None)
+        fits.append(
+            SlideFit(
+                index=index,
+                title=_text(header) if header is not None else f"Slide {index}",
+                height=_blocks_height(slide.children, box, box.gap),
+                available=box.height,
+            )
+        )
+    return fits
+
+
+def scale_fragment(fragment: str, scale: float) -> str:
+    """Scale the content of a rendered slide.
+
+    Args:
+        fragment: The rendered slide.
+        scale: The scale, e.g. :attr:`SlideFit.scale`.
+
+    Returns:
+        The rendered slide with its content scaled.
+    """
+    if scale >= 1 or not _SLIDE_RE.match(fragment):
+        return fragment
+    return f'<div style="--slide-scale: {scale:.3g}"{fragment[4:]}'
@@ -0,0 +1,293 @@
+import ast
+import hashlib
+import importlib.machinery
+import importlib.util
+import marshal
+import os
+import re
+import struct
+import sys
+from collections.abc import Iterator, Sequence
+from pathlib import Path
+from types import CodeType, ModuleType
+
+__all__ = (
+    "DeckLoader",
+    "get_deck_loader",
+    "module_dependencies",
+)
+
+# bytecode of decks is cached next to the regular one, the header contains the
+# modification time in nanoseconds, so edits within the same second are noticed
+_BYTECODE_OPTIMIZATION = "slides"
+_BYTECODE_HEADER = struct.Struct("<4sqq")
+
+type _Stat = tuple[int, int] | None
+
+
+def _stat(path: Path) -> _Stat:
+    try:
+        stat = path.stat()
+    except OSError:
+        return None
+    return stat.st_mtime_ns, stat.st_size
+
+
+class _DeckFileLoader(importlib.machinery.SourceFileLoader):
+    """Source loader caching bytecode keyed by the exact modification time."""
+
+    def get_code(self, fullname: str) -> CodeType:
+        source_path = self.get_filename(fullname)
+        stat = os.stat(source_path)
+        header = _BYTECODE_HEADER.pack(
+            importlib.util.MAGIC_NUMBER, stat.st_mtime_ns, stat.st_size
+        )
+        cache_path = importlib.util.cache_from_source(
+            source_path, optimization=_BYTECODE_OPTIMIZATION
+        )
+        try:
+            with open(cache_path, "rb") as f:
+                data = f.read()
+            if data.startswith(header):
+                # the cache file was written by this loader, see below
+                cached: CodeType = marshal.loads(data[len(header) :])  # noqa: S302
+                return cached
+        except (OSError, EOFError, ValueError, TypeError):
+            pass
+
+        code = self.source_to_code(self.get_data(source_path), source_path)
+        if not sys.dont_write_bytecode:
+            tmp_path = f"{cache_path}.{os.getpid()}.tmp"
+            try:
+                os.makedirs(os.path.dirname(cache_path), exist_ok=True)
+                with open(tmp_path, "wb") as f:
+                    f.write(header + marshal.dumps(code))
+                os.replace(tmp_path, cache_path)
+            except OSError:
+                pass
+        return code
+
+
+class _DeckFinder:
+    """Meta path finder loading modules from the directory of the current deck."""
+
+    def __init__(self, loader: "DeckLoader") -> None:
+        self.loader = loader
+        self._finders: dict[str, importlib.machinery.FileFinder] = {}
+
+    def invalidate_caches(self) -> None:
+        self._finders.clear()
+
+    def find_spec(
+        self,
+        fullname: str,
+        path: Sequence[str] | None,
+        target: ModuleType | None = None,
+    ) -> importlib.machinery.ModuleSpec | None:
+        directory = self.loader.directory
+        if directory is None:
+            return None
+        if path is None:
+            entries = [str(directory)]
+        elif fullname.rpartition(".")[0] in self.loader._modules:
+            entries = list(path)
+        else:
+            # submodules of packages which were not loaded from the deck
+            # directory (e.g. installed ones) are left to the regular finders
+            return None
+
+        for entry in entries:
+            if (finder := self._finders.get(entry)) is None:
+                finder = self._finders[entry] = importlib.machinery.FileFinder(
+                    entry, (_DeckFileLoader, importlib.machinery.SOURCE_SUFFIXES)
+                )
+            if (spec := finder.find_spec(fullname, target)) is not None:
+                if spec.origin is not None and spec.loader is not None:
+                    self.loader._track(fullname, Path(spec.origin))
+                    return spec
+        return None
+
+
+class DeckLoader:
+    """Loads Python files defining slides as modules.
+
+    Unlike executing the source text, the deck is loaded like a regular module
+    with ``__file__`` and ``__name__`` set and a single namespace for globals,
+    its bytecode is cached in ``__pycache__``, and modules next to the deck
+    can be imported by it (e.g. a ``common.py`` shared by a multi-file deck).
+    The module name of the deck is derived from its path, ``sys.path`` is not
+    modified.
+
+    Loaded local modules are kept between loads of decks from the same
+    directory. Only modules which changed, and the local modules importing
+    them, are loaded again; the deck itself is executed on every load.
+
+    Example usage:
+        loader = DeckLoader()
+        module = loader.load("decks/intro.py")
+        slides = module.slides
+    """
+
+    def __init__(self) -> None:
+        self.directory: Path | None = None
+        self._modules: dict[str, tuple[Path, _Stat]] = {}
+        self._finder = _DeckFinder(self)
+
+    def _track(self, name: str, path: Path) -> None:
+        self._modules[name] = (path.resolve(), _stat(path))
+
+    def _unload(self, names: set[str]) -> None:
+        for name in names:
+            self._modules.pop(name, None)
+            sys.modules.pop(name, None)
+
+    def _invalidate(self, directory: Path) -> None:
+        changed = {
+            name for name, (path, stat) in self._modules.items() if _stat(path) != stat
+        }
+        if not changed:
+            return
+
+        importers: dict[Path, set[str]] = {}
+        for name, (path, _) in self._modules.items():
+            for dependency in _imported_files(path, directory):
+                importers.setdefault(dependency.resolve(), set()).add(name)
+
+        pending = list(changed)
+        while pending:
+            path, _ = self._modules[pending.pop()]
+            for name in importers.get(path, ()):
+                if name not in changed:
+                    changed.add(name)
+                    pending.append(name)
+        self._unload(changed)
+        importlib.invalidate_caches()
+
+    def _activate(self, directory: Path) -> None:
+        if directory != self.directory:
+            self._unload(set(self._modules))
+            self.directory = directory
+
+    def load(self, python_input_file: str | os.PathLike[str]) -> ModuleType:
+        """Load a deck and return its module.
+
+        Args:
+            python_input_file: The path to the Python file.
+
+        Returns:
+            The executed module.
+
+        Raises:
+            Exception: Any exception raised while executing the deck.
+        """
+        path = Path(python_input_file).resolve()
+        self._activate(path.parent)
+        self._invalidate(path.parent)
+
+        name = _module_name(path)
+        spec = importlib.util.spec_from_file_location(
+            name, path, loader=_DeckFileLoader(name, str(path))
+        )
+        assert spec is not None and spec.loader is not None
+        module = importlib.util.module_from_spec(spec)
+
+        # the deck is registered like an imported module, so its components
+        # can be pickled
+        sys.modules[name] = module
+        self._track(name, path)
+        # the finder resolves imports of local modules, it is only installed
+        # while the deck is executed, so it does not affect imports elsewhere
+        # in the process
+        sys.meta_path.insert(0, self._finder)
+        try:
+            spec.loader.exec_module(module)
+        except BaseException:
+            self._unload({name})
+            raise
+        finally:
+            sys.meta_path.remove(self._finder)
+        return module
+
+    def files(self) -> list[Path]:
+        """Return the files of all loaded decks and local modules.
+
+        Returns:
+            The files, e.g. to watch them for changes.
+        """
+        return sorted({path for path, _ in self._modules.values()})
+
+
+def _module_name(path: Path) -> str:
+    # decks are named after their path, so decks with the same file name in
+    # different directories, or named like another module, do not collide
+    digest = hashlib.sha256(str(path).encode()).hexdigest()[:12]
+    return f"_ludic_slides_deck_{digest}_{re.sub(r'\W', '_', path.stem)}"
+
+
+def _resolve_module(name: str, directory: Path) -> Path | None:
+    base = directory.joinpath(*name.split("."))
+    for candidate in (base.with_suffix(".py"), base / "__init__.py"):
+        if candidate.is_file():
+            return candidate
+    return None
+
+
+def _imported_files(path: Path, root: Path) -> Iterator[Path]:
+    try:
+        tree = ast.parse(path.read_bytes(), filename=str(path))
+    except (OSError, SyntaxError, ValueError):
+        return
+
+    for node in ast.walk(tree):
+        if isinstance(node, ast.Import):
+            names = [alias.name for alias in node.names]
+            directory = root
+        elif isinstance(node, ast.ImportFrom):
+            directory = root
+            if node.level:
+                directory = path.parent
+                for _ in range(node.level - 1):
+                    directory = directory.parent
+            module = node.module or ""
+            names = [module] if module else []
+            names += [f"{module}.{alias.name}".lstrip(".") for alias in node.names]
+        else:
+            continue
+        for name in names:
+            if (resolved := _resolve_module(name, directory)) is not None:
+                yield resolved
+
+
+def module_dependencies(python_input_file: str) -> list[Path]:
+    """Find the local Python modules a deck depends on.
+
+    Imports are resolved against the directory of the deck, modules which are
+    not found there (e.g. installed packages) are not considered.
+
+    Args:
+        python_input_file: The path to the Python file.
+
+    Returns:
+        The deck and all local modules it (transitively) imports.
+    """
+    root = Path(python_input_file).resolve().parent
+    pending = [Path(python_input_file).resolve()]
+    found = {pending[0]}
+    while pending:
+        for dependency in _imported_files(pending.pop(), root):
+            if (dependency := dependency.resolve()) not in found:
+                found.add(dependency)
+                pending.append(dependency)
+    return sorted(found)
+
+
+_deck_loader = DeckLoader()
+
+
+def get_deck_loader() -> DeckLoader:
+    """Return the loader used by the command line interface to load decks.
+
+    Returns:
+        The loader.
+    """
+    return _deck_loader
@@ -0,0 +1,218 @@
+import difflib
+import hashlib
+import json
+import os
+from collections.abc import Iterable, Iterator
+from dataclasses import asdict, dataclass, field
+from typing import Any
+
+from .export import slide_title
+
+__all__ = (
+    "ManifestDiff",
+    "SlideEntry",
+    "diff_manifests",
+    "read_manifest",
+    "record_slides",
+    "slide_entry",
+    "write_manifest",
+)
+
+MANIFEST_VERSION = 1
+
+
+@dataclass(frozen=True)
+class SlideEntry:
+    """A rendered slide listed in a manifest.
+
+    Attributes:
+        index: The position of the slide, starting at 1.
+        title: The text of the first header of the slide.
+        hash: SHA-256 of the rendered fragment of the slide.
+        size: Size of the rendered fragment in bytes.
+    """
+
+    index: int
+    title: str
+    hash: str
+    size: int
+
+
+@dataclass
+class ManifestDiff:
+    """Differences between the slides of two manifests.
+
+    Attributes:
+        added: Slides of the new manifest which are not in the old one.
+        removed: Slides of the old manifest which are not in the new one.
+        moved: Pairs of old and new slides with the same content at a
+            different position relative to the other slides.
+        changed: Pairs of old and new slides at the same position relative to
+            the other slides, but with a different content.
+    """
+
+    added: list[SlideEntry] = field(default_factory=list)
+    removed: list[SlideEntry] = field(default_factory=list)
+    moved: list[tuple[SlideEntry, SlideEntry]] = field(default_factory=list)
+    changed: list[tuple[SlideEntry, SlideEntry]] = field(default_factory=list)
+
+    def __bool__(self) -> bool:
+        return bool(self.added or self.removed or self.moved or self.changed)
+
+    def to_dict(self) -> dict[str, Any]:
+        """Return the differences as JSON serializable data.
+
+        Returns:
+            The differences.
+        """
+        return {
+            "added": [asdict(entry) for entry in self.added],
+            "removed": [asdict(entry) for entry in self.removed],
+            "moved": [[asdict(old), asdict(new)] for old, new in self.moved],
+            "changed": [[asdict(old), asdict(new)] for old, new in self.changed],
+        }
+
+    def format(self) -> str:
+        """Return a human readable report of the differences.
+
+        Returns:
+            One line per added, removed, moved and changed slide.
+        """
+        lines = []
+        for old, new in self.changed:
+            lines.append(f"changed  {old.index:>5} -> {new.index:<5} {new.title}")
+        for old, new in self.moved:
+            lines.append(f"moved    {old.index:>5} -> {new.index:<5} {new.title}")
+        for entry in self.added:
+            lines.append(f"added    {'':>5}    {entry.index:<5} {entry.title}")
+        for entry in self.removed:
+            lines.append(f"removed  {entry.index:>5}    {'':<5} {entry.title}")
+        return "\n".join(lines) if lines else "No slides changed."
+
+
+def slide_entry(index: int, fragment: str) -> SlideEntry:
+    """Describe a rendered slide.
+
+    Args:
+        index: The position of the slide, starting at 1.
+        fragment: The rendered slide.
+
+    Returns:
+        The entry of the slide.
+    """
+    data = fragment.encode("utf-8")
+    return SlideEntry(
+        index=index,
+        title=slide_title(fragment, index),
+        hash=hashlib.sha256(data).hexdigest(),
+        size=len(data),
+    )
+
+
+def record_slides(chunks: Iterable[str], entries: list[SlideEntry]) -> Iterator[str]:
+    """Record the slides of a document rendered in chunks.
+
+    The chunks are passed through unchanged. All chunks except the first one
+    (the page up to the slides) and the last one (the rest of the page) are
+    recorded as slides, see ``Slides.iter_html()``.
+
+    Args:
+        chunks: Chunks of the HTML document.
+        entries: The list the entries of the slides are appended to.
+
+    Yields:
+        str: The chunks
+    """
+    pending: str | None = None
+    for position, chunk in enumerate(chunks):
+        if pending is not None:
+            entries.append(slide_entry(position - 1, pending))
+        pending = chunk if position else None
+        yield chunk
+
+
+def write_manifest(path: str | os.PathLike[str], entries: list[SlideEntry]) -> None:
+    """Write a manifest of rendered slides to a JSON file.
+
+    Args:
+        path: The path to the JSON file.
+        entries: The entries of the slides.
+    """
+    tmp_path = f"{os.fspath(path)}.{os.getpid()}.tmp"
+    with open(tmp_path, "w", encoding="utf-8") as f:
+        json.dump(
+            {
+                "version": MANIFEST_VERSION,
+                "slides": [asdict(entry) for entry in entries],
+            },
+            f,
+            indent=2,
+        )
+    os.replace(tmp_path, path)
+
+
+def read_manifest(path: str | os.PathLike[str]) -> list[SlideEntry]:
+    """Read a manifest written by :func:`write_manifest`.
+
+    Args:
+        path: The path to the JSON file.
+
+    Returns:
+        The entries of the slides.
+
+    Raises:
+        ValueError: If the file is not a manifest of slides.
+    """
+    with open(path, encoding="utf-8") as f:
+        data = json.load(f)
+    if not isinstance(data, dict) or data.get("version") != MANIFEST_VERSION:
+        raise ValueError(f"'{os.fspath(path)}' is not a manifest of slides")
+    return [SlideEntry(**entry) for entry in data["slides"]]
+
+
+def diff_manifests(old: list[SlideEntry], new: list[SlideEntry]) -> ManifestDiff:
+    """Compare the slides of two manifests.
+
+    Slides are matched by their content. Slides with the same content which
+    are not part of the longest matching sequence are reported as moved.
+    Remaining slides replaced at the same place are reported as changed, the
+    rest as added or removed.
+
+    Args:
+        old: The entries of the old manifest.
+        new: The entries of the new manifest.
+
+    Returns:
+        The differences.
+    """
+    matcher = difflib.SequenceMatcher(
+        a=[entry.hash for entry in old],
+        b=[entry.hash for entry in new],
+        autojunk=False,
+    )
+    replaced: list[tuple[list[SlideEntry], list[SlideEntry]]] = []
+    for tag, old_start, old_end, new_start, new_end in matcher.get_opcodes():
+        if tag != "equal":
+            replaced.append((old[old_start:old_end], new[new_start:new_end]))
+
+    unmatched: dict[str, list[SlideEntry]] = {}
+    for old_entries, _ in replaced:
+        for entry in old_entries:
+            unmatched.setdefault(entry.hash, []).append(entry)
+
+    diff = ManifestDiff()
+    for _, new_entries in replaced:
+        for entry in new_entries:
+            if candidates := unmatched.get(entry.hash):
+                diff.moved.append((candidates.pop(0), entry))
+    moved_old = {old_entry.index for old_entry, _ in diff.moved}
+    moved_new = {new_entry.index for _, new_entry in diff.moved}
+
+    for old_entries, new_entries in replaced:
+        old_left = [entry for entry in old_entries if entry.index not in moved_old]
+        new_left = [entry for entry in new_entries if entry.index not in moved_new]
+        paired = min(len(old_left), len(new_left))
+        diff.changed.extend(zip(old_left[:paired], new_left[:paired], strict=True))
+        diff.removed.extend(old_left[paired:])
+        diff.added.extend(new_left[paired:])
+    return diff
@@ -0,0 +1,113 @@
+import pickle
+from collections.abc import Callable, Iterator, Sequence
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from typing import Any
+
+from ludic.styles.themes import Theme, get_default_theme, set_default_theme
+
+from .cache import RenderCache, get_render_cache
+from .highlight import HighlightCache, get_highlight_cache, set_highlight_cache
+
+__all__ = ("render_parallel",)
+
+
+def _init_worker(theme: Theme, highlight_cache_dir: str | None) -> None:
+    set_default_theme(theme)
+    set_highlight_cache(HighlightCache(directory=highlight_cache_dir))
+
+
+def _render_pickled(data: bytes) -> str | None:
+    try:
+        slide = pickle.loads(data)  # noqa: S301
+    except (pickle.UnpicklingError, AttributeError, ImportError):
+        # e.g. components defined in a deck the worker cannot import
+        return None
+    return str(slide.to_html())
+
+
+def _lookup(
+    slides: Sequence[Any], cache: RenderCache | None
+) -> tuple[list[str | None], dict[int, str], list[bytes]] | None:
+    results: list[str | None] = []
+    keys: dict[int, str] = {}
+    pending: list[bytes] = []
+
+    for index, slide in enumerate(slides):
+        if isinstance(slide, str):
+            results.append(slide)
+            continue
+
+        html = None
+        if cache is not None:
+            keys[index] = cache.key(slide)
+            if (html := cache.get(keys[index])) is not None:
+                cache.hits += 1
+
+        if html is None:
+            try:
+                pending.append(pickle.dumps(slide))
+            except (pickle.PicklingError, AttributeError, TypeError):
+                return None
+        results.append(html)
+    return results, keys, pending
+
+
+def render_parallel(
+    slides: Sequence[Any], jobs: int, fallback: Callable[[int], Iterator[str]]
+) -> Iterator[str]:
+    """Render slides in a pool of worker processes.
+
+    Slides found in the render cache are not sent to the workers, the rendered
+    ones are stored in the cache. The results are yielded in the order of the
+    given slides, so the output is identical to rendering them one by one.
+
+    If some of the slides cannot be pickled, or the workers cannot unpickle
+    them (e.g. they use components defined in a module the workers cannot
+    import), the remaining slides are rendered in the current process.
+
+    Args:
+        slides: The slides to render, already rendered slides are passed through.
+        jobs: The number of worker processes.
+        fallback: Function rendering the slides from the given position on in
+            the current process.
+
+    Yields:
+        str: Rendered HTML of each slide in order
+    """
+    cache = get_render_cache()
+    if (lookup := _lookup(slides, cache)) is None:
+        yield from fallback(0)
+        return
+
+    results, keys, pending = lookup
+    if not pending:
+        yield from (html for html in results if html is not None)
+        return
+
+    highlight_cache_dir = get_highlight_cache().directory
+    with ProcessPoolExecutor(
+        max_workers=min(jobs, len(pending)),
+        initializer=_init_worker,
+        initargs=(
+            get_default_theme(),
+            str(highlight_cache_dir) if highlight_cache_dir else None,
+        ),
+    ) as executor:
+        chunksize = max(1, len(pending) // (jobs * 4))
+        rendered = executor.map(_render_pickled, pending, chunksize=chunksize)
+
+        for index, html in enumerate(results):
+            if html is None:
+                try:
+                    html = next(rendered)
+                except BrokenProcessPool:
+                    html = None
+                if html is None:
+                    executor.shutdown(cancel_futures=True)
+                    yield from fallback(index)
+                    return
+                if cache is not None:
+                    cache.misses += 1
+                    cache.set(keys[index], html)
+            yield html
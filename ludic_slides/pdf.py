@@ -0,0 +1,38 @@
+import os
+from typing import Any
+
+__all__ = ("write_pdf",)
+
+
+def write_pdf(
+    slides: Any,
+    output_file: str | os.PathLike[str],
+    base_url: str | None = None,
+    jobs: int = 1,
+) -> None:
+    """Write a slideshow to a PDF file with one slide per page.
+
+    The slideshow is rendered for printing (see the ``printable`` attribute of
+    :class:`ludic_slides.Slides`) and converted by WeasyPrint, so no browser is
+    needed, e.g. to export handouts in a CI job.
+
+    Args:
+        slides: The slideshow.
+        output_file: The path to the PDF file.
+        base_url: The base URL of relative links in the slides, e.g. the
+            directory containing the images.
+        jobs: Number of worker processes rendering the slides in parallel.
+
+    Raises:
+        ImportError: If the ``pdf`` extra is not installed.
+    """
+    try:
+        import weasyprint
+    except ImportError as e:
+        raise ImportError(
+            "Exporting PDF requires WeasyPrint, install ludic-slides[pdf]."
+        ) from e
+
+    printable = type(slides)(*slides.children, **{**slides.attrs, "printable": True})
+    html = "".join(printable.iter_html(jobs=jobs))
+    weasyprint.HTML(string=html, base_url=base_url).write_pdf(os.fspath(output_file))
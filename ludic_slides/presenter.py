@@ -0,0 +1,180 @@
+import json
+from html import escape
+from typing import Any
+
+from .components import Notes
+from .themes import get_slides_theme
+
+__all__ = (
+    "presenter_html",
+    "slide_notes",
+)
+
+PRESENTER_CSS = """
+body { margin: 0; font-family: sans-serif; background: #222; color: #eee; }
+.presenter {
+    display: grid;
+    grid-template-columns: 3fr 2fr;
+    gap: 1rem;
+    height: 100vh;
+    padding: 1rem;
+    box-sizing: border-box;
+}
+.presenter aside { display: flex; flex-direction: column; gap: 1rem; min-height: 0; }
+.presenter iframe { width: 100%; border: 0; background: #fff; pointer-events: none; }
+#current { height: 100%; }
+#next { flex: none; aspect-ratio: var(--aspect-ratio); }
+.status { display: flex; gap: 1rem; align-items: center; font-size: 1.5rem; }
+.status button { font-size: 1rem; }
+#timer { font-variant-numeric: tabular-nums; }
+#notes { overflow: auto; font-size: 1.25rem; line-height: 1.5; }
+"""
+
+PRESENTER_JAVASCRIPT = """
+document.addEventListener('DOMContentLoaded', () => {
+    const { audience, notes } = PRESENTER;
+    const count = notes.length;
+    const current = document.getElementById('current');
+    const next = document.getElementById('next');
+    const audiencePath = new URL(audience, window.location.href).pathname;
+
+    // The audience windows receive the current slide through a channel, or
+    // directly when opened from here (windows of files do not share a channel)
+    const channel = 'BroadcastChannel' in window
+        ? new BroadcastChannel(`ludic-slides:${audiencePath}`)
+        : null;
+    let audienceWindow = null;
+    let slide = 0;
+
+    const message = (n) => ({ type: 'ludic-slides', slide: n });
+
+    const updateFrames = () => {
+        current.contentWindow.postMessage(message(slide), '*');
+        if (slide < count) next.contentWindow.postMessage(message(slide + 1), '*');
+        next.style.visibility = slide < count ? 'visible' : 'hidden';
+    };
+
+    const show = (n, notify) => {
+        n = Math.min(Math.max(n, 1), count);
+        if (n === slide) return;
+        slide = n;
+        history.replaceState(null, '', `#${n}`);
+        updateFrames();
+        document.getElementById('notes').innerHTML = notes[n - 1];
+        document.getElementById('position').textContent = `${n} / ${count}`;
+        if (notify) {
+            channel?.postMessage(message(n));
+            if (audienceWindow && !audienceWindow.closed) {
+                audienceWindow.postMessage(message(n), '*');
+            }
+        }
+    };
+
+    const receive = (data) => {
+        if (data?.type === 'ludic-slides') show(data.slide, false);
+    };
+    channel?.addEventListener('message', (event) => receive(event.data));
+    window.addEventListener('message', (event) => {
+        const frames = [current.contentWindow, next.contentWindow];
+        if (!frames.includes(event.source)) receive(event.data);
+    });
+
+    const initial = parseInt(window.location.hash.slice(1), 10) || 1;
+    current.src = `${audience}?preview#${initial}`;
+    next.src = `${audience}?preview#${initial + 1}`;
+    current.addEventListener('load', updateFrames);
+    next.addEventListener('load', updateFrames);
+    show(initial, false);
+
+    document.getElementById('open').addEventListener('click', () => {
+        audienceWindow = window.open(`${audience}#${slide}`, 'ludic-slides-audience');
+    });
+
+    // The timer shows the time since the presenter view was opened, clicking
+    // it starts it again
+    const timer = document.getElementById('timer');
+    let start = Date.now();
+    const tick = () => {
+        const seconds = Math.floor((Date.now() - start) / 1000);
+        const minutes = String(Math.floor(seconds / 60)).padStart(2, '0');
+        timer.textContent = `${minutes}:${String(seconds % 60).padStart(2, '0')}`;
+    };
+    timer.addEventListener('click', () => {
+        start = Date.now();
+        tick();
+    });
+    setInterval(tick, 1000);
+
+    document.addEventListener('keydown', (event) => {
+        if (event.altKey || event.ctrlKey || event.metaKey) return;
+        if (event.key === 'ArrowRight' || event.key === 'PageDown') {
+            show(slide + 1, true);
+        } else if (event.key === 'ArrowLeft' || event.key === 'PageUp') {
+            show(slide - 1, true);
+        } else if (event.key === 'Home') {
+            show(1, true);
+        } else if (event.key === 'End') {
+            show(count, true);
+        } else {
+            return;
+        }
+        event.preventDefault();
+    });
+});
+"""
+
+
+def slide_notes(slides: Any) -> list[str]:
+    """Render the speaker notes of every slide of a slideshow.
+
+    Args:
+        slides: The slideshow.
+
+    Returns:
+        The rendered notes of each slide, empty for slides without notes.
+    """
+    return [
+        "".join(
+            child.to_html()
+            for child in getattr(slide, "children", ())
+            if isinstance(child, Notes)
+        )
+        for slide in slides.children
+    ]
+
+
+def presenter_html(slides: Any, audience_url: str) -> str:
+    """Render the presenter view of a slideshow.
+
+    The presenter view shows the current slide, a preview of the next slide,
+    the speaker notes (see :class:`ludic_slides.components.Notes`) and a timer.
+    Both slides are embedded from the slideshow shown to the audience. The
+    audience windows are kept in sync with the presenter view by messages
+    (``BroadcastChannel`` and ``postMessage``) rather than by polling, which
+    requires the slideshow to be rendered with ``presenter=True``.
+
+    Args:
+        slides: The slideshow.
+        audience_url: URL of the rendered slideshow relative to the presenter
+            view, e.g. ``slides.html``.
+
+    Returns:
+        The HTML document of the presenter view.
+    """
+    title = escape(str(slides.attrs.get("title", "My Slides")))
+    width, height = get_slides_theme().aspect_ratio
+    data = json.dumps({"audience": audience_url, "notes": slide_notes(slides)})
+    # the data must not close the script element it is embedded in
+    data = data.replace("</", "<\\/")
+    return (
+        '<!DOCTYPE html><html><head><meta charset="utf-8">'
+        f"<title>Presenter: {title}</title><style>{PRESENTER_CSS}</style></head>"
+        f'<body style="--aspect-ratio: {width} / {height}">'
+        '<main class="presenter"><iframe id="current" tabindex="-1"></iframe>'
+        '<aside><iframe id="next" tabindex="-1"></iframe><div class="status">'
+        '<span id="position"></span><button id="timer" title="Restart">00:00'
+        '</button><button id="open">Open slides</button></div>'
+        '<div id="notes"></div></aside></main>'
+        f"<script>const PRESENTER = {data};"
+        f"{PRESENTER_JAVASCRIPT}</script></body></html>"
+    )
@@ -0,0 +1,214 @@
+import json
+import os
+import threading
+import time
+from collections.abc import Iterator
+from contextlib import AbstractContextManager, contextmanager, nullcontext
+from contextvars import ContextVar, Token
+from dataclasses import dataclass
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    import cProfile
+
+__all__ = (
+    "RenderProfile",
+    "SlideProfile",
+    "get_profile",
+    "phase",
+)
+
+_profile: ContextVar["RenderProfile | None"] = ContextVar("profile", default=None)
+
+
+@dataclass
+class SlideProfile:
+    """Measurements of rendering a single slide.
+
+    Attributes:
+        index: The position of the slide, starting with one.
+        title: The text of the first header of the slide.
+        seconds: Time spent rendering the slide including highlighting.
+        size: Size of the rendered slide in bytes.
+    """
+
+    index: int
+    title: str = ""
+    seconds: float = 0.0
+    size: int = 0
+
+
+class RenderProfile:
+    """Measures where the time is spent when rendering slides.
+
+    The time is split into phases: loading the deck (``load``), rendering
+    the page with the theme styles (``styles``), rendering the slides
+    (``render``), highlighting code (``highlight``) and post-processing and
+    writing the output (``write``). Phases are exclusive, e.g. the time spent
+    highlighting code of a slide does not count towards ``render``. Every
+    slide is also measured individually.
+
+    Slides are rendered in the current process while a profile is active.
+
+    Example usage:
+        with RenderProfile() as profile:
+            slides.to_html()
+        print(profile.report())
+    """
+
+    def __init__(self, cprofile: bool = False) -> None:
+        """Initialize the profile.
+
+        Args:
+            cprofile: Whether to also collect function level statistics with
+                :mod:`cProfile`, see :meth:`write_stats`.
+        """
+        self.phases: dict[str, float] = {}
+        self.slides: list[SlideProfile] = []
+        self.events: list[dict[str, Any]] = []
+        self.seconds = 0.0
+        self._cprofile: cProfile.Profile | None = None
+        if cprofile:
+            from cProfile import Profile
+
+            self._cprofile = Profile()
+        self._origin = time.perf_counter()
+        self._stack: list[list[float]] = []
+        self._token: Token[RenderProfile | None] | None = None
+
+    def __enter__(self) -> "RenderProfile":
+        self._origin = time.perf_counter()
+        self._token = _profile.set(self)
+        if self._cprofile is not None:
+            self._cprofile.enable()
+        return self
+
+    def __exit__(self, *args: Any) -> None:
+        if self._cprofile is not None:
+            self._cprofile.disable()
+        self.seconds = time.perf_counter() - self._origin
+        if self._token is not None:
+            _profile.reset(self._token)
+            self._token = None
+
+    @contextmanager
+    def phase(self, name: str, **args: Any) -> Iterator[None]:
+        """Measure a phase of rendering.
+
+        Args:
+            name: The name of the phase.
+            **args: Details recorded in the trace, e.g. the slide index.
+        """
+        start = time.perf_counter()
+        # time spent in nested phases is subtracted from this one
+        self._stack.append([0.0])
+        try:
+            yield
+        finally:
+            elapsed = time.perf_counter() - start
+            nested = self._stack.pop()[0]
+            self.phases[name] = self.phases.get(name, 0.0) + elapsed - nested
+            if self._stack:
+                self._stack[-1][0] += elapsed
+            self.events.append(
+                {
+                    "name": name,
+                    "ph": "X",
+                    "ts": (start - self._origin) * 1e6,
+                    "dur": elapsed * 1e6,
+                    "pid": os.getpid(),
+                    "tid": threading.get_ident(),
+                    "args": args,
+                }
+            )
+
+    @contextmanager
+    def slide(self, index: int) -> Iterator[SlideProfile]:
+        """Measure rendering of a slide.
+
+        Args:
+            index: The position of the slide, starting with one.
+
+        Yields:
+            SlideProfile: Record to be completed with the title and size
+        """
+        record = SlideProfile(index)
+        start = time.perf_counter()
+        with self.phase("render", slide=index):
+            yield record
+        record.seconds = time.perf_counter() - start
+        self.slides.append(record)
+
+    def report(self, limit: int = 10) -> str:
+        """Format the slowest slides and the time spent in each phase.
+
+        Args:
+            limit: The number of slides to list.
+
+        Returns:
+            The report.
+        """
+        lines = [f"Slowest slides (of {len(self.slides)}):"]
+        lines.append(f"{'#':>6}  {'time':>10}  {'size':>10}  title")
+        slowest = sorted(self.slides, key=lambda slide: slide.seconds, reverse=True)
+        for slide in slowest[:limit]:
+            lines.append(
+                f"{slide.index:>6}  {slide.seconds * 1000:>7.1f} ms  "
+                f"{slide.size / 1024:>7.1f} kB  {slide.title}"
+            )
+
+        total = self.seconds or sum(self.phases.values())
+        lines.append("Time by phase:")
+        for name, seconds in sorted(
+            self.phases.items(), key=lambda item: item[1], reverse=True
+        ):
+            share = seconds / total * 100 if total else 0.0
+            lines.append(f"{name:>10}  {seconds * 1000:>7.1f} ms  {share:>5.1f} %")
+        lines.append(f"{'total':>10}  {total * 1000:>7.1f} ms")
+        return "\n".join(lines)
+
+    def write_chrome_trace(self, path: str) -> None:
+        """Write the phases as trace events viewable in Chrome or Perfetto.
+
+        Args:
+            path: The path to the JSON file.
+        """
+        with open(path, "w", encoding="utf-8") as f:
+            json.dump({"traceEvents": self.events, "displayTimeUnit": "ms"}, f)
+
+    def write_stats(self, path: str) -> None:
+        """Write the cProfile statistics, e.g. for ``python -m pstats`` or snakeviz.
+
+        Args:
+            path: The path to the statistics file.
+
+        Raises:
+            ValueError: If the profile was created without cProfile enabled.
+        """
+        if self._cprofile is None:
+            raise ValueError("The profile was created without cprofile=True.")
+        self._cprofile.dump_stats(path)
+
+
+def get_profile() -> RenderProfile | None:
+    """Return the active profile, if any.
+
+    Returns:
+        The profile activated with a ``with`` statement in the current context.
+    """
+    return _profile.get()
+
+
+def phase(name: str, **args: Any) -> AbstractContextManager[None]:
+    """Measure a phase of rendering if a profile is active.
+
+    Args:
+        name: The name of the phase.
+        **args: Details recorded in the trace.
+
+    Returns:
+        A context manager measuring the phase.
+    """
+    if (profile := _profile.get()) is None:
+        return nullcontext()
+    return profile.phase(name, **args)
@@ -0,0 +1,95 @@
+import json
+import re
+import unicodedata
+from collections.abc import Iterator
+from html import unescape
+
+from .export import slide_title
+
+__all__ = (
+    "SearchIndex",
+    "tokenize",
+)
+
+# id of the script element containing the index in the rendered slideshow
+INDEX_ELEMENT_ID = "slides-search-index"
+
+_IGNORED_RE = re.compile(r"<(script|style)\b[^>]*>.*?</\1>", re.DOTALL | re.IGNORECASE)
+_TAG_RE = re.compile(r"<[^>]+>")
+_WORD_RE = re.compile(r"\w+")
+
+
+def tokenize(text: str) -> Iterator[str]:
+    """Split text into the words which are searched for.
+
+    Words are lower cased and accents are removed, the same normalization is
+    applied to queries by the search in the browser.
+
+    Args:
+        text: The text.
+
+    Yields:
+        The words of the text.
+    """
+    decomposed = unicodedata.normalize("NFKD", text)
+    plain = "".join(char for char in decomposed if not unicodedata.combining(char))
+    yield from _WORD_RE.findall(plain.lower())
+
+
+class SearchIndex:
+    """An inverted index of the words on the slides of a slideshow.
+
+    Each word is mapped to the numbers of the slides containing it. The slide
+    numbers are delta encoded (the first number followed by the differences
+    to the previous ones), which keeps the index small for large slideshows.
+
+    Example usage:
+        index = SearchIndex()
+        for fragment in slides.render_slides():
+            index.add(fragment)
+        data = index.to_json()
+    """
+
+    def __init__(self) -> None:
+        self.titles: list[str] = []
+        self._last: dict[str, int] = {}
+        self._postings: dict[str, list[int]] = {}
+
+    def add(self, fragment: str) -> None:
+        """Index the next slide.
+
+        Args:
+            fragment: The rendered slide.
+        """
+        number = len(self.titles) + 1
+        self.titles.append(slide_title(fragment, number))
+        text = unescape(_TAG_RE.sub(" ", _IGNORED_RE.sub(" ", fragment)))
+        for word in set(tokenize(text)):
+            previous = self._last.get(word, 0)
+            self._postings.setdefault(word, []).append(number - previous)
+            self._last[word] = number
+
+    def to_json(self) -> str:
+        """Serialize the index.
+
+        Returns:
+            JSON with the ``titles`` of the slides and the delta encoded slide
+            numbers of every word in ``words``.
+        """
+        return json.dumps(
+            {"titles": self.titles, "words": self._postings},
+            ensure_ascii=False,
+            separators=(",", ":"),
+        )
+
+    def script(self) -> str:
+        """Render the index as a data block to embed in the slideshow.
+
+        Returns:
+            A script element of type ``application/json``.
+        """
+        # the data must not close the script element it is embedded in
+        data = self.to_json().replace("</", "<\\/")
+        return (
+            f'<script type="application/json" id="{INDEX_ELEMENT_ID}">{data}</script>'
+        )
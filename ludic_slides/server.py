@@ -0,0 +1,296 @@
+import json
+import os
+import posixpath
+import threading
+from functools import partial
+from html import unescape
+from http import HTTPStatus
+from http.server import SimpleHTTPRequestHandler, ThreadingHTTPServer
+from typing import Any
+from urllib.parse import parse_qs, unquote, urlsplit
+
+from .assets import iter_references
+from .cache import RenderCache, get_render_cache, set_render_cache
+from .cli import SlidesError, load_slides, watch_deck_files
+from .watch import FileWatcher
+
+__all__ = ("SlidesServer",)
+
+LIVE_RELOAD_JAVASCRIPT = """
+(() => {
+    let version = %(version)d;
+    const source = new EventSource(`/events?v=${version}`);
+
+    source.addEventListener('reload', () => window.location.reload());
+
+    source.addEventListener('update', (event) => {
+        const data = JSON.parse(event.data);
+        if (data.version !== version + 1) {
+            window.location.reload();
+            return;
+        }
+        version = data.version;
+
+        // the root element of the page has the class of the slideshow as well
+        const container = document.querySelector('div.slides');
+        const slides = [...container.children];
+        const template = document.createElement('template');
+
+        for (const [index, html] of Object.entries(data.slides)) {
+            template.innerHTML = html;
+            const slide = template.content.firstElementChild;
+            if (slides[index]) {
+                slides[index].replaceWith(slide);
+            } else {
+                container.appendChild(slide);
+            }
+        }
+        for (let index = data.count; index < slides.length; index++) {
+            slides[index].remove();
+        }
+
+        window.ludicSlides?.refresh();
+    });
+})();
+"""
+
+
+def _local_path(url: str) -> str | None:
+    parts = urlsplit(url)
+    if parts.scheme or parts.netloc or not parts.path:
+        return None
+    path = posixpath.normpath("/" + unquote(unescape(parts.path)))
+    return path.lstrip("/")
+
+
+class SlidesRequestHandler(SimpleHTTPRequestHandler):
+    """Serves the slides, the live reload events and the files they reference.
+
+    Other files in the directory of the deck, e.g. its Python source, are not
+    served.
+    """
+
+    server: "SlidesServer"
+
+    def do_GET(self) -> None:
+        parts = urlsplit(self.path)
+        if parts.path in ("/", "/index.html"):
+            self.send_page()
+        elif parts.path == "/events":
+            self.send_events(parse_qs(parts.query).get("v", [""])[0])
+        elif _local_path(self.path) in self.server.files:
+            super().do_GET()
+        else:
+            self.send_error(HTTPStatus.NOT_FOUND)
+
+    def do_HEAD(self) -> None:
+        if _local_path(self.path) in self.server.files:
+            super().do_HEAD()
+        else:
+            self.send_error(HTTPStatus.NOT_FOUND)
+
+    def send_page(self) -> None:
+        content = self.server.page.encode("utf-8")
+        self.send_response(HTTPStatus.OK)
+        self.send_header("Content-Type", "text/html; charset=utf-8")
+        self.send_header("Content-Length", str(len(content)))
+        self.send_header("Cache-Control", "no-store")
+        self.end_headers()
+        self.wfile.write(content)
+
+    def send_events(self, client_version: str = "") -> None:
+        # changes made after the browser loaded the page are sent right away
+        version = int(client_version) if client_version.isdigit() else None
+        if version is None:
+            version = self.server.version
+        self.send_response(HTTPStatus.OK)
+        self.send_header("Content-Type", "text/event-stream")
+        self.send_header("Cache-Control", "no-store")
+        self.end_headers()
+
+        try:
+            while not self.server.stopped:
+                version, event = self.server.wait_for_event(version, timeout=15)
+                if event is None:
+                    self.wfile.write(b": keep-alive\n\n")
+                else:
+                    name, data = event
+                    self.wfile.write(f"event: {name}\ndata: {data}\n\n".encode())
+                self.wfile.flush()
+        except OSError:
+            pass
+
+
+class SlidesServer(ThreadingHTTPServer):
+    """A development server with live reload.
+
+    Serves slides loaded from a Python file over HTTP and renders them again
+    every time the file changes. Connected browsers are notified through
+    server-sent events and receive only the slides that changed, which they
+    swap in place, so the current slide is preserved. If anything else than
+    the slides changes (e.g. the title or styles), browsers reload the page.
+
+    Example usage:
+        server = SlidesServer("slides.py", port=8000)
+        server.serve_forever()
+    """
+
+    daemon_threads = True
+
+    def __init__(
+        self,
+        python_input_file: str,
+        slides_variable: str = "slides",
+        host: str = "127.0.0.1",
+        port: int = 8000,
+    ) -> None:
+        """Initialize the server and render the slides for the first time.
+
+        Args:
+            python_input_file: The path to the Python file.
+            slides_variable: The name of the variable containing the slides object.
+            host: The host to bind to.
+            port: The port to bind to, zero picks a free port.
+        """
+        self.python_input_file = python_input_file
+        self.slides_variable = slides_variable
+        self.version = 0
+        self.page = ""
+        self.files: set[str] = set()
+        self.stopped = False
+        self._shell: str | None = None
+        self._fragments: list[str] = []
+        self._event: tuple[str, str] | None = None
+        self._condition = threading.Condition()
+
+        if get_render_cache() is None:
+            set_render_cache(RenderCache())
+
+        directory = os.path.dirname(os.path.abspath(python_input_file))
+        handler = partial(SlidesRequestHandler, directory=directory)
+        super().__init__((host, port), handler)
+        self.rebuild()
+
+    @property
+    def url(self) -> str:
+        """The URL the server listens on."""
+        host, port = self.server_address[:2]
+        return f"http://{host!s}:{port}/"
+
+    def rebuild(self) -> None:
+        """Render the slides and notify connected browsers about changes.
+
+        Raises:
+            SlidesError: If the slides cannot be loaded or rendered.
+        """
+        slides = load_slides(self.python_input_file, self.slides_variable)
+        try:
+            head, *fragments, tail = slides.iter_html()
+        except Exception as e:
+            raise SlidesError(
+                f"Error calling 'to_html' on variable '{self.slides_variable}' "
+                f"within file '{self.python_input_file}': {e}"
+            )
+
+        with self._condition:
+            shell = head + tail
+            if shell != self._shell:
+                event = ("reload", "{}")
+            else:
+                changed = {
+                    index: fragment
+                    for index, fragment in enumerate(fragments)
+                    if index >= len(self._fragments)
+                    or self._fragments[index] != fragment
+                }
+                if not changed and len(fragments) == len(self._fragments):
+                    return
+                data = {
+                    "version": self.version + 1,
+                    "count": len(fragments),
+                    "slides": changed,
+                }
+                event = ("update", json.dumps(data))
+
+            self.version += 1
+            script = LIVE_RELOAD_JAVASCRIPT % {"version": self.version}
+            page = "".join((head, *fragments, tail))
+            self.page = page.replace("</body>", f"<script>{script}</script></body>")
+            self.files = {
+                path for url in iter_references(self.page) if (path := _local_path(url))
+            }
+            self._shell = shell
+            self._fragments = fragments
+            self._event = event
+            self._condition.notify_all()
+
+    def wait_for_event(
+        self, version: int, timeout: float | None = None
+    ) -> tuple[int, tuple[str, str] | None]:
+        """Wait until the slides change after the given version.
+
+        Args:
+            version: The last version seen by the caller.
+            timeout: Maximum time to wait in seconds.
+
+        Returns:
+            The current version and the event to send to the browser, or no
+            event if the timeout expired. Browsers which missed more than one
+            version are asked to reload.
+        """
+        with self._condition:
+            self._condition.wait_for(
+                lambda: self.version != version or self.stopped, timeout
+            )
+            if self.version == version:
+                return version, None
+            if self.version == version + 1 and self._event is not None:
+                return self.version, self._event
+            return self.version, ("reload", "{}")
+
+    def watch(self, interval: float = 0.1) -> None:
+        """Rebuild the slides every time the Python file or a module it imports changes.
+
+        Blocks until the server is shut down.
+
+        Args:
+            interval: Polling interval in seconds when inotify is not available.
+        """
+        watcher = FileWatcher([self.python_input_file], interval=interval)
+        try:
+            while not self.stopped:
+                watch_deck_files(watcher, self.python_input_file)
+                if not watcher.wait(timeout=0.5):
+                    continue
+                try:
+                    self.rebuild()
+                except SlidesError as e:
+                    print(e)
+                else:
+                    print(f"Slides updated (version {self.version})")
+        finally:
+            watcher.close()
+
+    def serve(self) -> None:
+        """Serve the slides and watch the Python file until interrupted."""
+        watcher = threading.Thread(target=self.watch, daemon=True)
+        watcher.start()
+        try:
+            self.serve_forever()
+        finally:
+            self.stop()
+            watcher.join()
+
+    def stop(self) -> None:
+        """Stop watching the file and disconnect browsers."""
+        with self._condition:
+            self.stopped = True
+            self._condition.notify_all()
+
+    def shutdown(self) -> None:
+        self.stop()
+        super().shutdown()
+
+    def __exit__(self, *args: Any) -> None:
+        self.stop()
+        super().__exit__(*args)
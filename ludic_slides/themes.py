@@ -1,7 +1,29 @@
+import functools
+import weakref
+from collections.abc import Callable
 from dataclasses import dataclass, field
 
-from ludic.styles.themes import Borders, Fonts, Header, Headers, Sizes, Theme
-from ludic.styles.types import Size
+from ludic.styles.themes import (
+    Borders,
+    Fonts,
+    Header,
+    Headers,
+    Sizes,
+    Theme,
+    get_default_theme,
+    set_default_theme,
+)
+from ludic.styles.types import GlobalStyles, Size
+
+__all__ = (
+    "SlidesTheme",
+    "get_slides_theme",
+    "invalidate_styles",
+    "themed_styles",
+)
+
+# caches of all functions decorated with themed_styles, keyed by theme identity
+_style_caches: list[dict[int, tuple[weakref.ref[Theme], GlobalStyles]]] = []
 
 
 @dataclass
@@ -55,3 +77,77 @@ class SlidesTheme(Theme):
             xxxxl=Size(6, "vmin"),
         )
     )
+
+
+def get_slides_theme() -> SlidesTheme:
+    """Return the default theme if it is a slides theme.
+
+    Returns:
+        The default theme, or a new :class:`SlidesTheme` if the default theme
+        was replaced by a theme without the slide specific settings.
+    """
+    theme = get_default_theme()
+    return theme if isinstance(theme, SlidesTheme) else SlidesTheme()
+
+
+def themed_styles[T: Theme](
+    function: Callable[[T], GlobalStyles],
+) -> Callable[[T], GlobalStyles]:
+    """Memoize styles computed from a theme.
+
+    The styles are computed once per theme object and process and reused by
+    subsequent renders and builds. Themes are compared by identity, so
+    switching to another theme computes its styles. If a theme is modified
+    in place, call :func:`invalidate_styles`.
+
+    Example usage:
+        styles = style[SlidesTheme].use(
+            themed_styles(lambda theme: {".slide": {"color": theme.colors.dark}})
+        )
+
+    Args:
+        function: Function computing the styles from a theme.
+
+    Returns:
+        The memoized function.
+    """
+    cache: dict[int, tuple[weakref.ref[Theme], GlobalStyles]] = {}
+    _style_caches.append(cache)
+
+    def forget(key: int, ref: weakref.ref[Theme]) -> None:
+        if (entry := cache.get(key)) is not None and entry[0] is ref:
+            del cache[key]
+
+    @functools.wraps(function)
+    def compiled(theme: T) -> GlobalStyles:
+        key = id(theme)
+        if (entry := cache.get(key)) is not None and entry[0]() is theme:
+            return entry[1]
+
+        styles = function(theme)
+        try:
+            ref: weakref.ref[Theme] = weakref.ref(theme, lambda ref: forget(key, ref))
+        except TypeError:
+            return styles
+        cache[key] = (ref, styles)
+        return styles
+
+    return compiled
+
+
+def invalidate_styles(theme: Theme | None = None) -> None:
+    """Discard memoized styles, e.g. after a theme was modified in place.
+
+    Args:
+        theme: The theme whose styles are discarded, all if not given.
+    """
+    for cache in _style_caches:
+        if theme is None:
+            cache.clear()
+        else:
+            cache.pop(id(theme), None)
+
+
+# the slides theme becomes the default as soon as ludic is used through this
+# package, i.e. when any of the components or the themes are imported
+set_default_theme(SlidesTheme())
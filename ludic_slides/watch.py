@@ -0,0 +1,175 @@
+import ctypes
+import ctypes.util
+import os
+import select
+import sys
+import time
+from collections.abc import Iterable
+from pathlib import Path
+
+__all__ = ("FileWatcher",)
+
+_IN_MODIFY = 0x00000002
+_IN_CLOSE_WRITE = 0x00000008
+_IN_MOVED_TO = 0x00000080
+_IN_CREATE = 0x00000100
+_IN_NONBLOCK = 0x00000800
+_IN_CLOEXEC = 0x00080000
+_DEBOUNCE = 0.01
+
+
+def _load_inotify() -> ctypes.CDLL | None:
+    if not sys.platform.startswith("linux"):
+        return None
+    try:
+        libc = ctypes.CDLL(ctypes.util.find_library("c"), use_errno=True)
+        libc.inotify_init1.argtypes = [ctypes.c_int]
+        libc.inotify_add_watch.argtypes = [
+            ctypes.c_int,
+            ctypes.c_char_p,
+            ctypes.c_uint32,
+        ]
+    except (OSError, AttributeError):
+        return None
+    return libc
+
+
+class FileWatcher:
+    """Waits for changes of a set of files.
+
+    Uses inotify on Linux and falls back to polling file metadata elsewhere or
+    when inotify is not available. Directories containing the files are
+    watched rather than the files themselves, because editors often replace
+    files instead of writing into them.
+
+    Example usage:
+        watcher = FileWatcher(["slides.py"])
+        while True:
+            changed = watcher.wait()
+            ...
+    """
+
+    def __init__(
+        self,
+        paths: Iterable[str | os.PathLike[str]],
+        interval: float = 0.1,
+        use_inotify: bool = True,
+    ) -> None:
+        """Initialize the watcher.
+
+        Args:
+            paths: The files to watch.
+            interval: Polling interval in seconds when inotify is not used.
+            use_inotify: Whether inotify may be used when available.
+        """
+        self.interval = interval
+        self._paths: set[Path] = set()
+        self._stats: dict[Path, tuple[int, int, int] | None] = {}
+        self._fd: int | None = None
+        self._watched_dirs: set[Path] = set()
+
+        if use_inotify and (libc := _load_inotify()) is not None:
+            fd = libc.inotify_init1(_IN_NONBLOCK | _IN_CLOEXEC)
+            if fd >= 0:
+                self._libc = libc
+                self._fd = fd
+
+        self.update(paths)
+
+    @property
+    def paths(self) -> set[Path]:
+        """The resolved paths of the watched files."""
+        return set(self._paths)
+
+    @property
+    def uses_inotify(self) -> bool:
+        """Whether the watcher uses inotify instead of polling."""
+        return self._fd is not None
+
+    def update(self, paths: Iterable[str | os.PathLike[str]]) -> None:
+        """Replace the set of watched files.
+
+        Files which were watched before keep their last known state, so
+        changes made in the meantime are still reported.
+
+        Args:
+            paths: The files to watch.
+        """
+        self._paths = {Path(path).resolve() for path in paths}
+        self._stats = {
+            path: self._stats[path] if path in self._stats else self._stat(path)
+            for path in self._paths
+        }
+
+        if self._fd is not None:
+            for directory in {path.parent for path in self._paths}:
+                if directory in self._watched_dirs:
+                    continue
+                mask = _IN_CLOSE_WRITE | _IN_MOVED_TO | _IN_CREATE | _IN_MODIFY
+                wd = self._libc.inotify_add_watch(
+                    self._fd, os.fsencode(directory), mask
+                )
+                if wd < 0:
+                    self.close()
+                    break
+                self._watched_dirs.add(directory)
+
+    def close(self) -> None:
+        """Release the inotify file descriptor, if any."""
+        if self._fd is not None:
+            os.close(self._fd)
+            self._fd = None
+            self._watched_dirs.clear()
+
+    @staticmethod
+    def _stat(path: Path) -> tuple[int, int, int] | None:
+        try:
+            stat = path.stat()
+        except OSError:
+            return None
+        return stat.st_mtime_ns, stat.st_size, stat.st_ino
+
+    def _changed(self) -> set[Path]:
+        changed = set()
+        for path in self._paths:
+            if (stat := self._stat(path)) != self._stats.get(path):
+                self._stats[path] = stat
+                changed.add(path)
+        return changed
+
+    def _drain_events(self) -> None:
+        assert self._fd is not None
+        while True:
+            try:
+                data = os.read(self._fd, 64 * 1024)
+            except BlockingIOError:
+                return
+            if not data:
+                return
+
+    def wait(self, timeout: float | None = None) -> set[Path]:
+        """Block until at least one of the watched files changes.
+
+        Args:
+            timeout: Maximum time to wait in seconds, wait forever if None.
+
+        Returns:
+            The set of changed files, empty if the timeout expired.
+        """
+        deadline = None if timeout is None else time.monotonic() + timeout
+        while True:
+            remaining = None if deadline is None else deadline - time.monotonic()
+            if remaining is not None and remaining <= 0:
+                return set()
+
+            if self._fd is not None:
+                ready, _, _ = select.select([self._fd], [], [], remaining)
+                if ready:
+                    # debounce bursts of events caused by a single save
+                    time.sleep(_DEBOUNCE)
+                    self._drain_events()
+            else:
+                time.sleep(min(self.interval, remaining or self.interval))
+
+            if changed := self._changed():
+                return changed
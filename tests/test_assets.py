@@ -0,0 +1,46 @@
+from pathlib import Path
+
+from ludic_slides.assets import AssetPipeline
+
+
+def test_asset_pipeline(tmp_path: Path) -> None:
+    source = tmp_path / "source"
+    (source / "images").mkdir(parents=True)
+    (source / "images" / "logo.png").write_bytes(b"logo" * 100)
+    (source / "copy.png").write_bytes(b"logo" * 100)
+    (source / "icon.svg").write_bytes(b"<svg/>")
+
+    pipeline = AssetPipeline(source, tmp_path / "out", inline_limit=10)
+    html = pipeline.rewrite(
+        '<img src="images/logo.png"><img src="copy.png">'
+        '<img src="https://example.com/logo.png"><img src="missing.png">'
+        "<div style=\"background: url('icon.svg')\"></div>"
+    )
+    pipeline.save()
+
+    name = html.split('"')[1]
+    assert name.startswith("assets/") and name.endswith(".png")
+    assert html.count(name) == 2
+    assert '"https://example.com/logo.png"' in html
+    assert '"missing.png"' in html
+    assert "url('data:image/svg+xml;base64," in html
+    assert pipeline.copied == 1
+    assert [p.name for p in (tmp_path / "out" / "assets").glob("*.png")] == [
+        name.removeprefix("assets/")
+    ]
+
+    pipeline = AssetPipeline(source, tmp_path / "out")
+    assert pipeline.rewrite('<img src="copy.png">') == f'<img src="{name}">'
+    assert pipeline.copied == 0
+
+
+def test_asset_pipeline_outside_source(tmp_path: Path) -> None:
+    source = tmp_path / "source"
+    source.mkdir()
+    (tmp_path / "secret.txt").write_text("secret")
+
+    pipeline = AssetPipeline(source, tmp_path / "out")
+    html = f'<img src="../secret.txt"><img src="{tmp_path / "secret.txt"}">'
+
+    assert pipeline.rewrite(html) == html
+    assert pipeline.copied == 0
@@ -0,0 +1,31 @@
+from benchmarks.decks import generate_slides
+from benchmarks.run import find_regressions, run_benchmarks
+
+
+def test_generate_slides() -> None:
+    slides = generate_slides(10, code_lines=3)
+    assert len(slides.children) == 10
+    assert slides.to_html() == generate_slides(10, code_lines=3).to_html()
+
+
+def test_run_benchmarks() -> None:
+    report = run_benchmarks(["to_html", "cli"], slides=5, code_lines=2, repeat=1)
+
+    for result in report["results"].values():
+        assert result["wall_time"] > 0
+        assert result["output_bytes"] > 0
+
+    assert find_regressions(report, report, threshold=0) == []
+    slower = {"results": {"cli": {**report["results"]["cli"], "wall_time": 1e-9}}}
+    assert find_regressions(report, slower, threshold=10) == [
+        f"cli: wall_time increased by "
+        f"{(report['results']['cli']['wall_time'] / 1e-9 - 1) * 100:.1f}%"
+    ]
+
+
+def test_memory_benchmark() -> None:
+    report = run_benchmarks(["memory"], slides=5, code_lines=2, repeat=1)
+
+    memory = report["results"]["memory"]
+    assert memory["deck_bytes"] > memory["compact_bytes"] > 0
+    assert memory["render_bytes"] > 0
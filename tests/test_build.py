@@ -0,0 +1,107 @@
+from pathlib import Path
+
+import pytest
+
+from ludic_slides.build import build_decks, discover_decks
+from ludic_slides.cli import BuildOptions, SlidesError, main
+from ludic_slides.loader import module_dependencies
+
+DECK = """
+from ludic_slides import Slide, Slides
+from ludic_slides.components import Header
+
+from common import TITLE
+
+slides = Slides(Slide(Header(TITLE)))
+"""
+
+
+@pytest.fixture
+def decks(tmp_path: Path) -> Path:
+    root = tmp_path / "decks"
+    (root / "talks").mkdir(parents=True)
+    (root / "common.py").write_text("TITLE = 'Hello'\n")
+    (root / "intro.py").write_text(DECK)
+    (root / "talks" / "common.py").write_text("TITLE = 'Talk'\n")
+    (root / "talks" / "talk.py").write_text(DECK.replace("slides =", "talk ="))
+    (root / "_private.py").write_text(DECK)
+    return root
+
+
+def test_discover_decks(decks: Path, tmp_path: Path) -> None:
+    site = tmp_path / "site"
+    found = discover_decks(
+        [str(decks), f"{decks / 'talks' / 'talk.py'}:talk"], str(site)
+    )
+
+    assert [(deck.python_input_file, deck.output_file) for deck in found] == [
+        (str(decks / "intro.py"), str(site / "intro.html")),
+        (str(decks / "talks" / "talk.py"), str(site / "talk.talk.html")),
+    ]
+
+
+def test_discover_decks_same_output(decks: Path, tmp_path: Path) -> None:
+    (decks / "talks" / "intro.py").write_text(DECK)
+
+    with pytest.raises(SlidesError, match="are both written to"):
+        discover_decks([str(decks), str(decks / "talks")], str(tmp_path / "site"))
+
+
+def test_module_dependencies(decks: Path) -> None:
+    assert module_dependencies(str(decks / "talks" / "talk.py")) == [
+        decks / "talks" / "common.py",
+        decks / "talks" / "talk.py",
+    ]
+
+
+def test_build_decks_skips_unchanged(decks: Path, tmp_path: Path) -> None:
+    site = str(tmp_path / "site")
+    found = discover_decks([str(decks)], site)
+
+    def statuses() -> list[str]:
+        return [result.status for result in build_decks(found, site)]
+
+    assert statuses() == ["built"]
+    assert statuses() == ["skipped"]
+
+    (decks / "common.py").write_text("TITLE = 'Changed'\n")
+    assert statuses() == ["built"]
+
+
+@pytest.mark.parametrize("assets", [None, "copy"])
+def test_build_decks_referenced_files(
+    decks: Path, tmp_path: Path, assets: str | None
+) -> None:
+    site = str(tmp_path / "site")
+    (decks / "logo.svg").write_text("<svg/>")
+    (decks / "intro.py").write_text(
+        DECK.replace("Header(TITLE)", "Header(TITLE), img(src='logo.svg')").replace(
+            "from common", "from ludic.html import img\nfrom common"
+        )
+    )
+    found = discover_decks([str(decks)], site)
+    options = BuildOptions(assets=assets)
+
+    def statuses() -> list[str]:
+        return [result.status for result in build_decks(found, site, options)]
+
+    assert statuses() == ["built"]
+    assert statuses() == ["skipped"]
+
+    (decks / "logo.svg").write_text("<svg></svg>")
+    assert statuses() == ["built"]
+
+
+def test_main_build(
+    decks: Path, tmp_path: Path, capsys: pytest.CaptureFixture[str]
+) -> None:
+    site = tmp_path / "site"
+    (decks / "broken.py").write_text("slides = undefined\n")
+
+    with pytest.raises(SystemExit):
+        main(["build", str(decks), "--out", str(site), "--jobs", "2"])
+
+    output = capsys.readouterr().out
+    assert "Rendered" in output
+    assert "Error loading file" in output
+    assert "Hello" in (site / "intro.html").read_text()
@@ -0,0 +1,81 @@
+import subprocess
+import sys
+from pathlib import Path
+
+from ludic_slides import Slide, Slides
+from ludic_slides.cache import RenderCache, fingerprint, set_render_cache
+from ludic_slides.components import CodeBlock, Header, Paragraph
+
+
+def test_fingerprint() -> None:
+    assert fingerprint(Slide(Header("A"), Paragraph("B"))) == fingerprint(
+        Slide(Header("A"), Paragraph("B"))
+    )
+    assert fingerprint(Slide(Header("A"), Paragraph("B"))) != fingerprint(
+        Slide(Header("A"), Paragraph("C"))
+    )
+
+
+def test_fingerprint_classes_and_styles() -> None:
+    class Note(Paragraph):
+        classes = ["note"]
+
+    class Alert(Paragraph):
+        classes = ["alert"]
+
+    class Styled(Paragraph):
+        styles = {".styled": {"color": "red"}}
+
+    fingerprints = {
+        fingerprint(component("A")) for component in (Paragraph, Note, Alert, Styled)
+    }
+    assert len(fingerprints) == 4
+
+
+def test_fingerprint_across_processes() -> None:
+    code = (
+        "from ludic_slides.cache import fingerprint\n"
+        "from ludic_slides.components import Item, List, Table, TableHead, TableRow\n"
+        "print(fingerprint(List(Item('A'))))\n"
+        "print(fingerprint(Table(TableHead('A'), TableRow('B'))))\n"
+    )
+    outputs = [
+        subprocess.run(  # noqa: S603
+            [sys.executable, "-c", code], capture_output=True, check=True, text=True
+        ).stdout
+        for _ in range(2)
+    ]
+    assert outputs[0] == outputs[1]
+
+
+def test_render_cache(tmp_path: Path) -> None:
+    text = Slide(Header("Text"), Paragraph("Hello"))
+    slides = Slides(
+        Slide(Header("Code"), CodeBlock("x = 1", language="python")),
+        text,
+    )
+    expected = slides.to_html()
+
+    cache = RenderCache(directory=tmp_path)
+    set_render_cache(cache)
+    try:
+        assert slides.to_html() == expected
+        assert (cache.hits, cache.misses) == (0, 2)
+        assert slides.to_html() == expected
+        assert (cache.hits, cache.misses) == (2, 2)
+    finally:
+        set_render_cache(None)
+
+    persisted = RenderCache(directory=tmp_path)
+    assert persisted.render(text) == text.to_html()
+    assert persisted.hits == 1
+
+
+def test_render_cache_eviction() -> None:
+    cache = RenderCache(max_entries=2)
+    for text in ("A", "B", "C"):
+        cache.render(Slide(Header(text)))
+    assert len(cache) == 2
+
+    cache.render(Slide(Header("A")))
+    assert cache.misses == 4
@@ -0,0 +1,69 @@
+import sys
+from pathlib import Path
+
+import pytest
+
+from ludic_slides.cli import (
+    BuildOptions,
+    SlidesError,
+    build_slides,
+    load_slides,
+    main,
+)
+
+DECK = """
+from ludic_slides import Slide, Slides
+from ludic_slides.components import Header
+
+slides = Slides(Slide(Header("Hello")))
+"""
+
+
+@pytest.fixture
+def deck(tmp_path: Path) -> Path:
+    path = tmp_path / "deck.py"
+    path.write_text(DECK)
+    return path
+
+
+def test_main(deck: Path) -> None:
+    main([str(deck)])
+    assert "Hello" in deck.with_suffix(".html").read_text()
+
+
+def test_load_slides_missing_variable(deck: Path) -> None:
+    with pytest.raises(SlidesError, match="does not contain a variable"):
+        load_slides(str(deck), "other")
+
+
+def test_main_print(deck: Path) -> None:
+    main([str(deck), "--print"])
+    html = deck.with_suffix(".html").read_text()
+
+    assert "@page" in html
+    assert "<script" not in html
+
+
+def test_build_pdf_without_extra(
+    deck: Path, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    monkeypatch.setitem(sys.modules, "weasyprint", None)
+
+    with pytest.raises(SlidesError, match=r"install ludic-slides\[pdf\]"):
+        build_slides(str(deck), output_file=str(tmp_path / "deck.pdf"))
+
+
+def test_build_overflow(tmp_path: Path, capsys: pytest.CaptureFixture[str]) -> None:
+    path = tmp_path / "deck.py"
+    path.write_text(DECK.replace('Header("Hello")', 'Header("Hello"), "text " * 2000'))
+
+    with pytest.raises(SlidesError, match="1 slide"):
+        build_slides(str(path), options=BuildOptions(overflow="error"))
+    assert "Slide 1 (Hello)" in capsys.readouterr().err
+
+    build_slides(
+        str(path),
+        output_file=str(tmp_path / "deck.html"),
+        options=BuildOptions(overflow="fit"),
+    )
+    assert "--slide-scale" in (tmp_path / "deck.html").read_text()
@@ -0,0 +1,44 @@
+import gzip
+import os
+from pathlib import Path
+
+import pytest
+
+from ludic_slides.cli import main
+from ludic_slides.compress import available_formats, compress_file
+
+
+def test_compress_file(tmp_path: Path) -> None:
+    path = tmp_path / "slides.html"
+    path.write_bytes(b"<p>slide</p>" * 100_000)
+
+    assert compress_file(str(path), ["gzip"]) == [f"{path}.gz"]
+    assert gzip.decompress(Path(f"{path}.gz").read_bytes()) == path.read_bytes()
+    assert compress_file(str(path), ["gzip"]) == []
+
+    os.utime(path, ns=(0, os.stat(f"{path}.gz").st_mtime_ns + 1))
+    assert compress_file(str(path), ["gzip"]) == [f"{path}.gz"]
+
+
+def test_main_compress(tmp_path: Path) -> None:
+    deck = tmp_path / "deck.py"
+    deck.write_text(
+        "from ludic_slides import Slide, Slides\n"
+        "from ludic_slides.components import Header\n"
+        "slides = Slides(Slide(Header('Hello')))\n"
+    )
+    main([str(deck), "--compress"])
+    html = tmp_path / "deck.html"
+    mtime = html.stat().st_mtime_ns
+
+    assert gzip.decompress(Path(f"{html}.gz").read_bytes()) == html.read_bytes()
+
+    main([str(deck), "--compress"])
+    assert html.stat().st_mtime_ns == mtime
+
+
+def test_main_compress_unavailable(tmp_path: Path) -> None:
+    if "br" in available_formats():
+        pytest.skip("brotli is installed")
+    with pytest.raises(SystemExit):
+        main([str(tmp_path / "deck.py"), "--compress", "gzip,br"])
@@ -0,0 +1,67 @@
+from ludic_slides import Slide, Slides
+from ludic_slides.components import Header
+from ludic_slides.css import optimize_css, optimize_stylesheets, used_names
+
+CSS = """
+/* comment */
+.slide  > .title,
+.unused { color: red; margin: 0 auto }
+.slide { color: blue; }
+.slide:not(.unused) { padding: 0; }
+@media (max-width: 10px) {
+  .unused { color: green; }
+  .slide { color: blue; }
+}
+.slide { color: blue; }
+"""
+
+
+def test_optimize_css() -> None:
+    assert optimize_css(CSS) == (
+        ".slide>.title,.unused{color:red;margin:0 auto}"
+        ".slide:not(.unused){padding:0}"
+        "@media (max-width: 10px){.unused{color:green}.slide{color:blue}}"
+        ".slide{color:blue}"
+    )
+
+
+def test_optimize_css_unused() -> None:
+    used = used_names(['<div class="slide"><h1 class="title"></h1></div>'])
+    assert optimize_css(CSS, used) == (
+        ".slide>.title{color:red;margin:0 auto}"
+        ".slide:not(.unused){padding:0}"
+        "@media (max-width: 10px){.slide{color:blue}}"
+        ".slide{color:blue}"
+    )
+
+
+def test_optimize_stylesheets() -> None:
+    slides = Slides(Slide(Header("First")))
+    head, *rest = optimize_stylesheets(slides.iter_html(), prune=False)
+
+    assert head.count("<style") == 1
+    assert "\n" not in head[head.index("<style") : head.index("</style>")]
+    assert "".join(rest) == "".join(list(slides.iter_html())[1:])
+
+
+def test_optimize_stylesheets_prune() -> None:
+    head = f"<html><head><style>{CSS}</style></head><body>"
+    # more than fits into memory, so the document is spooled to disk
+    body = ['<div class="sli', 'de">', "<p>text</p>" * 200_000, "</div></body></html>"]
+    head_out, *rest = optimize_stylesheets([head, *body])
+
+    assert head_out == (
+        "<html><head><style>.slide:not(.unused){padding:0}"
+        "@media (max-width: 10px){.slide{color:blue}}"
+        ".slide{color:blue}</style></head><body>"
+    )
+    assert "".join(rest) == "".join(body)
+
+
+def test_used_names_across_chunks() -> None:
+    assert used_names(['<div class="sli', 'de title">']) == {
+        "div",
+        "class",
+        "slide",
+        "title",
+    }
@@ -0,0 +1,60 @@
+import json
+from pathlib import Path
+
+from ludic_slides import Slides
+from ludic_slides.data import (
+    read_csv,
+    read_json_lines,
+    rows_per_slide,
+    table_slides,
+)
+from ludic_slides.layout import check_overflow
+from ludic_slides.themes import SlidesTheme
+
+
+def test_rows_per_slide() -> None:
+    rows = rows_per_slide(SlidesTheme())
+
+    assert rows > 1
+    assert rows_per_slide(SlidesTheme(), header=False) == rows + 1
+    assert rows_per_slide(SlidesTheme(aspect_ratio=(3, 4))) > rows
+
+
+def test_table_slides_from_csv(tmp_path: Path) -> None:
+    path = tmp_path / "data.csv"
+    path.write_text("id,name\n" + "".join(f"{i},row {i}\n" for i in range(7)))
+
+    pages = [
+        slide.to_html()
+        for slide in table_slides(read_csv(path), title="Data", per_slide=3)
+    ]
+
+    assert len(pages) == 3
+    assert all("<h1>Data</h1>" in page for page in pages)
+    assert all(page.count("<th>id</th>") == 1 for page in pages)
+    assert "row 0" in pages[0] and "row 3" not in pages[0]
+    assert "row 6" in pages[2]
+
+
+def test_table_slides_lazy_loaded() -> None:
+    rows = [[i] for i in range(5)]
+    slides = Slides(*table_slides(rows, title="Data", per_slide=2), lazy=True)
+
+    fragments = list(slides.render_slides())
+    assert len(fragments) == 3
+    assert all(f.startswith('<template class="slide-template">') for f in fragments)
+    assert len(check_overflow(slides)) == 3
+
+
+def test_table_slides_is_lazy(tmp_path: Path) -> None:
+    path = tmp_path / "data.jsonl"
+    path.write_text("\n".join(json.dumps([i, i * i]) for i in range(10)))
+    rows = read_json_lines(path)
+
+    pages = table_slides(rows, title="Squares", per_slide=4)
+    first = next(pages).to_html()
+
+    assert "<td>9</td>" in first
+    assert "<th>" not in first
+    assert next(rows) == [4, 16]
+    assert list(table_slides([], title="Empty")) == []
@@ -0,0 +1,77 @@
+from pathlib import Path
+
+from ludic_slides import Slide, Slides
+from ludic_slides.cli import main
+from ludic_slides.components import Header
+from ludic_slides.export import FILES_NAME, export_pages
+
+
+def test_export_pages(tmp_path: Path) -> None:
+    slides = Slides(
+        Slide(Header("First")),
+        Slide(Header("Second")),
+        Slide(Header("Third")),
+        title="Course",
+    )
+    assert export_pages(slides, tmp_path) == 3
+
+    files = sorted(path.name for path in tmp_path.iterdir())
+    assert files.pop(0) == FILES_NAME
+    assert files[:4] == ["001.html", "002.html", "003.html", "index.html"]
+    stylesheet, script = sorted(files[4:], key=lambda name: name.endswith(".js"))
+    assert stylesheet.endswith(".css")
+    assert script.endswith(".js")
+
+    second = (tmp_path / "002.html").read_text()
+    assert "Second" in second
+    assert "First" not in second
+    assert '<link rel="prev" href="001.html">' in second
+    assert '<link rel="next" href="003.html">' in second
+    assert f'href="{stylesheet}"' in second
+    assert f'src="{script}"' in second
+    assert "<style" not in second
+    assert "<title>Course (2/3)</title>" in second
+
+    index = (tmp_path / "index.html").read_text()
+    assert '<a href="003.html">Third</a>' in index
+
+
+def test_export_pages_unchanged(tmp_path: Path) -> None:
+    slides = Slides(Slide(Header("First")), Slide(Header("Second")))
+    export_pages(slides, tmp_path)
+    mtime = (tmp_path / "001.html").stat().st_mtime_ns
+
+    export_pages(Slides(Slide(Header("First")), Slide(Header("Changed"))), tmp_path)
+
+    assert (tmp_path / "001.html").stat().st_mtime_ns == mtime
+    assert "Changed" in (tmp_path / "002.html").read_text()
+
+
+def test_main_pages(tmp_path: Path) -> None:
+    deck = tmp_path / "course.py"
+    deck.write_text(
+        "from ludic_slides import Slide, Slides\n"
+        "from ludic_slides.components import Header\n"
+        "slides = Slides(Slide(Header('Hello')))\n"
+    )
+    main([str(deck), "--pages"])
+    assert "Hello" in (tmp_path / "course" / "001.html").read_text()
+
+
+def test_export_pages_removes_stale_files(tmp_path: Path) -> None:
+    export_pages(Slides(*(Slide(Header(str(n))) for n in range(3))), tmp_path)
+    old_files = {path.name for path in tmp_path.iterdir()}
+    # files which were not written by the export are kept
+    user_files = ["004.html", "slides.0123456789ab.css", "slides.css"]
+    for name in user_files:
+        (tmp_path / name).write_text("kept")
+
+    export_pages(Slides(Slide(Header("First")), presenter=True), tmp_path)
+
+    files = {path.name for path in tmp_path.iterdir()}
+    bundles = {name for name in files - set(user_files) if name.startswith("slides.")}
+    page = (tmp_path / "001.html").read_text()
+    assert bundles != {name for name in old_files if name.startswith("slides.")}
+    assert len(bundles) == 2
+    assert all(name in page for name in bundles)
+    assert files == {"001.html", "index.html", FILES_NAME, *bundles, *user_files}
@@ -0,0 +1,39 @@
+from pathlib import Path
+
+import pytest
+
+from ludic_slides.components import Code, CodeBlock
+from ludic_slides.highlight import HighlightCache, set_highlight_cache
+
+
+def test_highlight_cache(tmp_path: Path) -> None:
+    cache = HighlightCache(directory=tmp_path)
+    set_highlight_cache(cache)
+    try:
+        first = CodeBlock("x = 1", language="python").to_html()
+        assert first.startswith('<pre class="code-block">')
+        for _ in range(3):
+            assert CodeBlock("x = 1", language="python").to_html() == first
+        assert Code("x = 1").to_html() != first
+        assert (cache.hits, cache.misses) == (3, 1)
+
+        set_highlight_cache(HighlightCache(directory=tmp_path))
+        assert CodeBlock("x = 1", language="python").to_html() == first
+    finally:
+        set_highlight_cache(HighlightCache())
+
+
+def test_highlight_cache_key() -> None:
+    cache = HighlightCache()
+    python = CodeBlock("x = 1", language="python")
+    assert cache.key(python) == cache.key(CodeBlock("x = 1", language="python"))
+    assert cache.key(python) != cache.key(CodeBlock("x = 1", language="ruby"))
+    assert cache.key(python) != cache.key(CodeBlock("x = 2", language="python"))
+
+
+def test_highlight_cache_key_versions(monkeypatch: pytest.MonkeyPatch) -> None:
+    python = CodeBlock("x = 1", language="python")
+    key = HighlightCache().key(python)
+
+    monkeypatch.setattr("ludic_slides.highlight.package_versions", lambda: "new")
+    assert HighlightCache().key(python) != key
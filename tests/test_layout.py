@@ -0,0 +1,48 @@
+from ludic.styles.themes import Fonts
+from ludic.styles.types import SizeClamp
+from ludic_slides import Slide, Slides
+from ludic_slides.components import CodeBlock, Header, Item, List, Paragraph
+from ludic_slides.layout import SlideBox, check_overflow, scale_fragment
+from ludic_slides.themes import SlidesTheme
+
+
+def test_slide_box() -> None:
+    box = SlideBox.from_theme(SlidesTheme())
+
+    assert 0 < box.height < box.width
+    assert box.text_height("word") == box.font_size * 1.5
+    assert box.text_height("word " * 200) > 2 * box.text_height("word")
+
+
+def test_slide_box_clamped_size() -> None:
+    theme = SlidesTheme(fonts=Fonts(size=SizeClamp(0.1, 2, 3)))
+
+    assert SlideBox.from_theme(theme).font_size == 2
+
+
+def test_check_overflow() -> None:
+    code = "\n".join(f"print({i})" for i in range(60))
+    slides = Slides(
+        Slide(Header("Short"), Paragraph("Hello")),
+        Slide(Header("Code"), CodeBlock(code, language="python")),
+        Slide(Header("Items"), List(*(Item(f"item {i}") for i in range(30)))),
+    )
+
+    fits = check_overflow(slides, SlidesTheme())
+
+    assert [fit.title for fit in fits] == ["Short", "Code", "Items"]
+    assert [fit.overflows for fit in fits] == [False, True, True]
+    assert fits[0].scale == 1
+    assert 0.5 <= fits[1].scale < 1
+
+
+def test_autofit() -> None:
+    items = List(*(Item(f"item {i}") for i in range(15)))
+    slides = Slides(Slide(Header("Short")), Slide(Header("Items"), items))
+    slides.attrs["autofit"] = True
+
+    short, long = slides.render_slides()
+
+    assert "--slide-scale" not in short
+    assert long.startswith('<div style="--slide-scale: 0.')
+    assert scale_fragment(short, 1.0) == short
@@ -0,0 +1,95 @@
+import importlib.util
+import sys
+from collections.abc import Iterator
+from pathlib import Path
+
+import pytest
+
+from ludic_slides.loader import DeckLoader
+
+DECK = """
+import shared
+import utils
+
+def title():
+    return utils.shout(shared.TITLE)
+
+titles = [title() for _ in range(2)]
+"""
+
+
+@pytest.fixture
+def loader() -> Iterator[DeckLoader]:
+    modules = set(sys.modules)
+    yield DeckLoader()
+    for name in set(sys.modules) - modules:
+        del sys.modules[name]
+
+
+@pytest.fixture
+def deck(tmp_path: Path) -> Path:
+    (tmp_path / "shared.py").write_text("TITLE = 'hello'\n")
+    (tmp_path / "utils.py").write_text("def shout(text):\n    return text.upper()\n")
+    path = tmp_path / "presentation.py"
+    path.write_text(DECK)
+    return path
+
+
+def test_load(loader: DeckLoader, deck: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setattr(sys, "dont_write_bytecode", False)
+    path = list(sys.path)
+    module = loader.load(deck)
+
+    assert sys.modules[module.__name__] is module
+    assert module.__file__ == str(deck)
+    assert sys.path == path
+    assert module.titles == ["HELLO", "HELLO"]
+    assert loader._finder not in sys.meta_path
+    assert Path(
+        importlib.util.cache_from_source(str(deck), optimization="slides")
+    ).is_file()
+    assert loader.files() == sorted(
+        deck.parent / name for name in ("shared.py", "presentation.py", "utils.py")
+    )
+
+
+def test_reload_changed_modules(loader: DeckLoader, deck: Path) -> None:
+    loader.load(deck)
+    shared, utils = sys.modules["shared"], sys.modules["utils"]
+
+    (deck.parent / "shared.py").write_text("TITLE = 'changed'\n")
+    module = loader.load(deck)
+
+    assert module.titles == ["CHANGED", "CHANGED"]
+    assert sys.modules["shared"] is not shared
+    assert sys.modules["utils"] is utils
+
+
+def test_modules_of_other_directories_are_unloaded(
+    loader: DeckLoader, deck: Path, tmp_path: Path
+) -> None:
+    loader.load(deck)
+
+    other = tmp_path / "other"
+    other.mkdir()
+    (other / "shared.py").write_text("TITLE = 'other'\n")
+    (other / "presentation.py").write_text("from shared import TITLE\n")
+
+    assert loader.load(other / "presentation.py").TITLE == "other"
+    assert "utils" not in sys.modules
+
+
+def test_decks_do_not_collide(loader: DeckLoader, tmp_path: Path) -> None:
+    json = tmp_path / "json.py"
+    json.write_text("TITLE = 'first'\n")
+    other = tmp_path / "other"
+    other.mkdir()
+    (other / "json.py").write_text("TITLE = 'second'\n")
+
+    first = loader.load(json)
+    second = DeckLoader().load(other / "json.py")
+
+    assert first.__name__ != second.__name__
+    assert (first.TITLE, second.TITLE) == ("first", "second")
+    assert sys.modules[first.__name__] is first
+    assert sys.modules["json"].__file__ != str(json)
@@ -0,0 +1,73 @@
+from pathlib import Path
+
+import pytest
+
+from ludic_slides import Slide, Slides
+from ludic_slides.cli import main
+from ludic_slides.components import Header
+from ludic_slides.manifest import (
+    SlideEntry,
+    diff_manifests,
+    read_manifest,
+    record_slides,
+    slide_entry,
+)
+
+
+def entries(*titles: str) -> list[SlideEntry]:
+    return [
+        slide_entry(index, f"<h1>{title}</h1>")
+        for index, title in enumerate(titles, start=1)
+    ]
+
+
+def test_record_slides() -> None:
+    slides = Slides(Slide(Header("First")), Slide(Header("Second")))
+    recorded: list[SlideEntry] = []
+
+    html = "".join(record_slides(slides.iter_html(), recorded))
+
+    assert html == slides.to_html()
+    assert [(entry.index, entry.title) for entry in recorded] == [
+        (1, "First"),
+        (2, "Second"),
+    ]
+
+
+def test_diff_manifests() -> None:
+    old = entries("Intro", "A", "B", "C", "D", "Outro")
+    new = entries("Intro", "D", "A", "B2", "C", "New", "Outro")
+
+    diff = diff_manifests(old, new)
+
+    assert [(o.index, n.index) for o, n in diff.moved] == [(5, 2)]
+    assert [(o.title, n.title) for o, n in diff.changed] == [("B", "B2")]
+    assert [entry.title for entry in diff.added] == ["New"]
+    assert diff.removed == []
+    assert not diff_manifests(old, old)
+
+
+def test_diff_command(tmp_path: Path, capsys: pytest.CaptureFixture[str]) -> None:
+    deck = tmp_path / "deck.py"
+    deck.write_text(
+        "from ludic_slides import Slide, Slides\n"
+        "from ludic_slides.components import Header\n"
+        "slides = Slides(Slide(Header('One')), Slide(Header('Two')))\n"
+    )
+    main([str(deck), "--manifest", "-o", str(tmp_path / "old.html")])
+    deck.write_text(deck.read_text().replace("'Two'", "'Three'"))
+    main([str(deck), "--manifest", "-o", str(tmp_path / "new.html")])
+    assert len(read_manifest(tmp_path / "new.manifest.json")) == 2
+
+    capsys.readouterr()
+    main(
+        [
+            "diff",
+            str(tmp_path / "old.manifest.json"),
+            str(tmp_path / "new.manifest.json"),
+        ]
+    )
+    output = capsys.readouterr().out
+
+    assert "changed" in output
+    assert "Three" in output
@@ -0,0 +1,56 @@
+import multiprocessing
+import pickle
+from typing import Any
+
+from ludic_slides import Slide, Slides
+from ludic_slides.cache import RenderCache, set_render_cache
+from ludic_slides.components import CodeBlock, Header, Paragraph
+
+
+def create_slide(index: int) -> Slide:
+    return Slide(
+        Header(f"Slide {index}"),
+        Paragraph(f"Content of slide {index}"),
+        CodeBlock(f"x = {index}", language="python"),
+    )
+
+
+def create_slides(count: int) -> Slides:
+    return Slides(*(create_slide(index) for index in range(count)))
+
+
+def _unpickle_in_parent(text: str) -> "ParentOnly":
+    if multiprocessing.parent_process() is not None:
+        raise pickle.UnpicklingError("not available in workers")
+    return ParentOnly(text)
+
+
+class ParentOnly(Paragraph):
+    def __reduce__(self) -> tuple[Any, ...]:
+        return (_unpickle_in_parent, (self.text,))
+
+
+def test_render_parallel() -> None:
+    slides = create_slides(20)
+    assert "".join(slides.iter_html(jobs=3)) == slides.to_html()
+
+
+def test_render_parallel_with_cache() -> None:
+    slides = create_slides(10)
+    expected = list(slides.render_slides())
+
+    cache = RenderCache()
+    set_render_cache(cache)
+    try:
+        cache.render(create_slide(0))
+        assert list(slides.render_slides(jobs=2)) == expected
+        assert (cache.hits, cache.misses) == (1, 10)
+    finally:
+        set_render_cache(None)
+
+
+def test_render_parallel_fallback() -> None:
+    slides = Slides(
+        *(Slide(Header(f"Slide {index}"), ParentOnly("text")) for index in range(4))
+    )
+    assert list(slides.render_slides(jobs=2)) == list(slides.render_slides())
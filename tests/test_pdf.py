@@ -0,0 +1,49 @@
+import sys
+from pathlib import Path
+from typing import Any
+
+import pytest
+
+from ludic_slides import Slide, Slides
+from ludic_slides.components import Header
+from ludic_slides.pdf import write_pdf
+
+
+@pytest.fixture
+def weasyprint() -> Any:
+    try:
+        import weasyprint
+    except (ImportError, OSError) as e:
+        # OSError is raised if the system libraries (Pango) are missing
+        pytest.skip(f"WeasyPrint is not usable: {e}")
+    return weasyprint
+
+
+def test_write_pdf(
+    weasyprint: Any, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    pages: list[int] = []
+    write = weasyprint.Document.write_pdf
+
+    def count_pages(document: Any, *args: Any, **kwargs: Any) -> Any:
+        pages.append(len(document.pages))
+        return write(document, *args, **kwargs)
+
+    monkeypatch.setattr(weasyprint.Document, "write_pdf", count_pages)
+    slides = Slides(
+        Slide(Header("First")), Slide(Header("Second")), Slide(Header("Third"))
+    )
+    write_pdf(slides, tmp_path / "deck.pdf")
+
+    assert pages == [3]
+    assert (tmp_path / "deck.pdf").read_bytes().startswith(b"%PDF")
+
+
+def test_write_pdf_without_extra(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    monkeypatch.setitem(sys.modules, "weasyprint", None)
+
+    with pytest.raises(ImportError, match=r"install ludic-slides\[pdf\]"):
+        write_pdf(Slides(Slide(Header("First"))), tmp_path / "deck.pdf")
+    assert not (tmp_path / "deck.pdf").exists()
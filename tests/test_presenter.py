@@ -0,0 +1,45 @@
+from pathlib import Path
+
+from ludic_slides import Slide, SlideMain, Slides
+from ludic_slides.cli import main
+from ludic_slides.components import Header, Notes, Paragraph
+from ludic_slides.presenter import presenter_html, slide_notes
+
+SLIDES = Slides(
+    SlideMain(Header("Title"), Notes("Welcome everyone")),
+    Slide(Header("Content"), Paragraph("Visible"), Notes("Say </script>")),
+    Slide(Header("End")),
+)
+
+
+def test_notes_are_not_shown() -> None:
+    html = SLIDES.to_html()
+
+    assert "Visible" in html
+    assert "Welcome everyone" not in html
+    assert "slide-notes" not in html
+
+
+def test_presenter_html() -> None:
+    notes = slide_notes(SLIDES)
+    html = presenter_html(SLIDES, "deck.html")
+
+    assert "Welcome everyone" in notes[0]
+    assert notes[2] == ""
+    assert '"audience": "deck.html"' in html
+    assert "BroadcastChannel" in html
+    assert html.count("</script>") == 1
+
+
+def test_main_presenter(tmp_path: Path) -> None:
+    deck = tmp_path / "deck.py"
+    deck.write_text(
+        "from ludic_slides import Slide, Slides\n"
+        "from ludic_slides.components import Header, Notes\n"
+        "slides = Slides(Slide(Header('One'), Notes('Remember this')))\n"
+    )
+    main([str(deck), "--presenter"])
+
+    assert "Remember this" not in (tmp_path / "deck.html").read_text()
+    assert "BroadcastChannel" in (tmp_path / "deck.html").read_text()
+    assert "Remember this" in (tmp_path / "deck.presenter.html").read_text()
@@ -0,0 +1,47 @@
+import json
+from pathlib import Path
+
+import pytest
+
+from ludic_slides import Slide, Slides
+from ludic_slides.cli import main
+from ludic_slides.components import CodeBlock, Header
+from ludic_slides.highlight import HighlightCache, set_highlight_cache
+from ludic_slides.profiling import get_profile
+
+
+def test_slides_profile() -> None:
+    set_highlight_cache(HighlightCache())
+    slides = Slides(
+        Slide(Header("Intro")),
+        Slide(Header("Code"), CodeBlock("x = 1\n" * 50, language="python")),
+    )
+
+    profile = slides.profile()
+
+    assert get_profile() is None
+    assert [(slide.index, slide.title) for slide in profile.slides] == [
+        (1, "Intro"),
+        (2, "Code"),
+    ]
+    assert all(slide.size > 0 for slide in profile.slides)
+    assert {"styles", "render", "highlight"} <= set(profile.phases)
+    assert "Code" in profile.report()
+
+
+def test_main_profile(tmp_path: Path, capsys: pytest.CaptureFixture[str]) -> None:
+    deck = tmp_path / "deck.py"
+    deck.write_text(
+        "from ludic_slides import Slide, Slides\n"
+        "from ludic_slides.components import Header\n"
+        "slides = Slides(Slide(Header('Hello')), Slide(Header('World')))\n"
+    )
+    trace = tmp_path / "trace.json"
+
+    main([str(deck), "--profile", "--profile-output", str(trace), "--jobs", "2"])
+
+    output = capsys.readouterr().out
+    assert "Slowest slides (of 2):" in output
+    assert "load" in output
+    names = {event["name"] for event in json.loads(trace.read_text())["traceEvents"]}
+    assert {"load", "styles", "render", "write"} <= names
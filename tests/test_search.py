@@ -0,0 +1,56 @@
+import json
+from pathlib import Path
+
+from ludic_slides import Slide, Slides
+from ludic_slides.components import Header, Paragraph
+from ludic_slides.export import export_pages
+from ludic_slides.search import SearchIndex, tokenize
+
+
+def test_tokenize() -> None:
+    assert list(tokenize("Café, naïve_code 42!")) == ["cafe", "naive_code", "42"]
+
+
+def test_search_index() -> None:
+    index = SearchIndex()
+    index.add("<h1>Intro</h1><p>Rendering &amp; speed</p>")
+    index.add("<h1>Other</h1>")
+    index.add("<h1>Outro</h1><p>rendering</p><script>ignored()</script>")
+
+    data = json.loads(index.to_json())
+
+    assert data["titles"] == ["Intro", "Other", "Outro"]
+    assert data["words"]["rendering"] == [1, 2]
+    assert data["words"]["speed"] == [1]
+    assert "ignored" not in data["words"]
+
+
+def test_slides_search() -> None:
+    slides = Slides(
+        Slide(Header("First"), Paragraph("Content")),
+        Slide(Header("Second")),
+        search=True,
+    )
+    html = slides.to_html()
+
+    assert html == "".join(slides.iter_html())
+    assert html.count('id="slides-search-index"') == 1
+    assert '"second":[2]' in html
+
+
+def test_search_index_script() -> None:
+    index = SearchIndex()
+    index.add("<h1>&lt;/script&gt;</h1>")
+
+    data = index.script().removesuffix("</script>").split(">", 1)[1]
+    assert json.loads(data)["titles"] == ["</script>"]
+    assert "</" not in data
+
+
+def test_pages_without_search(tmp_path: Path) -> None:
+    slides = Slides(Slide(Header("First")), search=True)
+    export_pages(slides, tmp_path)
+
+    (script,) = tmp_path.glob("*.js")
+    assert "slides-search-index" not in (tmp_path / "001.html").read_text()
+    assert not script.read_text().lstrip().startswith("{")
@@ -0,0 +1,72 @@
+import json
+import threading
+from collections.abc import Iterator
+from pathlib import Path
+from urllib.error import HTTPError
+from urllib.request import urlopen
+
+import pytest
+
+from ludic_slides.server import SlidesServer
+
+DECK = """
+from ludic_slides import Slide, Slides
+from ludic_slides.components import Header
+from ludic.html import img
+
+slides = Slides(
+    Slide(Header("First"), img(src="image.png")),
+    Slide(Header("{}")),
+    title="Test",
+)
+"""
+
+
+@pytest.fixture
+def server(tmp_path: Path) -> Iterator[SlidesServer]:
+    deck = tmp_path / "deck.py"
+    deck.write_text(DECK.format("Second"))
+    server = SlidesServer(str(deck), port=0)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield server
+    server.shutdown()
+    server.server_close()
+
+
+def test_serve_page(server: SlidesServer) -> None:
+    with urlopen(server.url) as response:  # noqa: S310
+        content = response.read().decode()
+    assert "Second" in content
+    assert "EventSource" in content
+
+
+def test_serve_changed_slides(server: SlidesServer) -> None:
+    with urlopen(f"{server.url}events") as response:  # noqa: S310
+        Path(server.python_input_file).write_text(DECK.format("Changed"))
+        server.rebuild()
+
+        assert response.readline() == b"event: update\n"
+        data = json.loads(response.readline().removeprefix(b"data: "))
+
+    assert data["version"] == 2
+    assert data["count"] == 2
+    assert list(data["slides"]) == ["1"]
+    assert "Changed" in data["slides"]["1"]
+
+
+def test_serve_missed_version(server: SlidesServer) -> None:
+    Path(server.python_input_file).write_text(DECK.format("Changed"))
+    server.rebuild()
+
+    with urlopen(f"{server.url}events?v=1") as response:  # noqa: S310
+        assert response.readline() == b"event: update\n"
+
+
+def test_serve_referenced_files_only(server: SlidesServer) -> None:
+    Path(server.python_input_file).with_name("image.png").write_bytes(b"PNG")
+
+    with urlopen(f"{server.url}image.png") as response:  # noqa: S310
+        assert response.read() == b"PNG"
+    with pytest.raises(HTTPError, match="404"):
+        urlopen(f"{server.url}deck.py")  # noqa: S310
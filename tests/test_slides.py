@@ -1,5 +1,14 @@
+import shutil
+import subprocess
+from html.parser import HTMLParser
+from pathlib import Path
+
+import pytest
+
+from ludic import html
+from ludic.types import Safe
 from ludic_slides import Slide, SlideMain, Slides
-from ludic_slides.components import CodeBlock, Header, Paragraph
+from ludic_slides.components import CodeBlock, Header, Paragraph, RenderedSlide
 
 
 def test_generate_slides() -> None:
@@ -16,3 +25,142 @@ def test_generate_slides() -> None:
     )
 
     assert "The Ludic Framework" in slides.to_html()
+
+
+def test_slide_structure() -> None:
+    assert Slide(Header("First"), Paragraph("Text")).to_html() == (
+        '<div class="slide"><div class="slide-content slide-regular stack">'
+        "<h1>First</h1><p>Text</p></div></div>"
+    )
+
+
+def test_iter_html() -> None:
+    slides = Slides(
+        Slide(Header("First")),
+        Slide(Header("Second")),
+        title="Streaming",
+    )
+    head, first, second, tail = slides.iter_html()
+
+    assert "<title>Streaming</title>" in head
+    assert "First" in first
+    assert "Second" in second
+    assert "".join((head, first, second, tail)) == slides.to_html()
+
+
+def test_lazy_slides() -> None:
+    slides = Slides(Slide(Header("First")), Slide(Header("Second")), lazy=True)
+    _, first, second, _ = slides.iter_html()
+
+    assert first.startswith('<template class="slide-template">')
+    assert second.endswith("</template>")
+
+
+def test_lazy_rendered_slides() -> None:
+    rendered = Safe('<div class="slide">Rendered</div>')
+    _, fragment, _ = Slides(rendered, lazy=True).iter_html()
+
+    assert fragment == f'<template class="slide-template">{rendered}</template>'
+
+
+def test_optional_features() -> None:
+    html = Slides(Slide(Header("First"))).to_html()
+    for fragment in ("inflate", "BroadcastChannel", "loadSearch", ".slides-search{"):
+        assert fragment not in html.replace(" ", "")
+
+    html = Slides(
+        Slide(Header("First")), lazy=True, presenter=True, search=True
+    ).to_html()
+    for fragment in ("inflate", "BroadcastChannel", "loadSearch", ".slides-search{"):
+        assert fragment in html.replace(" ", "")
+
+
+class SlideNodes(HTMLParser):
+    """Collect the nodes of the slides the navigation script works with."""
+
+    VOID = {"br", "img", "link", "meta"}
+
+    def __init__(self) -> None:
+        super().__init__()
+        self.depth = 0
+        self.container: int | None = None
+        self.nodes: list[tuple[str, str]] = []
+        self.images: list[str] = []
+        self.scripts: list[str] = []
+        self._script = False
+
+    def handle_starttag(self, tag: str, attrs: list[tuple[str, str | None]]) -> None:
+        attributes = dict(attrs)
+        classes = attributes.get("class") or ""
+        if self.container is not None and self.depth == self.container:
+            self.nodes.append((tag, classes))
+        if tag == "img":
+            self.images.append(attributes.get("src") or "")
+        if tag in self.VOID:
+            return
+        self.depth += 1
+        # the root element has the class of the slideshow as well
+        if tag == "div" and classes == "slides":
+            self.container = self.depth
+        self._script = tag == "script" and attributes.get("type") == "text/javascript"
+
+    def handle_endtag(self, tag: str) -> None:
+        if self.depth == self.container:
+            self.container = None
+        self.depth -= 1
+        self._script = False
+
+    def handle_data(self, data: str) -> None:
+        if self._script:
+            self.scripts.append(data)
+
+
+def parse_slides(slides: Slides) -> SlideNodes:
+    parser = SlideNodes()
+    parser.feed(slides.to_html())
+    return parser
+
+
+def test_navigation_nodes() -> None:
+    slides: list[Slide | Safe] = [
+        Slide(Header("First"), Paragraph(html.img(src="first.png"))),
+        Slide(Header("Second")),
+        Safe('<div class="slide">Third</div>'),
+    ]
+
+    parser = parse_slides(Slides(*slides))
+    assert parser.nodes == [("div", "slide")] * 3
+
+    parser = parse_slides(Slides(*slides, lazy=True))
+    assert parser.nodes == [("template", "slide-template")] * 3
+    assert parser.images == ["first.png"]
+
+
+@pytest.mark.skipif(shutil.which("node") is None, reason="node is not installed")
+@pytest.mark.parametrize(
+    "attrs", [{}, {"lazy": True, "presenter": True, "search": True}]
+)
+def test_navigation_script(tmp_path: Path, attrs: dict[str, bool]) -> None:
+    (script,) = parse_slides(Slides(Slide(Header("First")), **attrs)).scripts
+    path = tmp_path / "slides.js"
+    path.write_text(script)
+
+    subprocess.run(["node", "--check", str(path)], check=True)  # noqa: S603, S607
+
+
+def test_compact_slides() -> None:
+    slides = Slides(Slide(Header("First")), Slide(Header("Second")), lazy=True)
+    compact = slides.compact()
+
+    assert all(isinstance(slide, RenderedSlide) for slide in compact.children)
+    assert compact.to_html() == slides.to_html()
+    assert compact.compact().to_html() == slides.to_html()
+
+
+def test_printable_slides() -> None:
+    slides = Slides(Slide(Header("First")), lazy=True, printable=True)
+    html = slides.to_html()
+
+    assert "size: 10in 7.5in" in html
+    assert "<script" not in html
+    assert "<template" not in html
@@ -0,0 +1,49 @@
+import subprocess
+import sys
+
+# generous budget for the cumulative import time of the command line interface,
+# importing ludic and pygments eagerly takes several times longer
+IMPORT_TIME_BUDGET_US = 200_000
+
+
+def import_times(code: str) -> dict[str, int]:
+    result = subprocess.run(  # noqa: S603
+        [sys.executable, "-X", "importtime", "-c", code],
+        capture_output=True,
+        check=True,
+        text=True,
+    )
+    times = {}
+    for line in result.stderr.splitlines():
+        if not line.startswith("import time:") or "cumulative" in line:
+            continue
+        _, cumulative, name = line.removeprefix("import time:").split("|")
+        times[name.strip()] = int(cumulative)
+    return times
+
+
+def test_cli_imports_lazily() -> None:
+    times = import_times("from ludic_slides.cli import main, create_parser")
+
+    heavy = [name for name in times if name.split(".")[0] in ("ludic", "pygments")]
+    assert heavy == []
+    assert times["ludic_slides.cli"] < IMPORT_TIME_BUDGET_US
+
+
+def test_components_import_on_access() -> None:
+    times = import_times(
+        "import ludic_slides\n"
+        "from ludic.styles.themes import get_default_theme\n"
+        "assert ludic_slides.Slides.__name__ == 'Slides'\n"
+        "assert get_default_theme().name == 'slide'"
+    )
+    assert "ludic_slides.components" in times
+
+
+def test_themes_set_default_theme() -> None:
+    times = import_times(
+        "import ludic_slides.themes\n"
+        "from ludic.styles.themes import get_default_theme\n"
+        "assert get_default_theme().name == 'slide'"
+    )
+    assert "ludic_slides.components" not in times
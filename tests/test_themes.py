@@ -0,0 +1,25 @@
+from ludic.styles.types import GlobalStyles
+from ludic_slides.themes import SlidesTheme, invalidate_styles, themed_styles
+
+
+def test_themed_styles() -> None:
+    calls: list[str] = []
+
+    @themed_styles
+    def styles(theme: SlidesTheme) -> GlobalStyles:
+        calls.append("theme" if theme is first else "other")
+        return {".slide": {"font-size": str(theme.fonts.size)}}
+
+    first, other = SlidesTheme(), SlidesTheme()
+    assert styles(first) is styles(first)
+    assert styles(other) == styles(first)
+    assert calls == ["theme", "other"]
+
+    invalidate_styles(first)
+    styles(first)
+    styles(other)
+    assert calls == ["theme", "other", "theme"]
+
+    invalidate_styles()
+    styles(other)
+    assert calls == ["theme", "other", "theme", "other"]
@@ -0,0 +1,21 @@
+import os
+from pathlib import Path
+
+import pytest
+
+from ludic_slides.watch import FileWatcher
+
+
+@pytest.mark.parametrize("use_inotify", [True, False])
+def test_file_watcher(tmp_path: Path, use_inotify: bool) -> None:
+    path = tmp_path / "deck.py"
+    path.write_text("a = 1")
+    watcher = FileWatcher([path], interval=0.01, use_inotify=use_inotify)
+    try:
+        assert watcher.wait(timeout=0.05) == set()
+
+        path.write_text("a = 22")
+        os.utime(path, ns=(0, 0))
+        assert watcher.wait(timeout=1) == {path.resolve()}
+    finally:
+        watcher.close()